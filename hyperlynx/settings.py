@@ -51,11 +51,12 @@ MIDDLEWARE = [
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'users.middleware.CachedAuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'social_django.middleware.SocialAuthExceptionMiddleware',
     'users.middleware.CompleteProfileMiddleware',
+    'tickets.middleware.JiraTimingMiddleware',
 ]
 
 ROOT_URLCONF = 'hyperlynx.urls'
@@ -89,6 +90,104 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Local memory by default; switch to a shared backend (e.g. Redis) so every
+# worker sees the same cached Jira data.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Sessions and logged-in users are only cached in a cache every worker
+# shares. With the per-process LocMemCache, a logout or profile change
+# handled by one worker would leave the others serving the old session and
+# user, so sessions then stay in the database and users aren't cached
+# (users.checks warns if either is pointed at a local cache).
+_SHARED_CACHE = CACHES['default']['BACKEND'] != 'django.core.cache.backends.locmem.LocMemCache'
+
+# Sessions are written through to the cache and the database, and read from
+# the cache (see users.auth for the matching user cache)
+SESSION_ENGINE = (
+    'django.contrib.sessions.backends.cached_db' if _SHARED_CACHE
+    else 'django.contrib.sessions.backends.db'
+)
+
+# Cache alias (None = don't cache) and lifetime (seconds) for logged-in users
+# resolved by users.middleware.CachedAuthenticationMiddleware
+USER_CACHE = 'default' if _SHARED_CACHE else None
+USER_CACHE_TTL = 5 * 60
+
+# Cache alias and lifetime (seconds) for Jira group membership used to
+# resolve dashboard roles (see tickets.roles)
+JIRA_ROLE_CACHE = 'default'
+JIRA_ROLE_CACHE_TTL = 60 * 60
+
+# Time zone Jira interprets JQL dates in (the sync user's profile setting),
+# and how far back each incremental sync re-reads to cover JQL's minute
+# resolution (see tickets.sync)
+JIRA_TIMEZONE = 'UTC'
+JIRA_SYNC_OVERLAP = 120
+
+# Shared secret Jira must present to /api/jira/webhook/; webhooks are
+# rejected while it is unset
+JIRA_WEBHOOK_SECRET = os.getenv('JIRA_WEBHOOK_SECRET')
+
+# Turns of a chat_api conversation replayed to Gemini; older turns are folded
+# into a summary (see tickets.chat). Idle conversations expire after
+# CHAT_SESSION_TTL seconds.
+CHAT_MAX_HISTORY = 20
+CHAT_SESSION_TTL = 24 * 60 * 60
+
+# Ticket creation jobs queued by the chat tools (see tickets.jobs): attempts
+# before a job fails, backoff in seconds (doubling per attempt, capped), and
+# how long a running job may go quiet before another worker takes it over
+TICKET_JOB_MAX_ATTEMPTS = 8
+TICKET_JOB_BACKOFF = 5
+TICKET_JOB_BACKOFF_CAP = 10 * 60
+TICKET_JOB_LEASE = 5 * 60
+
+# Summary similarity (0-1) at which a new ticket at the same rack as an open
+# one is treated as a likely duplicate (see tickets.dedup)
+TICKET_DUPLICATE_THRESHOLD = 0.45
+
+# Ticket change streams (see tickets.feed): seconds between checks of the
+# feed version (one check per process, however many streams are open),
+# between keep-alive comments, and before a stream ends so EventSource
+# reconnects
+TICKET_FEED_POLL_INTERVAL = 2
+TICKET_FEED_HEARTBEAT = 15
+TICKET_FEED_STREAM_TTL = 5 * 60
+
+
+# Logging
+# https://docs.djangoproject.com/en/5.2/topics/logging/
+# Warnings from the tickets app (e.g. failed chat summaries), and
+# per-request Jira call summaries from tickets.middleware, one JSON object
+# per line
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'tickets': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+        },
+        'tickets.middleware': {
+            'handlers': ['console'],
+            'level': os.getenv('JIRA_TIMING_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -24,5 +24,6 @@ urlpatterns = [
     path('', include('tickets.urls')),
     path('', include('social_django.urls', namespace='social')),
     path('logout/', views.logout_view, name='logout'),
-    path('auth/first-login-prompt/', views.first_login, name='first_login_prompt')
+    path('auth/first-login-prompt/', views.first_login, name='first_login_prompt'),
+    path('auth/jira-users/', views.jira_user_autocomplete, name='jira_user_autocomplete')
 ]
@@ -0,0 +1,39 @@
+from django.contrib import admin
+
+from tickets.models import ChatSession, JiraGroupMember, JiraUser, SyncState, Ticket, TicketJob
+
+
+@admin.register(Ticket)
+class TicketAdmin(admin.ModelAdmin):
+    list_display = ("key", "summary", "priority", "status", "assignee", "location", "updated")
+    list_filter = ("priority", "status_category", "project")
+    search_fields = ("key", "summary", "location")
+
+
+admin.site.register(SyncState)
+
+
+@admin.register(ChatSession)
+class ChatSessionAdmin(admin.ModelAdmin):
+    list_display = ("id", "user", "created", "updated")
+    readonly_fields = ("history", "summary")
+
+
+@admin.register(TicketJob)
+class TicketJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "status", "issue_key", "attempts", "run_after", "updated")
+    list_filter = ("status",)
+
+
+class JiraGroupMemberInline(admin.TabularInline):
+    model = JiraGroupMember
+    extra = 0
+
+
+@admin.register(JiraUser)
+class JiraUserAdmin(admin.ModelAdmin):
+    list_display = ("name", "display_name", "email", "active", "synced")
+    list_filter = ("active", "memberships__group")
+    search_fields = ("name", "display_name", "email")
+    readonly_fields = ("name_folded", "display_name_folded")
+    inlines = [JiraGroupMemberInline]
@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def _restore_search_index(using, **kwargs):
+    from django.db import connections
+
+    from tickets.search import restore_fts_triggers
+
+    restore_fts_triggers(connections[using])
 
 
 class TicketsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'tickets'
+
+    def ready(self):
+        post_migrate.connect(_restore_search_index, sender=self)
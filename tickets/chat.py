@@ -0,0 +1,103 @@
+import logging
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from tickets.models import ChatSession
+
+logger = logging.getLogger(__name__)
+
+# Asks Gemini to condense turns that no longer fit in a session's history
+SUMMARY_PROMPT = """
+Summarize this conversation between an engineer and the ticket master in a few sentences.
+Keep every ticket detail the engineer gave (location, summary, description, priority, labels)
+and anything that was already created, so the conversation can continue without the old messages.
+"""
+
+
+def get_session(session_id: Optional[str], user=None) -> ChatSession:
+    """
+    Load a chat session, or start a new one.
+
+    A new session is started if session_id is missing, unknown, expired or
+    belongs to another user, so a client can never read someone else's
+    conversation.
+    """
+    owner = user if user is not None and user.is_authenticated else None
+    if session_id:
+        cutoff = timezone.now() - timedelta(seconds=settings.CHAT_SESSION_TTL)
+        try:
+            return ChatSession.objects.get(pk=session_id, user=owner, updated__gte=cutoff)
+        except (ChatSession.DoesNotExist, ValidationError):
+            pass
+    # Starting conversations is rare enough to clean up old ones here
+    purge_expired_sessions()
+    return ChatSession.objects.create(user=owner)
+
+
+def serialize_history(contents: List[Any]) -> List[Dict[str, Any]]:
+    """Turn google.genai Content objects into JSON-safe dictionaries."""
+    return [content.model_dump(mode="json", exclude_none=True) for content in contents]
+
+
+def system_instruction(prompt: str, session: ChatSession) -> str:
+    """The system prompt, followed by the summary of any dropped turns."""
+    if not session.summary:
+        return prompt
+    return f"{prompt}\nSummary of the conversation so far:\n{session.summary}"
+
+
+def _starts_turn(content: Dict[str, Any]) -> bool:
+    # History may only restart at a message the user typed, not in the middle
+    # of a function call and its response
+    return content.get("role") == "user" and any("text" in part for part in content.get("parts", []))
+
+
+def compact_history(
+        session: ChatSession,
+        summarize: Callable[[List[Dict[str, Any]], str], str],
+        max_history: Optional[int] = None
+) -> None:
+    """
+    Keep a session's history within max_history turns.
+
+    Once history outgrows max_history, the oldest half is passed to
+    summarize(turns, previous_summary) and replaced by the summary it
+    returns, so Gemini is asked for a summary every few turns rather than on
+    every one. If summarizing fails the turns are simply dropped, so a
+    conversation never grows without bound.
+
+    Args:
+        session: Session to compact (not saved)
+        summarize: Callable returning a new summary covering the given turns
+        max_history: Turns to keep (defaults to settings.CHAT_MAX_HISTORY)
+    """
+    max_history = max_history or settings.CHAT_MAX_HISTORY
+    history = session.history
+    if len(history) <= max_history:
+        return
+
+    cut = len(history) - max_history // 2
+    while cut < len(history) and not _starts_turn(history[cut]):
+        cut += 1
+
+    try:
+        session.summary = summarize(history[:cut], session.summary)
+    except Exception as e:
+        logger.warning("Could not summarize chat %s: %s", session.id, e)
+    session.history = history[cut:]
+
+
+def purge_expired_sessions() -> int:
+    """
+    Delete sessions idle for longer than settings.CHAT_SESSION_TTL.
+
+    Returns:
+        Number of sessions deleted
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.CHAT_SESSION_TTL)
+    deleted, _ = ChatSession.objects.filter(updated__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,51 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Iterable, Tuple
+
+
+class InFlight:
+    """
+    Lets concurrent callers share fetches that are already under way.
+
+    A caller claims the keys it needs: keys nobody is fetching become its
+    own to fetch, and keys someone else is already fetching come back as
+    futures to wait on. Once the owner resolves its keys, every waiter gets
+    the same result (or exception) without another request to Jira.
+
+    The sync client uses concurrent.futures.Future; the async client passes
+    ``loop.create_future`` so waiters can be awaited.
+    """
+
+    def __init__(self, future_factory: Callable[[], Any] = Future):
+        self._future_factory = future_factory
+        self._pending: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def claim(self, keys: Iterable[Hashable]) -> Tuple[Dict[Hashable, Any], Dict[Hashable, Any]]:
+        """
+        Returns:
+            (owned, waiting): futures this caller must resolve, and futures
+            another caller is already resolving
+        """
+        owned, waiting = {}, {}
+        with self._lock:
+            for key in keys:
+                if key in self._pending:
+                    waiting[key] = self._pending[key]
+                else:
+                    owned[key] = self._pending[key] = self._future_factory()
+        return owned, waiting
+
+    def resolve(self, owned: Dict[Hashable, Any], results: Dict[Hashable, Any]) -> None:
+        """Publish results for owned keys; keys missing from results resolve to None."""
+        with self._lock:
+            for key, future in owned.items():
+                self._pending.pop(key, None)
+                future.set_result(results.get(key))
+
+    def fail(self, owned: Dict[Hashable, Any], error: BaseException) -> None:
+        """Pass an error on to everyone waiting for the owned keys."""
+        with self._lock:
+            for key, future in owned.items():
+                self._pending.pop(key, None)
+                future.set_exception(error)
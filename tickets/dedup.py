@@ -0,0 +1,90 @@
+import re
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from django.conf import settings
+
+from tickets.models import Ticket, TicketJob
+from tickets.tools import LOCATION_LEVELS, Location
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def shingles(text: str, size: int = 3) -> FrozenSet[str]:
+    """
+    Character n-grams of a summary, ignoring case and punctuation.
+
+    Character shingles still match when technicians word, abbreviate or
+    misspell the same failure a little differently ("PDU down" vs "pdu is down").
+    """
+    normalized = f" {_NON_WORD.sub(' ', text.lower()).strip()} "
+    if len(normalized) <= size:
+        return frozenset([normalized])
+    return frozenset(normalized[i:i + size] for i in range(len(normalized) - size + 1))
+
+
+def similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two shingle sets, from 0.0 to 1.0."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def find_duplicates(
+        location: str,
+        summary: str,
+        threshold: Optional[float] = None,
+        limit: int = 5
+) -> List[Dict[str, Any]]:
+    """
+    Find open tickets at the same rack whose summary looks like this one.
+
+    Only the local mirror and the queue of tickets still being created are
+    checked, never Jira, so this is cheap enough to run before every create.
+    Candidates, both tickets and queued jobs, come from location indexes,
+    which narrow them to one rack before any summaries are compared.
+
+    Args:
+        location: FLOOR:HALL:POD:AISLE:RACK of the new ticket
+        summary: Summary of the new ticket
+        threshold: Minimum similarity to count as a duplicate
+                   (defaults to settings.TICKET_DUPLICATE_THRESHOLD)
+        limit: Most duplicates to return
+
+    Returns:
+        Likely duplicates, most similar first. Each has a "score" and either
+        the existing ticket's "key" or the queued ticket's "job_id".
+
+    Example:
+        find_duplicates("1:3:B:4:12", "PDU tripped on rack 12")
+    """
+    parsed = Location.parse(location)
+    if parsed is None:
+        return []
+    threshold = settings.TICKET_DUPLICATE_THRESHOLD if threshold is None else threshold
+    wanted = shingles(summary)
+
+    duplicates = []
+    tickets = (
+        Ticket.objects.live()
+        .exclude(status_category="done")
+        .at_location(**{level: getattr(parsed, level) for level in LOCATION_LEVELS})
+        .values_list("key", "summary", "status")
+    )
+    for key, other, status in tickets:
+        score = similarity(wanted, shingles(other))
+        if score >= threshold:
+            duplicates.append({"key": key, "summary": other, "status": status, "score": round(score, 2)})
+
+    # Tickets reported moments ago may not have reached Jira yet
+    queued = TicketJob.objects.filter(
+        location=str(parsed), status__in=[TicketJob.PENDING, TicketJob.RUNNING]
+    ).values_list("pk", "payload", "status")
+    for job_id, payload, status in queued:
+        score = similarity(wanted, shingles(payload.get("summary", "")))
+        if score >= threshold:
+            duplicates.append({
+                "job_id": job_id, "summary": payload.get("summary", ""),
+                "status": status, "score": round(score, 2),
+            })
+
+    return sorted(duplicates, key=lambda duplicate: -duplicate["score"])[:limit]
@@ -0,0 +1,188 @@
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+
+import requests
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from tickets.jira import JiraClient, get_jira_client
+from tickets.models import JiraGroupMember, JiraUser, SyncState
+from tickets.roles import ROLE_GROUPS, get_role_resolver
+
+# Columns overwritten when a Jira account changes
+_UPDATE_COLUMNS = ["display_name", "email", "active", "name_folded", "display_name_folded", "synced"]
+
+# Seconds a username Jira doesn't know is remembered, so retried logins with
+# the same typo don't each cost a Jira call
+MISSING_USER_TTL = 60
+
+
+def _group_state(group_name: str) -> str:
+    return f"jira-group:{group_name}"
+
+
+def user_from_jira(data: Dict[str, Any]) -> JiraUser:
+    """Build an unsaved JiraUser from a Jira user dictionary."""
+    user = JiraUser(
+        name=data["name"],
+        display_name=data.get("displayName") or "",
+        email=data.get("emailAddress") or "",
+        active=data.get("active", True),
+        synced=timezone.now(),
+    )
+    user.fold()
+    return user
+
+
+def _changed(existing: JiraUser, fresh: JiraUser) -> bool:
+    return (existing.display_name, existing.email, existing.active) != (fresh.display_name, fresh.email, fresh.active)
+
+
+def _sync_group(client: JiraClient, group_name: str, users: Dict[str, JiraUser]) -> int:
+    """Replace the stored members of one group. Returns how many rows changed."""
+    wanted = {member["name"] for member in client.get_group_members(group_name)}
+    current = set(JiraGroupMember.objects.filter(group=group_name).values_list("user__name", flat=True))
+
+    added = [JiraGroupMember(group=group_name, user=users[name]) for name in wanted - current if name in users]
+    removed = current - wanted
+    with transaction.atomic():
+        JiraGroupMember.objects.bulk_create(added)
+        JiraGroupMember.objects.filter(group=group_name, user__name__in=removed).delete()
+        SyncState.objects.update_or_create(name=_group_state(group_name), defaults={"last_run": timezone.now()})
+    if added or removed:
+        get_role_resolver().invalidate(group_name)
+    return len(added) + len(removed)
+
+
+def sync_directory(client: Optional[JiraClient] = None, groups: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """
+    Refresh the local directory of Jira users and group memberships.
+
+    Jira can't list users changed since a date, so every account is read, but
+    only new and changed rows are written. Accounts that are no longer
+    returned are marked inactive rather than deleted.
+
+    Args:
+        client: JiraClient to use (defaults to the shared client)
+        groups: Groups whose membership is mirrored (default: the role groups
+                from tickets.roles)
+
+    Returns:
+        Counts of "created", "updated" and "deactivated" users and changed
+        "memberships"
+    """
+    client = client or get_jira_client()
+    groups = list(groups) if groups is not None else [group_name for group_name, _ in ROLE_GROUPS]
+    existing = {user.name: user for user in JiraUser.objects.all()}
+
+    created, updated, seen = [], [], set()
+    for data in client.iter_users():
+        fresh = user_from_jira(data)
+        seen.add(fresh.name)
+        current = existing.get(fresh.name)
+        if current is None:
+            created.append(fresh)
+        elif _changed(current, fresh):
+            fresh.pk = current.pk
+            updated.append(fresh)
+
+    gone = [name for name, user in existing.items() if user.active and name not in seen]
+    with transaction.atomic():
+        JiraUser.objects.bulk_create(created, batch_size=500)
+        JiraUser.objects.bulk_update(updated, _UPDATE_COLUMNS, batch_size=500)
+        JiraUser.objects.filter(name__in=gone).update(active=False, synced=timezone.now())
+        SyncState.objects.update_or_create(name="jira-directory", defaults={"last_run": timezone.now()})
+
+    users = {user.name: user for user in JiraUser.objects.filter(name__in=seen)}
+    memberships = sum(_sync_group(client, group_name, users) for group_name in groups)
+    return {"created": len(created), "updated": len(updated), "deactivated": len(gone), "memberships": memberships}
+
+
+def refresh_user(username: str, client: Optional[JiraClient] = None) -> Optional[JiraUser]:
+    """
+    Look a username up in Jira and store the result in the directory.
+
+    Returns:
+        The stored JiraUser, or None if Jira has no such user
+
+    Raises:
+        JiraUnavailableError, requests.exceptions.RequestException: If Jira
+        couldn't be asked
+    """
+    client = client or get_jira_client()
+    try:
+        data = client.get_user(username)
+    except requests.exceptions.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            return None
+        raise
+
+    fresh = user_from_jira(data)
+    JiraUser.objects.bulk_create(
+        [fresh], update_conflicts=True, unique_fields=["name"], update_fields=_UPDATE_COLUMNS
+    )
+    return JiraUser.objects.get(name=fresh.name)
+
+
+def find_user(username: str, client: Optional[JiraClient] = None) -> Optional[JiraUser]:
+    """
+    Find a Jira user by name, case-insensitively.
+
+    The local directory answers first. A name it doesn't have (e.g. an
+    account created since the last sync) is checked with Jira once, and a
+    miss there is remembered for MISSING_USER_TTL seconds.
+
+    Raises:
+        JiraUnavailableError, requests.exceptions.RequestException: If the
+        name isn't in the directory and Jira couldn't be asked
+    """
+    folded = username.strip().lower()
+    user = JiraUser.objects.filter(name_folded=folded).first()
+    if user is not None:
+        return user
+
+    missing_key = f"jira:missing-user:{folded}"
+    if cache.get(missing_key):
+        return None
+    user = refresh_user(username.strip(), client)
+    if user is None:
+        cache.set(missing_key, True, timeout=MISSING_USER_TTL)
+    return user
+
+
+def search_users(prefix: str, limit: int = 10) -> List[JiraUser]:
+    """
+    Active users whose username or display name starts with prefix.
+
+    Matches are range scans on the folded, indexed columns (prefix <= value <
+    prefix + U+FFFF), which stay fast where a case-insensitive LIKE can't use
+    an index.
+
+    Example:
+        >>> [user.name for user in search_users("ze")]
+        ['zeke']
+    """
+    folded = prefix.strip().lower()
+    if not folded:
+        return []
+    upper = folded + "\uffff"
+    matches = Q(name_folded__gte=folded, name_folded__lt=upper) | Q(
+        display_name_folded__gte=folded, display_name_folded__lt=upper
+    )
+    return list(JiraUser.objects.filter(matches, active=True).order_by("name_folded")[:limit])
+
+
+def group_members(group_name: str) -> Optional[FrozenSet[str]]:
+    """
+    Usernames in a group according to the directory.
+
+    Returns:
+        The members, or None if the group has never been synced (so callers
+        should ask Jira instead)
+    """
+    if not SyncState.objects.filter(name=_group_state(group_name), last_run__isnull=False).exists():
+        return None
+    return frozenset(
+        JiraGroupMember.objects.filter(group=group_name, user__active=True).values_list("user__name", flat=True)
+    )
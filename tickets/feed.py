@@ -0,0 +1,187 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q, QuerySet
+
+from tickets.api import API_FIELDS, DEFAULT_FIELDS, serialize_row
+from tickets.models import Ticket, TicketVersion
+
+# Longest batch of changes returned at once; the token then points mid-batch
+MAX_CHANGES = 500
+
+
+def next_version() -> int:
+    """
+    Claim the next feed version for the tickets about to be written.
+
+    Call this inside the transaction that writes them. Updating the counter
+    row locks it until commit, so writers take versions in commit order and
+    a reader never sees version N+1 before every row of version N.
+    """
+    with transaction.atomic():
+        if not TicketVersion.objects.filter(pk=1).update(value=F("value") + 1):
+            TicketVersion.objects.create(pk=1, value=1)
+        return TicketVersion.objects.values_list("value", flat=True).get(pk=1)
+
+
+def current_version() -> int:
+    """The newest committed feed version (0 before the first write)."""
+    return TicketVersion.objects.filter(pk=1).values_list("value", flat=True).first() or 0
+
+
+def encode_version(version: int, pk: Optional[int] = None) -> str:
+    """Version token: "<version>", or "<version>.<id>" partway through a version."""
+    return str(version) if pk is None else f"{version}.{pk}"
+
+
+def decode_version(token: Optional[str]) -> Tuple[int, Optional[int]]:
+    """
+    Read a token made by encode_version; an empty token means "from the start".
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    if not token:
+        return 0, None
+    version, _, pk = token.partition(".")
+    try:
+        return int(version), int(pk) if pk else None
+    except ValueError as e:
+        raise ValueError("Invalid version token") from e
+
+
+def ticket_changes(
+        queryset: QuerySet,
+        since: Optional[str] = None,
+        fields: Sequence[str] = DEFAULT_FIELDS,
+        limit: int = MAX_CHANGES
+) -> Dict[str, Any]:
+    """
+    Tickets written since a version token, for refreshing a list in place.
+
+    A changed ticket still in queryset comes back in "results"; one that
+    left it (closed, reassigned, deleted in Jira...) comes back as a key in
+    "removed". Clients apply both and keep the returned "version" for the
+    next call. Only the local mirror is read, never Jira.
+
+    Args:
+        queryset: The live tickets the client's list shows (already filtered)
+        since: The "version" from the previous call or from the first
+               ticket_list_api page
+        fields: Public field names to include in each row
+        limit: Most changed tickets returned at once
+
+    Returns:
+        Dictionary with "results", "removed", the next "version" and "more"
+        (True when another call would return further changes)
+
+    Raises:
+        ValueError: For an invalid token
+
+    Example:
+        first = ticket_changes(Ticket.objects.live().filter(assignee="zeke"))
+        later = ticket_changes(Ticket.objects.live().filter(assignee="zeke"), since=first["version"])
+    """
+    version, pk = decode_version(since)
+    limit = max(1, min(limit, MAX_CHANGES))
+    after = Q(version__gt=version) if pk is None else Q(version__gt=version) | Q(version=version, id__gt=pk)
+
+    # One snapshot for the counter and the rows, so the token covers exactly
+    # what was returned
+    with transaction.atomic():
+        latest = current_version()
+        changed: List[Dict[str, Any]] = list(
+            Ticket.objects.filter(after, version__lte=latest)
+            .order_by("version", "id")
+            .values("id", "key", "version")[:limit + 1]
+        )
+        more = len(changed) > limit
+        changed = changed[:limit]
+        columns = {API_FIELDS[name] for name in fields} | {"id"}
+        rows = {row["id"]: row for row in queryset.filter(pk__in=[c["id"] for c in changed]).values(*columns)}
+
+    if more:
+        token = encode_version(changed[-1]["version"], changed[-1]["id"])
+    else:
+        token = encode_version(latest)
+    return {
+        "results": [serialize_row(rows[c["id"]], fields) for c in changed if c["id"] in rows],
+        "removed": [c["key"] for c in changed if c["id"] not in rows],
+        "version": token,
+        "more": more,
+    }
+
+
+class VersionWatcher:
+    """
+    Tells waiting coroutines when the feed version moves.
+
+    However many change streams are open in a process, one task reads the
+    counter every interval while any of them is waiting, so a hundred open
+    dashboards cost one cheap query per interval (and no Jira calls at all).
+
+    Example:
+        version = await get_version_watcher().wait(after=41, timeout=15)
+        if version > 41:
+            ...  # fetch the changes with ticket_changes
+    """
+
+    def __init__(self, interval: float = 2.0):
+        self.interval = interval
+        self.version: Optional[int] = None
+        self._waiters = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._changed: Optional[asyncio.Condition] = None
+
+    async def wait(self, after: int, timeout: float) -> int:
+        """
+        Wait until the version passes after, or for timeout seconds.
+
+        Returns:
+            The newest version seen (which is <= after on timeout)
+        """
+        loop = asyncio.get_running_loop()
+        # No await until the waiter is counted, so the poller can't stop in between
+        self._waiters += 1
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._changed = asyncio.Condition()
+            self._task = loop.create_task(self._poll())
+
+        changed = self._changed
+        try:
+            async with changed:
+                await asyncio.wait_for(
+                    changed.wait_for(lambda: self.version is not None and self.version > after), timeout
+                )
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._waiters -= 1
+        return self.version if self.version is not None else after
+
+    async def _poll(self) -> None:
+        while True:
+            version = await sync_to_async(current_version)()
+            if version != self.version:
+                async with self._changed:
+                    self.version = version
+                    self._changed.notify_all()
+            await asyncio.sleep(self.interval)
+            if not self._waiters:
+                return
+
+
+_watcher: Optional[VersionWatcher] = None
+
+
+def get_version_watcher() -> VersionWatcher:
+    """Get the process-wide VersionWatcher configured from settings."""
+    global _watcher
+    if _watcher is None:
+        _watcher = VersionWatcher(interval=getattr(settings, "TICKET_FEED_POLL_INTERVAL", 2))
+    return _watcher
@@ -0,0 +1,42 @@
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
+
+# Model used by the ticket-master chat and its summaries
+GEMINI_MODEL = "gemini-2.5-flash"
+
+_client: Optional["genai.Client"] = None
+_client_lock = threading.Lock()
+
+
+def get_gemini_client() -> "genai.Client":
+    """
+    Get the process-wide Gemini client, creating it on first use.
+
+    google.genai takes around half a second to import, so it is only
+    imported here rather than when the URLconf loads; workers, management
+    commands and tests that never chat don't pay for it. The client is
+    thread-safe and shared by every request in the process.
+
+    Returns:
+        The shared genai.Client instance
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from google import genai
+
+                _client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+    return _client
+
+
+def content_config(**kwargs: Any) -> "types.GenerateContentConfig":
+    """Build a GenerateContentConfig without importing google.genai up front."""
+    from google.genai import types
+
+    return types.GenerateContentConfig(**kwargs)
@@ -0,0 +1,98 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, NamedTuple, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded mapping that evicts the least recently used
+    entry first and counts hits, misses and evictions.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """Get an entry and mark it recently used, or None if absent."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def record(self, hit: bool) -> None:
+        """Count a lookup as a hit or a miss."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Current counters, e.g. for logging or metrics."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class CachedResponse(NamedTuple):
+    """A raw JSON response body along with the validators needed to revalidate it."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content: bytes
+
+
+def conditional_headers(cached: Optional[CachedResponse]) -> Dict[str, str]:
+    """Headers that ask Jira to answer 304 if the cached copy is still current."""
+    headers = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
+def resolve_conditional(cache: LRUCache, key: Hashable, cached: Optional[CachedResponse], response) -> Any:
+    """
+    Turn the response to a conditional GET into a body, updating the cache.
+
+    Works with both requests and httpx responses. The cache keeps the raw
+    bytes and every call parses its own copy, so a caller changing the
+    returned dictionary can't alter what later 304s return.
+    """
+    if response.status_code == 304 and cached is not None:
+        cache.record(hit=True)
+        return json.loads(cached.content)
+
+    cache.record(hit=False)
+    body = response.json()
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    # Without a validator the copy could never be revalidated, so don't keep it
+    if etag or last_modified:
+        cache.put(key, CachedResponse(etag, last_modified, response.content))
+    return body
@@ -0,0 +1,221 @@
+import bisect
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Upper bounds (seconds) of the latency histogram buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Issue keys, numeric ids and project keys in a Jira path, replaced so each
+# endpoint is one metric series rather than one per issue
+_PATH_IDS = re.compile(r"(?<!/api)/(?:[A-Z][A-Z0-9_]*-\d+|\d+)(?=/|$)")
+_PROJECT_PATH = re.compile(r"(/project/)[^/]+")
+
+# Calls made while handling the current request; None outside of one
+_current_calls: ContextVar[Optional[List["JiraCall"]]] = ContextVar("jira_calls", default=None)
+
+
+def endpoint_label(endpoint: str) -> str:
+    """
+    Collapse a Jira API path into a low-cardinality label.
+
+    Example:
+        >>> endpoint_label("/rest/api/2/issue/DCM-42")
+        '/rest/api/2/issue/{id}'
+    """
+    endpoint = endpoint.split("?", 1)[0]
+    return _PROJECT_PATH.sub(r"\1{key}", _PATH_IDS.sub("/{id}", endpoint))
+
+
+class JiraCall:
+    """
+    One call made through JiraClient._request (or the async client), retries
+    included.
+
+    ``cache`` is "revalidated" when Jira answered 304 Not Modified, "stale"
+    when a stored response was served because Jira could not be reached, and
+    "miss" otherwise. ``status`` is None if no response was received.
+    """
+
+    __slots__ = ("method", "endpoint", "status", "attempts", "bytes", "cache", "started", "duration")
+
+    def __init__(self, method: str, endpoint: str):
+        self.method = method
+        self.endpoint = endpoint_label(endpoint)
+        self.status: Optional[int] = None
+        self.attempts = 0
+        self.bytes = 0
+        self.cache = "miss"
+        self.started = time.perf_counter()
+        self.duration = 0.0
+
+    def response(self, response) -> None:
+        """Note the response to the latest attempt (requests or httpx)."""
+        self.attempts += 1
+        self.status = response.status_code
+        self.bytes = len(response.content)
+        if response.status_code == 304:
+            self.cache = "revalidated"
+
+    def error(self) -> None:
+        """Note an attempt that failed before Jira answered."""
+        self.attempts += 1
+        self.status = None
+
+    def stale(self) -> None:
+        self.cache = "stale"
+
+    def as_dict(self) -> Dict:
+        return {
+            "method": self.method,
+            "endpoint": self.endpoint,
+            "status": self.status,
+            "attempts": self.attempts,
+            "bytes": self.bytes,
+            "cache": self.cache,
+            "ms": round(self.duration * 1000, 1),
+        }
+
+
+class Metrics:
+    """
+    Thread-safe counters and histograms rendered in the Prometheus text
+    format.
+
+    Values live in process memory, so each worker reports its own; scrape
+    every worker, or sum them in Prometheus.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DURATION_BUCKETS):
+        self.buckets = buckets
+        self._counters: Dict[Tuple[str, Tuple], float] = {}
+        self._histograms: Dict[Tuple[str, Tuple], List] = {}
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, kind: str, text: str) -> None:
+        self._help[name] = (kind, text)
+
+    def inc(self, name: str, labels: Dict[str, str], value: float = 1) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, labels: Dict[str, str], value: float) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                # Per-bucket counts (plus +Inf), then the sum of observations
+                histogram = self._histograms[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            histogram[0][bisect.bisect_left(self.buckets, value)] += 1
+            histogram[1] += value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render(self) -> str:
+        """The current values in the Prometheus text exposition format."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted((key, (list(counts), total)) for key, (counts, total) in self._histograms.items())
+
+        lines = []
+        described = set()
+
+        def header(name):
+            if name not in described and name in self._help:
+                kind, text = self._help[name]
+                lines.append(f"# HELP {name} {text}")
+                lines.append(f"# TYPE {name} {kind}")
+            described.add(name)
+
+        for (name, labels), value in counters:
+            header(name)
+            lines.append(f"{name}{_labels(labels)} {value:g}")
+        for (name, labels), (counts, total) in histograms:
+            header(name)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(f"{name}_bucket{_labels(labels + (('le', le),))} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {total:g}")
+            lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: Tuple) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+metrics = Metrics()
+metrics.describe("jira_requests_total", "counter", "Jira API calls by endpoint, status and cache result.")
+metrics.describe("jira_response_bytes_total", "counter", "Bytes received from the Jira API.")
+metrics.describe("jira_request_duration_seconds", "histogram", "Jira API call latency, retries included.")
+metrics.describe("view_requests_total", "counter", "Requests handled per view.")
+metrics.describe("view_jira_calls_total", "counter", "Jira API calls made while handling each view.")
+metrics.describe("view_jira_seconds_total", "counter", "Time spent waiting on Jira while handling each view.")
+metrics.describe("view_duration_seconds", "histogram", "Response time per view.")
+
+
+@contextmanager
+def record_jira_call(method: str, endpoint: str) -> Iterator[JiraCall]:
+    """
+    Time a Jira call and record it in the metrics and the current request.
+
+    Example:
+        with record_jira_call("GET", "/rest/api/2/myself") as call:
+            response = session.get(url)
+            call.response(response)
+    """
+    call = JiraCall(method, endpoint)
+    try:
+        yield call
+    finally:
+        call.duration = time.perf_counter() - call.started
+        status = str(call.status) if call.status is not None else "error"
+        metrics.inc("jira_requests_total", {
+            "method": method, "endpoint": call.endpoint, "status": status, "cache": call.cache
+        })
+        metrics.inc("jira_response_bytes_total", {"endpoint": call.endpoint}, call.bytes)
+        metrics.observe("jira_request_duration_seconds", {"endpoint": call.endpoint}, call.duration)
+        calls = _current_calls.get()
+        if calls is not None:
+            calls.append(call)
+
+
+@contextmanager
+def collect_jira_calls() -> Iterator[List[JiraCall]]:
+    """
+    Collect the Jira calls made inside the block, e.g. while handling a request.
+
+    The list is shared with tasks and sync_to_async threads started inside
+    the block, but not with plain threads, which don't inherit context.
+    """
+    calls: List[JiraCall] = []
+    token = _current_calls.set(calls)
+    try:
+        yield calls
+    finally:
+        _current_calls.reset(token)
+
+
+def record_view(view: str, duration: float, calls: List[JiraCall]) -> None:
+    """Add one handled request to the per-view metrics."""
+    labels = {"view": view}
+    metrics.inc("view_requests_total", labels)
+    metrics.inc("view_jira_calls_total", labels, len(calls))
+    metrics.inc("view_jira_seconds_total", labels, sum(call.duration for call in calls))
+    metrics.observe("view_duration_seconds", labels, duration)
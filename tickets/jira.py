@@ -1,12 +1,307 @@
+import asyncio
+import logging
 import os
-from typing import Optional, Dict, List, Any
+import re
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Any, Set, Tuple, Union, Iterator, AsyncIterator
+import httpx
 import requests
 from dotenv import load_dotenv
-
+from requests.adapters import HTTPAdapter
+
+from tickets.coalesce import InFlight
+from tickets.http_cache import LRUCache, conditional_headers, resolve_conditional
+from tickets.instrumentation import JiraCall, record_jira_call
+from tickets.resilience import (
+    RETRY_STATUSES,
+    CircuitBreaker,
+    JiraUnavailableError,
+    RetryPolicy,
+    TokenBucket,
+)
 from tickets.tools import Priority
 
+logger = logging.getLogger(__name__)
+
+# Most issues Jira accepts in one /rest/api/2/issue/bulk request
+BULK_CREATE_LIMIT = 50
+
+# Longest key list put in one JQL search, keeping GET URLs well under the
+# ~8 KB limit common to proxies once URL-encoded
+MAX_KEYS_JQL_LENGTH = 2000
+
+ISSUE_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
+
+# Fields fetched by the get_*_issues helpers unless the caller asks for more.
+# Jira always includes "id" and "key", so only "fields" entries are listed.
+DEFAULT_ISSUE_FIELDS = ["summary", "created", "priority", "status"]
+
+
+def _issue_payload(
+        project_key: str,
+        summary: str,
+        description: Optional[str],
+        priority: Optional[str],
+        assignee: Optional[str],
+        custom_fields: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Build the request body for creating an issue."""
+    fields = {
+        "project": {"key": project_key},
+        "summary": summary,
+        "issuetype": {"name": "Task"}
+    }
+
+    if description:
+        fields["description"] = description
+
+    if priority:
+        fields["priority"] = {"name": priority}
+
+    if assignee:
+        fields["assignee"] = {"name": assignee}
+
+    # Add custom fields
+    if custom_fields:
+        fields.update(custom_fields)
+
+    return {"fields": fields}
+
+
+def _bulk_chunks(issues: List[Dict[str, Any]], chunk_size: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Split create_issue keyword dicts into bulk request bodies with their offsets."""
+    chunk_size = min(chunk_size, BULK_CREATE_LIMIT)
+    for offset in range(0, len(issues), chunk_size):
+        chunk = issues[offset:offset + chunk_size]
+        yield offset, {"issueUpdates": [
+            _issue_payload(
+                issue["project_key"],
+                issue["summary"],
+                issue.get("description"),
+                issue.get("priority", "Medium"),
+                issue.get("assignee"),
+                issue.get("custom_fields")
+            ) for issue in chunk
+        ]}
+
+
+def _error_body(response) -> Dict[str, Any]:
+    """Parse a failed bulk response, which may still list per-issue errors."""
+    try:
+        body = response.json()
+    except ValueError:
+        body = {}
+    body.setdefault("errors", [])
+    body.setdefault("message", f"HTTP {response.status_code}: {response.text[:200]}")
+    return body
+
+
+def _merge_bulk_result(
+        result: Dict[str, List[Dict[str, Any]]],
+        offset: int,
+        size: int,
+        body: Dict[str, Any],
+        status: Optional[int]
+) -> None:
+    """
+    Add one bulk response to the running result.
+
+    Jira lists created issues in request order and identifies failures by
+    their position in the chunk, so created issues are matched up with the
+    positions that did not fail. Failures carry the response's HTTP status
+    (None if no response came back).
+    """
+    failed = {}
+    for error in body.get("errors", []):
+        failed[error.get("failedElementNumber")] = error.get("elementErrors", error)
+
+    created = iter(body.get("issues", []))
+    for position in range(size):
+        index = offset + position
+        if position in failed:
+            result["failed"].append({"index": index, "error": failed[position], "status": status})
+            continue
+        issue = next(created, None)
+        if issue is None:
+            # Nothing came back for this issue, e.g. the whole request failed
+            result["failed"].append({"index": index, "error": body.get("message", "Not created"), "status": status})
+        else:
+            result["created"].append({"index": index, "id": issue["id"], "key": issue["key"]})
+
+
+def _user_issues_jql(
+        username: Optional[str],
+        status: Optional[str],
+        project: Optional[str]
+) -> str:
+    """Build the JQL used by get_user_issues."""
+    if username is None:
+        jql = "assignee = currentUser()"
+    else:
+        jql = f"assignee = {username}"
+
+    if status:
+        jql += f" AND status = '{status}'"
+
+    if project:
+        jql += f" AND project = {project}"
+
+    return jql + " ORDER BY created DESC"
+
+
+def _all_issues_jql(project: Optional[str], order_by: str, order_direction: str) -> str:
+    """Build the JQL used by get_all_issues."""
+    if project:
+        jql = f"project = {project}"
+    else:
+        jql = "project is not EMPTY"
+
+    return jql + f" ORDER BY {order_by} {order_direction}"
+
+
+def _stale_key(method: str, endpoint: str, kwargs: Dict[str, Any]) -> Optional[str]:
+    """Key a GET by endpoint and query parameters for the stale-response cache."""
+    if method.upper() != "GET":
+        return None
+    return f"{endpoint}?{sorted((kwargs.get('params') or {}).items())}"
+
+
+def _issue_request(issue_key: str, fields: Optional[List[str]]) -> Tuple[str, Dict[str, str], str]:
+    """Endpoint, query parameters and cache key for fetching one issue."""
+    endpoint = f"/rest/api/2/issue/{issue_key}"
+    params = {"fields": ",".join(fields)} if fields else {}
+    return endpoint, params, _stale_key("GET", endpoint, {"params": params})
+
+
+def _in_flight_keys(issue_keys: List[str], fields: Optional[List[str]]) -> List[Tuple[str, Optional[str]]]:
+    """De-duplicated (key, fields) pairs, so fetches for different fields aren't shared."""
+    for key in issue_keys:
+        if not ISSUE_KEY_PATTERN.match(key):
+            raise ValueError(f"Invalid issue key {key!r}")
+    projection = ",".join(fields) if fields else None
+    return [(key, projection) for key in dict.fromkeys(issue_keys)]
+
+
+def _keys_jql_chunks(issue_keys: List[str]) -> Iterator[str]:
+    """Group issue keys into ``key in (...)`` queries that keep URLs short."""
+    chunk: List[str] = []
+    length = 0
+    for key in issue_keys:
+        if chunk and length + len(key) + 2 > MAX_KEYS_JQL_LENGTH:
+            yield f"key in ({', '.join(chunk)})"
+            chunk, length = [], 0
+        chunk.append(key)
+        length += len(key) + 2
+    if chunk:
+        yield f"key in ({', '.join(chunk)})"
+
+
+def _settings_from_env(env_file: str) -> Dict[str, Any]:
+    """Client constructor arguments from the JIRA_* environment variables."""
+    load_dotenv(env_file)
+
+    token = os.getenv("JIRA_TOKEN")
+    if not token:
+        raise ValueError("JIRA_TOKEN environment variable is required")
+
+    return {
+        "base_url": os.getenv("JIRA_URL", "https://jira.hyperlynx.us"),
+        "token": token,
+        "username": os.getenv("JIRA_USERNAME", "zeke"),
+        "pool_size": int(os.getenv("JIRA_POOL_SIZE", "10")),
+        "timeout": (3.05, float(os.getenv("JIRA_TIMEOUT", "15"))),
+        "retry_policy": RetryPolicy(max_retries=int(os.getenv("JIRA_MAX_RETRIES", "3"))),
+        "rate_limit": float(os.getenv("JIRA_RATE_LIMIT", "10")),
+    }
+
+
+def _is_outage(status: int) -> bool:
+    """Whether a response status means Jira itself is unhealthy."""
+    return status >= 500 or status == 429
+
+
+def _search_params(
+        jql: str,
+        start_at: int,
+        max_results: int,
+        fields: Optional[List[str]],
+        validate_query: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the query parameters for one page of /rest/api/2/search."""
+    params = {
+        "jql": jql,
+        "startAt": start_at,
+        "maxResults": max_results
+    }
+
+    if fields:
+        params["fields"] = ",".join(fields)
 
-class JiraClient:
+    if validate_query:
+        params["validateQuery"] = validate_query
+
+    return params
+
+
+def _page_size(page_size: int, limit: Optional[int], yielded: int) -> int:
+    """Size of the next page, shrunk so we never fetch past the caller's limit."""
+    if limit is None:
+        return page_size
+    return max(1, min(page_size, limit - yielded))
+
+
+def _has_more_pages(
+        page: Dict[str, Any],
+        issues: List[Dict[str, Any]],
+        next_start: int,
+        limit: Optional[int],
+        yielded: int
+) -> bool:
+    """Whether another page should be requested after this one."""
+    if not issues or next_start >= page.get('total', 0):
+        return False
+    return limit is None or yielded + len(issues) < limit
+
+
+def _unassigned_issues_jql(project: Optional[str]) -> str:
+    """Build the JQL used by get_unassigned_issues."""
+    jql = "assignee is EMPTY"
+
+    if project:
+        jql = f"project = {project} AND {jql}"
+
+    return jql + " ORDER BY priority DESC"
+
+
+class _ResilientClient:
+    """Retry, rate-limit and circuit-breaker state shared by both Jira clients."""
+
+    def _init_resilience(
+            self,
+            retry_policy: Optional[RetryPolicy],
+            rate_limit: Optional[float],
+            circuit_breaker: Optional[CircuitBreaker],
+            stale_cache_size: int
+    ) -> None:
+        self.retry_policy = retry_policy or RetryPolicy()
+        # Allow short bursts of twice the steady rate
+        self.rate_limiter = TokenBucket(rate_limit, rate_limit * 2) if rate_limit else None
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.stale_responses = LRUCache(stale_cache_size)
+
+    def _stale_or_raise(self, stale_key: Optional[str], error: Exception, call: JiraCall):
+        """Return the last good response for a GET, or raise error if there is none."""
+        stale = self.stale_responses.get(stale_key) if stale_key else None
+        if stale is None:
+            raise error
+        call.stale()
+        return stale
+
+
+class JiraClient(_ResilientClient):
     """
     A client for interacting with the Jira REST API.
 
@@ -18,9 +313,25 @@ class JiraClient:
 
         # Or load from environment
         client = JiraClient.from_env()
+
+    Each client owns a ``requests.Session`` whose connection pool is kept alive
+    between calls, so reuse one instance (see ``get_jira_client``) rather than
+    building a new one per request.
     """
 
-    def __init__(self, base_url: str, token: str, username: Optional[str] = None):
+    def __init__(
+            self,
+            base_url: str,
+            token: str,
+            username: Optional[str] = None,
+            pool_size: int = 10,
+            timeout: Union[float, Tuple[float, float]] = (3.05, 15),
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limit: Optional[float] = 10.0,
+            circuit_breaker: Optional[CircuitBreaker] = None,
+            stale_cache_size: int = 128,
+            response_cache_size: int = 256
+    ):
         """
         Initialize the Jira client.
 
@@ -28,10 +339,22 @@ class JiraClient:
             base_url: The base URL of your Jira instance (e.g., https://jira.hyperlynx.us)
             token: Personal Access Token or API token
             username: Optional username (only needed for Basic Auth with API tokens)
+            pool_size: Maximum number of keep-alive connections held open to Jira
+            timeout: Default request timeout in seconds, either a single value
+                     or a (connect, read) tuple
+            retry_policy: When to retry failed calls (default: RetryPolicy())
+            rate_limit: Maximum calls per second to Jira (None = unlimited)
+            circuit_breaker: Breaker that fails fast while Jira is down
+                             (default: CircuitBreaker())
+            stale_cache_size: Number of recent GET responses kept to serve
+                              while Jira is unavailable
+            response_cache_size: Number of issues kept for conditional
+                                 (ETag/Last-Modified) revalidation
         """
         self.base_url = base_url.rstrip('/')
         self.token = token
         self.username = username
+        self.timeout = timeout
 
         # Set up authentication headers
         self.headers = {
@@ -40,6 +363,21 @@ class JiraClient:
             "Accept": "application/json"
         }
 
+        # Long-lived session so TCP/TLS connections are reused between calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._init_resilience(retry_policy, rate_limit, circuit_breaker, stale_cache_size)
+        self.response_cache = LRUCache(response_cache_size)
+        self._in_flight = InFlight()
+
+    def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        self.session.close()
+
     @classmethod
     def from_env(cls, env_file: str = ".env") -> "JiraClient":
         """
@@ -49,6 +387,10 @@ class JiraClient:
             JIRA_URL: Base URL of Jira instance
             JIRA_TOKEN: Personal Access Token or API token
             JIRA_USERNAME: (Optional) Username for Basic Auth
+            JIRA_POOL_SIZE: (Optional) Keep-alive connection pool size
+            JIRA_TIMEOUT: (Optional) Default read timeout in seconds
+            JIRA_MAX_RETRIES: (Optional) Retries for failed calls
+            JIRA_RATE_LIMIT: (Optional) Maximum calls per second
 
         Args:
             env_file: Path to .env file
@@ -56,16 +398,7 @@ class JiraClient:
         Returns:
             JiraClient instance
         """
-        load_dotenv(env_file)
-
-        base_url = os.getenv("JIRA_URL", "https://jira.hyperlynx.us")
-        token = os.getenv("JIRA_TOKEN")
-        username = os.getenv("JIRA_USERNAME", "zeke")
-
-        if not token:
-            raise ValueError("JIRA_TOKEN environment variable is required")
-
-        return cls(base_url=base_url, token=token, username=username)
+        return cls(**_settings_from_env(env_file))
 
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """
@@ -74,17 +407,78 @@ class JiraClient:
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint (without base URL)
-            **kwargs: Additional arguments to pass to requests
+            **kwargs: Additional arguments to pass to requests, e.g. a
+                      per-call timeout
+
+        Calls are rate limited, retried according to retry_policy, and skipped
+        entirely while the circuit breaker is open. If a GET can't be
+        completed, the last good response for it is returned instead when
+        there is one.
 
         Returns:
             Response object
 
         Raises:
             requests.exceptions.RequestException: If the request fails
+            JiraUnavailableError: If the circuit breaker is open
         """
+        # Timed and counted per endpoint, see tickets.instrumentation
+        with record_jira_call(method, endpoint) as call:
+            return self._send(call, method, endpoint, **kwargs)
+
+    def _send(self, call: JiraCall, method: str, endpoint: str, **kwargs) -> requests.Response:
         url = f"{self.base_url}{endpoint}"
-        response = requests.request(method, url, headers=self.headers, **kwargs)
-        response.raise_for_status()
+        kwargs.setdefault("timeout", self.timeout)
+        stale_key = _stale_key(method, endpoint, kwargs)
+
+        if not self.circuit_breaker.allow():
+            return self._stale_or_raise(stale_key, JiraUnavailableError("Jira is unavailable"), call)
+
+        attempt = 0
+        error = None
+        try:
+            while True:
+                if self.rate_limiter:
+                    time.sleep(self.rate_limiter.reserve())
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    call.error()
+                    delay = self.retry_policy.delay(attempt, method)
+                    if delay is None:
+                        error = e
+                        break
+                else:
+                    call.response(response)
+                    delay = self.retry_policy.delay(
+                        attempt, method, response.status_code, response.headers.get("Retry-After")
+                    )
+                    if response.status_code not in RETRY_STATUSES or delay is None:
+                        break
+                time.sleep(delay)
+                attempt += 1
+        except BaseException:
+            # Any other error (e.g. ChunkedEncodingError) still counts against
+            # the breaker, or a half-open trial call would never finish
+            self.circuit_breaker.record_failure()
+            raise
+
+        if error is not None:
+            self.circuit_breaker.record_failure()
+            return self._stale_or_raise(stale_key, error, call)
+
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            if _is_outage(response.status_code):
+                self.circuit_breaker.record_failure()
+                return self._stale_or_raise(stale_key, e, call)
+            self.circuit_breaker.record_success()
+            raise
+
+        self.circuit_breaker.record_success()
+        if stale_key and response.status_code == 200:
+            self.stale_responses.put(stale_key, response)
         return response
 
     def get_current_user(self) -> Dict[str, Any]:
@@ -159,26 +553,9 @@ class JiraClient:
             )
             print(f"Created: {issue['key']}")
         """
-        fields = {
-            "project": {"key": project_key},
-            "summary": summary,
-            "issuetype": {"name": "Task"}
-        }
-
-        if description:
-            fields["description"] = description
-
-        if priority:
-            fields["priority"] = {"name": priority}
-
-        if assignee:
-            fields["assignee"] = {"name": assignee}
-
-        # Add custom fields
-        if custom_fields:
-            fields.update(custom_fields)
-
-        issue_data = {"fields": fields}
+        issue_data = _issue_payload(
+            project_key, summary, description, priority, assignee, custom_fields
+        )
 
         try:
             response = self._request("POST", "/rest/api/2/issue", json=issue_data)
@@ -189,21 +566,66 @@ class JiraClient:
             print(f"Response: {e.response.text}")  # This shows the actual error
             raise
 
+    def create_issues(
+            self,
+            issues: List[Dict[str, Any]],
+            chunk_size: int = BULK_CREATE_LIMIT
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Create many issues using Jira's bulk endpoint.
+
+        Issues are sent in chunks of up to chunk_size per request. A failed
+        issue, or even a whole failed chunk, is reported in the result
+        rather than stopping the rest of the batch.
+
+        Args:
+            issues: One dict per issue, holding the keyword arguments that
+                    create_issue takes (project_key and summary are required)
+            chunk_size: Issues per request (Jira accepts at most 50)
+
+        Returns:
+            Dictionary with "created" (index, id and key of each new issue)
+            and "failed" (index, error and HTTP status of each rejected one,
+            the status being None if Jira never answered), where index is
+            the issue's position in the issues argument
+
+        Example:
+            result = client.create_issues([
+                {"project_key": "DCM", "summary": "PDU down", "custom_fields": {"customfield_10200": f"1:3:B:4:{rack}"}}
+                for rack in range(1, 21)
+            ])
+            print(f"Created {len(result['created'])}, failed {len(result['failed'])}")
+        """
+        result = {"created": [], "failed": []}
+        for offset, payload in _bulk_chunks(issues, chunk_size):
+            try:
+                response = self._request("POST", "/rest/api/2/issue/bulk", json=payload)
+                status, body = response.status_code, response.json()
+            except requests.exceptions.HTTPError as e:
+                status, body = e.response.status_code, _error_body(e.response)
+            except (requests.exceptions.RequestException, JiraUnavailableError) as e:
+                status, body = None, {"errors": [], "message": str(e)}
+            _merge_bulk_result(result, offset, len(payload["issueUpdates"]), body, status)
+        return result
+
     def get_user_issues(
             self,
             username: Optional[str] = None,
-            max_results: int = 50,
+            max_results: Optional[int] = 50,
             status: Optional[str] = None,
-            project: Optional[str] = None
+            project: Optional[str] = None,
+            fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Get issues assigned to a specific user.
 
         Args:
             username: Username to get issues for (None = current user)
-            max_results: Maximum number of results to return
+            max_results: Maximum number of results to return (None = all)
             status: Optional status filter (e.g., "In Progress", "Done")
             project: Optional project key filter (e.g., "DCM")
+            fields: Fields to return (defaults to DEFAULT_ISSUE_FIELDS,
+                    pass ["*all"] for every field)
 
         Returns:
             List of issue dictionaries
@@ -214,47 +636,29 @@ class JiraClient:
             for issue in issues:
                 print(f"{issue['key']}: {issue['fields']['summary']}")
         """
-        # Build JQL query
-        if username is None:
-            jql = "assignee = currentUser()"
-        else:
-            jql = f"assignee = {username}"
-
-        if status:
-            jql += f" AND status = '{status}'"
-
-        if project:
-            jql += f" AND project = {project}"
-
-        jql += " ORDER BY created DESC"
-
-        response = self._request(
-            "GET",
-            "/rest/api/2/search",
-            params={
-                "jql": jql,
-                "maxResults": max_results
-            }
+        jql = _user_issues_jql(username, status, project)
+        return self.search_issues(
+            jql, max_results=max_results, fields=fields or DEFAULT_ISSUE_FIELDS
         )
 
-        results = response.json()
-        return results.get('issues', [])
-
     def get_all_issues(
             self,
             project: Optional[str] = None,
-            max_results: int = 100,
+            max_results: Optional[int] = 100,
             order_by: str = "created",
-            order_direction: str = "DESC"
+            order_direction: str = "DESC",
+            fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Get all issues, optionally filtered by project.
 
         Args:
             project: Optional project key to filter by (e.g., "DCM")
-            max_results: Maximum number of results to return
+            max_results: Maximum number of results to return (None = all)
             order_by: Field to sort by (e.g., "created", "updated", "priority")
             order_direction: Sort direction ("ASC" or "DESC")
+            fields: Fields to return (defaults to DEFAULT_ISSUE_FIELDS,
+                    pass ["*all"] for every field)
 
         Returns:
             List of issue dictionaries sorted by the specified field
@@ -265,33 +669,26 @@ class JiraClient:
 
             # Get all issues sorted by update date
             issues = client.get_all_issues(order_by="updated")
-        """
-        # Build JQL query
-        if project:
-            jql = f"project = {project}"
-        else:
-            jql = "project is not EMPTY"
-
-        jql += f" ORDER BY {order_by} {order_direction}"
 
-        response = self._request(
-            "GET",
-            "/rest/api/2/search",
-            params={
-                "jql": jql,
-                "maxResults": max_results
-            }
+            # Every DCM issue, however many pages that takes
+            issues = client.get_all_issues(project="DCM", max_results=None)
+        """
+        jql = _all_issues_jql(project, order_by, order_direction)
+        return self.search_issues(
+            jql, max_results=max_results, fields=fields or DEFAULT_ISSUE_FIELDS
         )
 
-        results = response.json()
-        return results.get('issues', [])
-
-    def get_issue(self, issue_key: str) -> Dict[str, Any]:
+    def get_issue(self, issue_key: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get a specific issue by its key.
 
+        Issues are revalidated with If-None-Match/If-Modified-Since, so an
+        unchanged issue costs a 304 instead of a full download. Hit and miss
+        counts are available from ``client.response_cache.stats()``.
+
         Args:
             issue_key: Issue key (e.g., "DCM-123")
+            fields: Optional list of fields to return (None = all)
 
         Returns:
             Dictionary containing issue information
@@ -300,8 +697,49 @@ class JiraClient:
             issue = client.get_issue("DCM-123")
             print(f"Status: {issue['fields']['status']['name']}")
         """
-        response = self._request("GET", f"/rest/api/2/issue/{issue_key}")
-        return response.json()
+        endpoint, params, key = _issue_request(issue_key, fields)
+        cached = self.response_cache.get(key)
+        response = self._request("GET", endpoint, params=params, headers=conditional_headers(cached))
+        return resolve_conditional(self.response_cache, key, cached, response)
+
+    def get_issues(self, issue_keys: List[str], fields: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several issues at once with ``key in (...)`` searches.
+
+        Keys are split into as few searches as the URL length allows. If
+        another thread is already fetching one of the keys (with the same
+        fields), this call waits for that fetch instead of repeating it.
+
+        Args:
+            issue_keys: Issue keys (e.g., ["DCM-1", "DCM-2"])
+            fields: Optional list of fields to return (None = all)
+
+        Returns:
+            Dictionary mapping each found issue key to its issue; keys that
+            don't exist are left out
+
+        Example:
+            issues = client.get_issues(["DCM-1", "DCM-2", "DCM-3"])
+            for key, issue in issues.items():
+                print(f"{key}: {issue['fields']['summary']}")
+        """
+        wanted = _in_flight_keys(issue_keys, fields)
+        projection = wanted[0][1] if wanted else None
+        owned, waiting = self._in_flight.claim(wanted)
+
+        found = {}
+        try:
+            for jql in _keys_jql_chunks([key for key, _ in owned]):
+                for issue in self.iter_issues(jql, fields=fields, validate_query="warn"):
+                    found[(issue["key"], projection)] = issue
+        except BaseException as e:
+            self._in_flight.fail(owned, e)
+            raise
+        self._in_flight.resolve(owned, found)
+
+        for key, future in waiting.items():
+            found[key] = future.result()
+        return {key: found[(key, f)] for key, f in wanted if found.get((key, f)) is not None}
 
     def update_issue(
             self,
@@ -331,19 +769,66 @@ class JiraClient:
             json={"fields": fields}
         )
 
-    def get_group_members(self, group_name: str) -> List[Dict[str, Any]]:
-        """Get all members of a group."""
-        response = self._request(
-            "GET",
-            "/rest/api/2/group/member",
-            params={"groupname": group_name}
-        )
-        return response.json().get('values', [])
+    def get_group_members(self, group_name: str, page_size: int = 50) -> List[Dict[str, Any]]:
+        """
+        Get all members of a group.
+
+        Args:
+            group_name: The Jira group, e.g. "Engineers"
+            page_size: Members requested per call (Jira caps this at 50)
+
+        Returns:
+            List of user dictionaries, one per member
+        """
+        members = []
+        while True:
+            response = self._request(
+                "GET",
+                "/rest/api/2/group/member",
+                params={"groupname": group_name, "startAt": len(members), "maxResults": page_size}
+            )
+            page = response.json()
+            members.extend(page.get('values', []))
+            if page.get('isLast', True) or not page.get('values'):
+                return members
+
+    def iter_users(self, page_size: int = 1000, include_inactive: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every user in the Jira user directory.
+
+        Uses Jira Server's user search, where the username "." matches
+        everyone. Pages are fetched one after another until a short page.
+
+        Args:
+            page_size: Users requested per call (Jira caps this at 1000)
+            include_inactive: Also return deactivated accounts
+
+        Example:
+            names = [user["name"] for user in client.iter_users()]
+        """
+        start_at = 0
+        while True:
+            response = self._request(
+                "GET",
+                "/rest/api/2/user/search",
+                params={
+                    "username": ".",
+                    "startAt": start_at,
+                    "maxResults": page_size,
+                    "includeInactive": str(include_inactive).lower(),
+                }
+            )
+            users = response.json()
+            yield from users
+            if len(users) < page_size:
+                return
+            start_at += len(users)
 
     def get_unassigned_issues(
             self,
             project: Optional[str] = None,
-            max_results: int = 2
+            max_results: int = 2,
+            fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Get unassigned issues sorted by priority (highest first).
@@ -351,6 +836,8 @@ class JiraClient:
         Args:
             project: Optional project key filter (e.g., "DCM")
             max_results: Number of issues to return (default: 2)
+            fields: Fields to return (defaults to DEFAULT_ISSUE_FIELDS,
+                    pass ["*all"] for every field)
 
         Returns:
             List of unassigned issues sorted by priority
@@ -366,14 +853,10 @@ class JiraClient:
                 print(f"{issue['key']}: {issue['fields']['summary']}")
                 print(f"Priority: {issue['fields']['priority']['name']}")
         """
-        jql = "assignee is EMPTY"
-
-        if project:
-            jql = f"project = {project} AND {jql}"
-
-        jql += " ORDER BY priority DESC"
-
-        return self.search_issues(jql, max_results=max_results)
+        jql = _unassigned_issues_jql(project)
+        return self.search_issues(
+            jql, max_results=max_results, fields=fields or DEFAULT_ISSUE_FIELDS
+        )
 
     def is_issue_done(self, issue_key: str) -> bool:
         """
@@ -389,7 +872,7 @@ class JiraClient:
             if client.is_issue_done("DCM-123"):
                 print("Task completed!")
         """
-        issue = self.get_issue(issue_key)
+        issue = self.get_issue(issue_key, fields=["status"])
         status_category = issue['fields']['status']['statusCategory']['key']
         return status_category == 'done'
 
@@ -409,7 +892,7 @@ class JiraClient:
     def search_issues(
             self,
             jql: str,
-            max_results: int = 50,
+            max_results: Optional[int] = 50,
             fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
@@ -417,7 +900,7 @@ class JiraClient:
 
         Args:
             jql: JQL query string
-            max_results: Maximum number of results
+            max_results: Maximum number of results (None = every match)
             fields: Optional list of fields to return
 
         Returns:
@@ -434,14 +917,592 @@ class JiraClient:
                 'updated >= -1w ORDER BY updated DESC'
             )
         """
-        params = {
-            "jql": jql,
-            "maxResults": max_results
-        }
+        return list(self.iter_issues(jql, fields=fields, limit=max_results))
+
+    def iter_issues(
+            self,
+            jql: str,
+            fields: Optional[List[str]] = None,
+            page_size: int = 100,
+            limit: Optional[int] = None,
+            prefetch: bool = False,
+            validate_query: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every issue matching a JQL query, one page at a time.
+
+        Follows Jira's startAt/total paging so results are never silently
+        truncated, while holding at most one page (two with prefetch) in memory.
+
+        Args:
+            jql: JQL query string
+            fields: Optional list of fields to return
+            page_size: Issues requested per page (Jira may cap this lower)
+            limit: Optional overall cap on the number of issues yielded
+            prefetch: Fetch the next page in a background thread while the
+                      caller works through the current one
+            validate_query: Optional Jira validateQuery mode; "warn" lets
+                            queries naming unknown issue keys still run
 
-        if fields:
-            params["fields"] = ",".join(fields)
+        Yields:
+            Issue dictionaries in the order Jira returns them
+
+        Example:
+            for issue in client.iter_issues("project = DCM", prefetch=True):
+                print(issue['key'])
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        start_at = 0
+        yielded = 0
 
+        try:
+            page = self._search_page(
+                jql, start_at, _page_size(page_size, limit, yielded), fields, validate_query
+            )
+            while True:
+                issues = page.get('issues', [])
+                next_start = start_at + len(issues)
+                if limit is not None:
+                    issues = issues[:limit - yielded]
+                more = _has_more_pages(page, issues, next_start, limit, yielded)
+
+                pending = None
+                if more and executor:
+                    pending = executor.submit(
+                        self._search_page, jql, next_start,
+                        _page_size(page_size, limit, yielded + len(issues)), fields, validate_query
+                    )
+
+                for issue in issues:
+                    yield issue
+                yielded += len(issues)
+
+                if not more:
+                    return
+                if pending:
+                    page = pending.result()
+                else:
+                    page = self._search_page(
+                        jql, next_start, _page_size(page_size, limit, yielded), fields, validate_query
+                    )
+                start_at = next_start
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _search_page(
+            self,
+            jql: str,
+            start_at: int,
+            max_results: int,
+            fields: Optional[List[str]] = None,
+            validate_query: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Fetch a single page of search results."""
+        params = _search_params(jql, start_at, max_results, fields, validate_query)
         response = self._request("GET", "/rest/api/2/search", params=params)
-        results = response.json()
-        return results.get('issues', [])
+        return response.json()
+
+
+class AsyncJiraClient(_ResilientClient):
+    """
+    An asyncio client for the Jira REST API.
+
+    Mirrors the JiraClient API, but every method is a coroutine so independent
+    calls can be awaited together, e.g. with ``asyncio.gather``.
+
+    Usage:
+        client = AsyncJiraClient.from_env()
+
+        engineers, issues = await asyncio.gather(
+            client.get_group_members("Engineers"),
+            client.get_user_issues(username="zeke")
+        )
+
+    An httpx.AsyncClient is bound to the event loop it was first used on, so
+    use ``get_async_jira_client`` to get the instance for the running loop.
+    """
+
+    def __init__(
+            self,
+            base_url: str,
+            token: str,
+            username: Optional[str] = None,
+            pool_size: int = 10,
+            timeout: Union[float, Tuple[float, float]] = (3.05, 15),
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limit: Optional[float] = 10.0,
+            circuit_breaker: Optional[CircuitBreaker] = None,
+            stale_cache_size: int = 128,
+            response_cache_size: int = 256
+    ):
+        """
+        Initialize the async Jira client.
+
+        Args:
+            base_url: The base URL of your Jira instance (e.g., https://jira.hyperlynx.us)
+            token: Personal Access Token or API token
+            username: Optional username (only needed for Basic Auth with API tokens)
+            pool_size: Maximum number of keep-alive connections held open to Jira
+            timeout: Default request timeout in seconds, either a single value
+                     or a (connect, read) tuple
+            retry_policy: When to retry failed calls (default: RetryPolicy())
+            rate_limit: Maximum calls per second to Jira (None = unlimited)
+            circuit_breaker: Breaker that fails fast while Jira is down
+                             (default: CircuitBreaker())
+            stale_cache_size: Number of recent GET responses kept to serve
+                              while Jira is unavailable
+            response_cache_size: Number of issues kept for conditional
+                                 (ETag/Last-Modified) revalidation
+        """
+        self.base_url = base_url.rstrip('/')
+        self.token = token
+        self.username = username
+
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        else:
+            self.timeout = httpx.Timeout(timeout)
+
+        self.session = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size
+            )
+        )
+
+        self._init_resilience(retry_policy, rate_limit, circuit_breaker, stale_cache_size)
+        self.response_cache = LRUCache(response_cache_size)
+        self._in_flight = InFlight(lambda: asyncio.get_running_loop().create_future())
+
+    async def close(self) -> None:
+        """Close the underlying client and release pooled connections."""
+        await self.session.aclose()
+
+    @classmethod
+    def from_env(cls, env_file: str = ".env") -> "AsyncJiraClient":
+        """
+        Create an AsyncJiraClient from environment variables.
+
+        Reads the same variables as JiraClient.from_env.
+        """
+        return cls(**_settings_from_env(env_file))
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """
+        Make an HTTP request to the Jira API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (without base URL)
+            **kwargs: Additional arguments to pass to httpx
+
+        Rate limiting, retries, the circuit breaker and stale fallbacks work
+        as in JiraClient._request.
+
+        Returns:
+            Response object
+
+        Raises:
+            httpx.HTTPError: If the request fails
+            JiraUnavailableError: If the circuit breaker is open
+        """
+        with record_jira_call(method, endpoint) as call:
+            return await self._send(call, method, endpoint, **kwargs)
+
+    async def _send(self, call: JiraCall, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        stale_key = _stale_key(method, endpoint, kwargs)
+
+        if not self.circuit_breaker.allow():
+            return self._stale_or_raise(stale_key, JiraUnavailableError("Jira is unavailable"), call)
+
+        attempt = 0
+        error = None
+        try:
+            while True:
+                if self.rate_limiter:
+                    await asyncio.sleep(self.rate_limiter.reserve())
+                try:
+                    response = await self.session.request(method, endpoint, **kwargs)
+                except (httpx.TransportError, httpx.TimeoutException) as e:
+                    call.error()
+                    delay = self.retry_policy.delay(attempt, method)
+                    if delay is None:
+                        error = e
+                        break
+                else:
+                    call.response(response)
+                    delay = self.retry_policy.delay(
+                        attempt, method, response.status_code, response.headers.get("Retry-After")
+                    )
+                    if response.status_code not in RETRY_STATUSES or delay is None:
+                        break
+                await asyncio.sleep(delay)
+                attempt += 1
+        except BaseException:
+            # Any other error (e.g. DecodingError, TooManyRedirects or a
+            # cancelled task) still counts against the breaker, or a
+            # half-open trial call would never finish
+            self.circuit_breaker.record_failure()
+            raise
+
+        if error is not None:
+            self.circuit_breaker.record_failure()
+            return self._stale_or_raise(stale_key, error, call)
+
+        try:
+            # Unlike requests, httpx also raises for 3xx, and 304 is expected here
+            if response.is_error:
+                response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if _is_outage(response.status_code):
+                self.circuit_breaker.record_failure()
+                return self._stale_or_raise(stale_key, e, call)
+            self.circuit_breaker.record_success()
+            raise
+
+        self.circuit_breaker.record_success()
+        if stale_key and response.status_code == 200:
+            self.stale_responses.put(stale_key, response)
+        return response
+
+    async def get_current_user(self) -> Dict[str, Any]:
+        """Get information about the currently authenticated user."""
+        response = await self._request("GET", "/rest/api/2/myself")
+        return response.json()
+
+    async def get_user(self, username: str) -> Dict[str, Any]:
+        """Get information about a specific user."""
+        response = await self._request(
+            "GET",
+            "/rest/api/2/user",
+            params={"username": username}
+        )
+        return response.json()
+
+    async def create_issue(
+            self,
+            project_key: str,
+            summary: str,
+            issue_type: str = "Task",
+            description: Optional[str] = None,
+            priority: str = "Medium",
+            assignee: Optional[str] = None,
+            custom_fields: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Create a new issue in Jira. See JiraClient.create_issue."""
+        issue_data = _issue_payload(
+            project_key, summary, description, priority, assignee, custom_fields
+        )
+
+        try:
+            response = await self._request("POST", "/rest/api/2/issue", json=issue_data)
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.warning("Could not create issue in %s: %s %s", project_key, e, e.response.text)
+            raise
+
+    async def create_issues(
+            self,
+            issues: List[Dict[str, Any]],
+            chunk_size: int = BULK_CREATE_LIMIT
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Create many issues using Jira's bulk endpoint. See JiraClient.create_issues."""
+        result = {"created": [], "failed": []}
+        for offset, payload in _bulk_chunks(issues, chunk_size):
+            try:
+                response = await self._request("POST", "/rest/api/2/issue/bulk", json=payload)
+                status, body = response.status_code, response.json()
+            except httpx.HTTPStatusError as e:
+                status, body = e.response.status_code, _error_body(e.response)
+            except (httpx.HTTPError, JiraUnavailableError) as e:
+                status, body = None, {"errors": [], "message": str(e)}
+            _merge_bulk_result(result, offset, len(payload["issueUpdates"]), body, status)
+        return result
+
+    async def get_user_issues(
+            self,
+            username: Optional[str] = None,
+            max_results: Optional[int] = 50,
+            status: Optional[str] = None,
+            project: Optional[str] = None,
+            fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get issues assigned to a specific user. See JiraClient.get_user_issues."""
+        jql = _user_issues_jql(username, status, project)
+        return await self.search_issues(
+            jql, max_results=max_results, fields=fields or DEFAULT_ISSUE_FIELDS
+        )
+
+    async def get_all_issues(
+            self,
+            project: Optional[str] = None,
+            max_results: Optional[int] = 100,
+            order_by: str = "created",
+            order_direction: str = "DESC",
+            fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get all issues, optionally filtered by project. See JiraClient.get_all_issues."""
+        jql = _all_issues_jql(project, order_by, order_direction)
+        return await self.search_issues(
+            jql, max_results=max_results, fields=fields or DEFAULT_ISSUE_FIELDS
+        )
+
+    async def get_issue(self, issue_key: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Get a specific issue by its key. See JiraClient.get_issue."""
+        endpoint, params, key = _issue_request(issue_key, fields)
+        cached = self.response_cache.get(key)
+        response = await self._request("GET", endpoint, params=params, headers=conditional_headers(cached))
+        return resolve_conditional(self.response_cache, key, cached, response)
+
+    async def get_issues(
+            self,
+            issue_keys: List[str],
+            fields: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get several issues at once. See JiraClient.get_issues."""
+        wanted = _in_flight_keys(issue_keys, fields)
+        projection = wanted[0][1] if wanted else None
+        owned, waiting = self._in_flight.claim(wanted)
+
+        found = {}
+        try:
+            for jql in _keys_jql_chunks([key for key, _ in owned]):
+                async for issue in self.iter_issues(jql, fields=fields, validate_query="warn"):
+                    found[(issue["key"], projection)] = issue
+        except BaseException as e:
+            self._in_flight.fail(owned, e)
+            raise
+        self._in_flight.resolve(owned, found)
+
+        for key, future in waiting.items():
+            found[key] = await future
+        return {key: found[(key, f)] for key, f in wanted if found.get((key, f)) is not None}
+
+    async def update_issue(
+            self,
+            issue_key: str,
+            fields: Dict[str, Any]
+    ) -> None:
+        """Update an existing issue. See JiraClient.update_issue."""
+        await self._request(
+            "PUT",
+            f"/rest/api/2/issue/{issue_key}",
+            json={"fields": fields}
+        )
+
+    async def get_group_members(self, group_name: str, page_size: int = 50) -> List[Dict[str, Any]]:
+        """Get all members of a group."""
+        members = []
+        while True:
+            response = await self._request(
+                "GET",
+                "/rest/api/2/group/member",
+                params={"groupname": group_name, "startAt": len(members), "maxResults": page_size}
+            )
+            page = response.json()
+            members.extend(page.get('values', []))
+            if page.get('isLast', True) or not page.get('values'):
+                return members
+
+    async def iter_users(
+            self,
+            page_size: int = 1000,
+            include_inactive: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every user in the Jira user directory. See JiraClient.iter_users."""
+        start_at = 0
+        while True:
+            response = await self._request(
+                "GET",
+                "/rest/api/2/user/search",
+                params={
+                    "username": ".",
+                    "startAt": start_at,
+                    "maxResults": page_size,
+                    "includeInactive": str(include_inactive).lower(),
+                }
+            )
+            users = response.json()
+            for user in users:
+                yield user
+            if len(users) < page_size:
+                return
+            start_at += len(users)
+
+    async def get_unassigned_issues(
+            self,
+            project: Optional[str] = None,
+            max_results: int = 2,
+            fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get unassigned issues sorted by priority (highest first)."""
+        jql = _unassigned_issues_jql(project)
+        return await self.search_issues(
+            jql, max_results=max_results, fields=fields or DEFAULT_ISSUE_FIELDS
+        )
+
+    async def is_issue_done(self, issue_key: str) -> bool:
+        """Check if an issue is in a "Done" status."""
+        issue = await self.get_issue(issue_key, fields=["status"])
+        status_category = issue['fields']['status']['statusCategory']['key']
+        return status_category == 'done'
+
+    async def get_project(self, project_key: str) -> Dict[str, Any]:
+        """Get information about a project."""
+        response = await self._request("GET", f"/rest/api/2/project/{project_key}")
+        return response.json()
+
+    async def search_issues(
+            self,
+            jql: str,
+            max_results: Optional[int] = 50,
+            fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Search for issues using JQL. See JiraClient.search_issues."""
+        return [issue async for issue in self.iter_issues(jql, fields=fields, limit=max_results)]
+
+    async def iter_issues(
+            self,
+            jql: str,
+            fields: Optional[List[str]] = None,
+            page_size: int = 100,
+            limit: Optional[int] = None,
+            prefetch: bool = False,
+            validate_query: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream every issue matching a JQL query. See JiraClient.iter_issues.
+
+        With prefetch, the next page is requested as a task while the caller
+        consumes the current one.
+        """
+        start_at = 0
+        yielded = 0
+        pending = None
+
+        try:
+            page = await self._search_page(
+                jql, start_at, _page_size(page_size, limit, yielded), fields, validate_query
+            )
+            while True:
+                issues = page.get('issues', [])
+                next_start = start_at + len(issues)
+                if limit is not None:
+                    issues = issues[:limit - yielded]
+                more = _has_more_pages(page, issues, next_start, limit, yielded)
+
+                if more and prefetch:
+                    pending = asyncio.ensure_future(self._search_page(
+                        jql, next_start, _page_size(page_size, limit, yielded + len(issues)),
+                        fields, validate_query
+                    ))
+
+                for issue in issues:
+                    yield issue
+                yielded += len(issues)
+
+                if not more:
+                    return
+                if pending:
+                    page = await pending
+                    pending = None
+                else:
+                    page = await self._search_page(
+                        jql, next_start, _page_size(page_size, limit, yielded), fields, validate_query
+                    )
+                start_at = next_start
+        finally:
+            if pending:
+                pending.cancel()
+
+    async def _search_page(
+            self,
+            jql: str,
+            start_at: int,
+            max_results: int,
+            fields: Optional[List[str]] = None,
+            validate_query: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Fetch a single page of search results."""
+        params = _search_params(jql, start_at, max_results, fields, validate_query)
+        response = await self._request("GET", "/rest/api/2/search", params=params)
+        return response.json()
+
+
+_client: Optional[JiraClient] = None
+_client_lock = threading.Lock()
+
+
+def get_jira_client() -> JiraClient:
+    """
+    Get the process-wide JiraClient, creating it on first use.
+
+    Every view in a worker shares this instance so its connection pool stays
+    warm. Configuration is read from the environment (see JiraClient.from_env).
+
+    Returns:
+        The shared JiraClient instance
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = JiraClient.from_env()
+    return _client
+
+
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncJiraClient]" = (
+    weakref.WeakKeyDictionary()
+)
+# Tasks that close each loop's client (a loop only keeps weak references to its tasks)
+_async_closers: Set[asyncio.Task] = set()
+# Failure and caching state shared by every loop's client; all of it is thread-safe
+_SHARED_ASYNC_STATE = ("rate_limiter", "circuit_breaker", "stale_responses", "response_cache")
+_async_state: Dict[str, Any] = {}
+
+
+def get_async_jira_client() -> AsyncJiraClient:
+    """
+    Get the AsyncJiraClient for the running event loop, creating it on first use.
+
+    Under ASGI there is one loop per worker, so this behaves like
+    get_jira_client. Under WSGI each async view may run on a fresh loop; the
+    client's connections are then closed when that loop shuts down, but its
+    rate limiter, circuit breaker and caches are shared with the clients of
+    every other loop, so they still work across requests.
+
+    Returns:
+        The AsyncJiraClient bound to the current event loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = AsyncJiraClient.from_env()
+        for name in _SHARED_ASYNC_STATE:
+            setattr(client, name, _async_state.setdefault(name, getattr(client, name)))
+        _async_clients[loop] = client
+        _async_closers.add(loop.create_task(_close_with_loop(loop, client)))
+    return client
+
+
+async def _close_with_loop(loop: asyncio.AbstractEventLoop, client: AsyncJiraClient) -> None:
+    # asyncio.run() cancels leftover tasks before closing its loop, so this
+    # wakes up (and closes the client) exactly when the loop goes away
+    try:
+        await loop.create_future()
+    finally:
+        _async_closers.discard(asyncio.current_task())
+        if _async_clients.get(loop) is client:
+            del _async_clients[loop]
+        await client.close()
@@ -0,0 +1,204 @@
+import random
+from contextvars import ContextVar
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+import requests
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from tickets.jira import BULK_CREATE_LIMIT, JiraClient, get_jira_client
+from tickets.models import ChatSession, TicketJob
+from tickets.sync import LOCATION_FIELD
+from tickets.tools import Location
+
+# Chat session whose Gemini tool calls are running, so queued jobs can be
+# reported back to it (set by the chat views)
+current_chat_session: ContextVar[Optional[ChatSession]] = ContextVar("current_chat_session", default=None)
+
+
+def job_label(job: TicketJob) -> str:
+    """Jira label tagging the issue a job created, so a retry can find it."""
+    return f"hyperlynx-job-{job.pk}"
+
+
+def enqueue_ticket(**issue) -> TicketJob:
+    """
+    Queue a Jira issue for creation instead of creating it inline.
+
+    Args:
+        **issue: Keyword arguments for JiraClient.create_issue
+
+    Returns:
+        The queued job
+
+    Example:
+        job = enqueue_ticket(project_key="DCM", summary="PDU down", priority="High")
+    """
+    location = Location.parse((issue.get("custom_fields") or {}).get(LOCATION_FIELD))
+    return TicketJob.objects.create(
+        payload=issue, location=str(location) if location else "", chat_session=current_chat_session.get()
+    )
+
+
+def job_status(job: TicketJob) -> Dict[str, Any]:
+    """What the chat UI is told about a job."""
+    return {
+        "id": job.pk,
+        "status": job.status,
+        "key": job.issue_key or None,
+        "summary": job.payload.get("summary", ""),
+        "error": job.error or None,
+    }
+
+
+def _backoff(attempts: int) -> timedelta:
+    # Jittered so jobs that failed together don't all retry together
+    ceiling = min(settings.TICKET_JOB_BACKOFF_CAP, settings.TICKET_JOB_BACKOFF * 2 ** (attempts - 1))
+    return timedelta(seconds=random.uniform(ceiling / 2, ceiling))
+
+
+def _is_permanent_status(status: Optional[int]) -> bool:
+    """Whether a failed response's status means retrying can't help."""
+    return status is not None and 400 <= status < 500 and status not in (408, 429)
+
+
+def _is_permanent(error: Exception) -> bool:
+    """Whether retrying can't help, e.g. Jira rejected the issue's fields."""
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return _is_permanent_status(error.response.status_code)
+    return False
+
+
+def claim_jobs(limit: int = 10) -> List[TicketJob]:
+    """
+    Take up to limit jobs that are due, marking them running.
+
+    Running jobs whose worker has gone quiet for TICKET_JOB_LEASE seconds
+    are taken over. Each claim is a conditional UPDATE, so two workers can
+    never run the same job at once, on any database backend.
+    """
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.TICKET_JOB_LEASE)
+    due = TicketJob.objects.filter(
+        Q(status=TicketJob.PENDING, run_after__lte=now) | Q(status=TicketJob.RUNNING, updated__lt=stale)
+    ).order_by("run_after")
+
+    claimed = []
+    for job in due[:limit]:
+        won = TicketJob.objects.filter(pk=job.pk, status=job.status, updated=job.updated).update(
+            status=TicketJob.RUNNING, updated=now
+        )
+        if won:
+            job.status, job.updated = TicketJob.RUNNING, now
+            claimed.append(job)
+    return claimed
+
+
+def _existing_issue_keys(client: JiraClient, jobs: List[TicketJob]) -> Dict[int, str]:
+    """Issues earlier attempts created before failing to hear back, by job id."""
+    if not jobs:
+        return {}
+    labels = {job_label(job): job.pk for job in jobs}
+    quoted = ", ".join(f'"{label}"' for label in labels)
+    keys = {}
+    for issue in client.iter_issues(f"labels in ({quoted})", fields=["labels"]):
+        for label in issue["fields"].get("labels") or []:
+            if label in labels:
+                keys[labels[label]] = issue["key"]
+    return keys
+
+
+def _issue_arguments(job: TicketJob) -> Dict[str, Any]:
+    """create_issue keyword arguments for a job, tagged with its job_label."""
+    issue = dict(job.payload)
+    custom_fields = dict(issue.pop("custom_fields", None) or {})
+    custom_fields["labels"] = [*custom_fields.get("labels", []), job_label(job)]
+    return {**issue, "custom_fields": custom_fields}
+
+
+def _bulk_error(error: Any) -> str:
+    """Readable text for an entry in create_issues' "failed" list."""
+    if isinstance(error, dict):
+        field_errors = [f"{field}: {message}" for field, message in (error.get("errors") or {}).items()]
+        return "; ".join([*error.get("errorMessages", []), *field_errors]) or str(error)
+    return str(error)
+
+
+def _finish(job: TicketJob, key: str) -> None:
+    job.status, job.issue_key, job.error = TicketJob.DONE, key, ""
+
+
+def _retry_or_fail(job: TicketJob, error: str, permanent: bool) -> None:
+    job.error = error
+    if permanent or job.attempts >= settings.TICKET_JOB_MAX_ATTEMPTS:
+        job.status = TicketJob.FAILED
+    else:
+        job.status = TicketJob.PENDING
+        job.run_after = timezone.now() + _backoff(job.attempts)
+
+
+def _create_issues(client: JiraClient, jobs: List[TicketJob]) -> None:
+    keys = _existing_issue_keys(client, [job for job in jobs if job.attempts > 1])
+    for job in jobs:
+        if job.pk in keys:
+            _finish(job, keys[job.pk])
+
+    new = [job for job in jobs if job.pk not in keys]
+    if not new:
+        return
+    result = client.create_issues([_issue_arguments(job) for job in new])
+    for created in result["created"]:
+        _finish(new[created["index"]], created["key"])
+    for failed in result["failed"]:
+        # Per-issue errors mean Jira rejected that issue's fields; a bare
+        # message means the whole request failed, for good on a 4xx (bad
+        # request, revoked token) but a timeout, 5xx, 429 or open breaker
+        # may work later
+        error = failed["error"]
+        permanent = isinstance(error, dict) or _is_permanent_status(failed["status"])
+        _retry_or_fail(new[failed["index"]], _bulk_error(error), permanent=permanent)
+
+
+def run_jobs(jobs: List[TicketJob], client: Optional[JiraClient] = None) -> None:
+    """
+    Create the issues for claimed jobs and record the outcomes.
+
+    New issues are sent to Jira's bulk endpoint together (see
+    JiraClient.create_issues), so a burst of reports costs one request per
+    BULK_CREATE_LIMIT jobs. Retried jobs are first looked up by their label
+    in one search, in case an earlier attempt created the issue.
+
+    Transient failures (timeouts, 5xx, 429, an open circuit breaker) put a
+    job back in the queue with exponential backoff; Jira rejecting the issue
+    or running out of attempts marks it failed. Any other error is recorded
+    the same way, so a job is never left running to be taken over forever.
+    """
+    client = client or get_jira_client()
+    for job in jobs:
+        job.attempts += 1
+    try:
+        _create_issues(client, jobs)
+    except Exception as e:
+        for job in jobs:
+            if job.status == TicketJob.RUNNING:
+                _retry_or_fail(job, f"{type(e).__name__}: {e}", permanent=_is_permanent(e))
+    for job in jobs:
+        job.save(update_fields=["status", "attempts", "run_after", "issue_key", "error", "updated"])
+
+
+def process_jobs(batch_size: int = BULK_CREATE_LIMIT, client: Optional[JiraClient] = None) -> int:
+    """
+    Run every job that is due, a batch at a time.
+
+    Returns:
+        Number of jobs run (including ones that will be retried)
+    """
+    processed = 0
+    while True:
+        jobs = claim_jobs(batch_size)
+        if not jobs:
+            return processed
+        run_jobs(jobs, client)
+        processed += len(jobs)
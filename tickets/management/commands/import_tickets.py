@@ -0,0 +1,55 @@
+import csv
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tickets.jira import BULK_CREATE_LIMIT, get_jira_client
+from tickets.sync import LOCATION_FIELD
+
+
+def _read_rows(path: Path):
+    if path.suffix == ".csv":
+        with path.open(newline="") as f:
+            return list(csv.DictReader(f))
+    if path.suffix in (".jsonl", ".ndjson"):
+        with path.open() as f:
+            return [json.loads(line) for line in f if line.strip()]
+    raise CommandError(f"Unsupported file type {path.suffix!r}, expected .csv or .jsonl")
+
+
+class Command(BaseCommand):
+    help = (
+        "Create Jira issues in bulk from a CSV or JSONL file with summary, description, "
+        "priority, location and assignee columns."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=Path)
+        parser.add_argument("--project", default="DCM", help="Project key for rows without one")
+        parser.add_argument("--chunk-size", type=int, default=BULK_CREATE_LIMIT, help="Issues per bulk request")
+
+    def handle(self, *args, **options):
+        rows = _read_rows(options["path"])
+        issues = []
+        for number, row in enumerate(rows, start=1):
+            if not row.get("summary"):
+                raise CommandError(f"Row {number} has no summary")
+            issue = {
+                "project_key": row.get("project") or options["project"],
+                "summary": row["summary"],
+                "description": row.get("description") or None,
+                "priority": row.get("priority") or "Medium",
+                "assignee": row.get("assignee") or None,
+            }
+            if row.get("location"):
+                issue["custom_fields"] = {LOCATION_FIELD: row["location"]}
+            issues.append(issue)
+
+        result = get_jira_client().create_issues(issues, chunk_size=options["chunk_size"])
+
+        for created in result["created"]:
+            self.stdout.write(f"Row {created['index'] + 1}: created {created['key']}")
+        for failed in result["failed"]:
+            self.stderr.write(f"Row {failed['index'] + 1}: failed: {failed['error']}")
+        self.stdout.write(f"Created {len(result['created'])} of {len(issues)} issue(s)")
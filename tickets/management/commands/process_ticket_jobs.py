@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from tickets.jira import BULK_CREATE_LIMIT
+from tickets.jobs import process_jobs
+
+
+class Command(BaseCommand):
+    help = "Create the Jira issues queued by the ticket-master chat."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BULK_CREATE_LIMIT,
+            help="Jobs claimed at a time (and sent to Jira in one bulk request)"
+        )
+        parser.add_argument(
+            "--every",
+            type=float,
+            metavar="SECONDS",
+            help="Keep running and check the queue every SECONDS"
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            try:
+                count = process_jobs(batch_size=options["batch_size"])
+                if count or not options["every"]:
+                    self.stdout.write(f"Ran {count} ticket job(s)")
+            except Exception as e:
+                if not options["every"]:
+                    raise
+                self.stderr.write(f"Ticket jobs failed: {e}")
+
+            if not options["every"]:
+                return
+            time.sleep(options["every"])
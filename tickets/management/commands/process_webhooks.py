@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from tickets.webhooks import process_events
+
+
+class Command(BaseCommand):
+    help = "Apply queued Jira webhook events to the local Ticket tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Events applied per transaction")
+        parser.add_argument(
+            "--every",
+            type=float,
+            metavar="SECONDS",
+            help="Keep running and drain the queue every SECONDS"
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            count = process_events(batch_size=options["batch_size"])
+            if count or not options["every"]:
+                self.stdout.write(f"Processed {count} webhook event(s)")
+            if not options["every"]:
+                return
+            time.sleep(options["every"])
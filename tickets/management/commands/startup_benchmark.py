@@ -0,0 +1,63 @@
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Boots the app the way an ASGI worker does before its first request, then
+# reports which heavy modules that pulled in
+WORKER_BOOT = """
+import json, os, sys
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "hyperlynx.settings")
+from hyperlynx.asgi import application
+from django.urls import get_resolver
+get_resolver().url_patterns
+print(json.dumps(sorted(m for m in {modules} if m in sys.modules)))
+"""
+
+# Imports that should stay off the startup path (see tickets.gemini)
+HEAVY_MODULES = ["google.genai"]
+
+
+class Command(BaseCommand):
+    help = "Time `manage.py check` and ASGI worker boot in fresh processes."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5, help="Processes started per measurement")
+
+    def _time(self, args):
+        started = time.perf_counter()
+        result = subprocess.run(args, cwd=settings.BASE_DIR, capture_output=True, text=True)
+        elapsed = time.perf_counter() - started
+        if result.returncode:
+            raise RuntimeError(f"{' '.join(args)} failed:\n{result.stderr}")
+        return elapsed, result.stdout
+
+    def _report(self, name, timings):
+        self.stdout.write(
+            f"{name:<14} median {statistics.median(timings) * 1000:7.1f} ms   "
+            f"min {min(timings) * 1000:7.1f} ms   max {max(timings) * 1000:7.1f} ms"
+        )
+
+    def handle(self, *args, **options):
+        check = [sys.executable, "manage.py", "check"]
+        boot = [sys.executable, "-c", WORKER_BOOT.format(modules=HEAVY_MODULES)]
+
+        check_times, boot_times = [], []
+        loaded = []
+        for _ in range(options["runs"]):
+            check_times.append(self._time(check)[0])
+            elapsed, output = self._time(boot)
+            boot_times.append(elapsed)
+            loaded = json.loads(output.strip().splitlines()[-1])
+
+        self._report("manage.py check", check_times)
+        self._report("worker boot", boot_times)
+        if loaded:
+            self.stdout.write(self.style.WARNING(f"Imported at boot: {', '.join(loaded)}"))
+        else:
+            self.stdout.write(f"Deferred until first use: {', '.join(HEAVY_MODULES)}")
@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from tickets.sync import sync_issues
+
+
+class Command(BaseCommand):
+    help = "Mirror Jira issues changed since the last sync into the local Ticket tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--project", help="Only sync issues in this project (e.g. DCM)")
+        parser.add_argument("--full", action="store_true", help="Ignore the watermark and re-read every issue")
+        parser.add_argument(
+            "--every",
+            type=int,
+            metavar="SECONDS",
+            help="Keep running and sync again every SECONDS (for use as a periodic job)"
+        )
+
+    def handle(self, *args, **options):
+        full = options["full"]
+        while True:
+            try:
+                count = sync_issues(project=options["project"], full=full)
+                self.stdout.write(f"Synced {count} issue(s) from Jira")
+            except Exception as e:
+                if not options["every"]:
+                    raise
+                self.stderr.write(f"Jira sync failed: {e}")
+
+            if not options["every"]:
+                return
+            # Only the first pass is a full resync
+            full = False
+            time.sleep(options["every"])
@@ -0,0 +1,41 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from tickets.directory import sync_directory
+
+
+class Command(BaseCommand):
+    help = "Mirror Jira users and role group membership into the local user directory."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--group",
+            action="append",
+            dest="groups",
+            metavar="GROUP",
+            help="Mirror this group's membership (repeatable; default: the dashboard role groups)"
+        )
+        parser.add_argument(
+            "--every",
+            type=int,
+            metavar="SECONDS",
+            help="Keep running and sync again every SECONDS (for use as a periodic job)"
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            try:
+                counts = sync_directory(groups=options["groups"])
+                self.stdout.write(
+                    f"Synced Jira users: {counts['created']} new, {counts['updated']} changed, "
+                    f"{counts['deactivated']} deactivated, {counts['memberships']} membership change(s)"
+                )
+            except Exception as e:
+                if not options["every"]:
+                    raise
+                self.stderr.write(f"Jira user sync failed: {e}")
+
+            if not options["every"]:
+                return
+            time.sleep(options["every"])
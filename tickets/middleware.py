@@ -0,0 +1,70 @@
+import json
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from tickets.instrumentation import collect_jira_calls, record_view
+
+logger = logging.getLogger(__name__)
+
+
+class JiraTimingMiddleware:
+    """
+    Reports the Jira calls made while handling each request.
+
+    Adds a ``Server-Timing`` header (shown in the browser's network panel),
+    logs one JSON line per request to the ``tickets.middleware`` logger and
+    feeds the per-view metrics served at /metrics/.
+
+    Calls made after the response is returned, e.g. while a
+    StreamingHttpResponse is iterated, are not included.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        with collect_jira_calls() as calls:
+            response = self.get_response(request)
+        self._report(request, response, started, calls)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        with collect_jira_calls() as calls:
+            response = await self.get_response(request)
+        self._report(request, response, started, calls)
+        return response
+
+    @staticmethod
+    def _report(request, response, started, calls):
+        duration = time.perf_counter() - started
+        jira_ms = sum(call.duration for call in calls) * 1000
+        cached = sum(call.cache != "miss" for call in calls)
+        view = request.resolver_match.view_name if request.resolver_match else "unresolved"
+
+        response["Server-Timing"] = ", ".join([
+            f'jira;dur={jira_ms:.1f};desc="{len(calls)} calls, {cached} cached"',
+            f"app;dur={duration * 1000:.1f}",
+        ])
+        record_view(view, duration, calls)
+        # Requests that never reached Jira are only logged at DEBUG
+        logger.log(logging.INFO if calls else logging.DEBUG, json.dumps({
+            "view": view,
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "ms": round(duration * 1000, 1),
+            "jira_calls": len(calls),
+            "jira_ms": round(jira_ms, 1),
+            "calls": [call.as_dict() for call in calls],
+        }))
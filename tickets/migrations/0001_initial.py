@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+                ('watermark', models.DateTimeField(blank=True, null=True)),
+                ('last_run', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Ticket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=32, unique=True)),
+                ('jira_id', models.CharField(max_length=32, unique=True)),
+                ('project', models.CharField(db_index=True, max_length=32)),
+                ('summary', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True, default='')),
+                ('priority', models.CharField(blank=True, default='', max_length=32)),
+                ('priority_rank', models.PositiveSmallIntegerField(default=0)),
+                ('status', models.CharField(blank=True, default='', max_length=64)),
+                ('status_category', models.CharField(blank=True, db_index=True, default='', max_length=32)),
+                ('assignee', models.CharField(blank=True, db_index=True, max_length=150, null=True)),
+                ('location', models.CharField(blank=True, default='', max_length=64)),
+                ('labels', models.JSONField(blank=True, default=list)),
+                ('created', models.DateTimeField(db_index=True)),
+                ('updated', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['assignee', '-created'], name='tickets_tic_assigne_fc7f6d_idx'), models.Index(fields=['project', 'assignee', '-priority_rank'], name='tickets_tic_project_a98ad3_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,68 @@
+from django.db import migrations
+
+# FTS5 index over the searchable Ticket columns, kept in sync by triggers.
+# It is an external-content table, so it stores only the index, not a copy
+# of the text. prefix='2 3' adds prefix indexes so "rack*" style queries
+# don't scan the whole term list.
+CREATE_FTS = [
+    """
+    CREATE VIRTUAL TABLE tickets_ticket_fts USING fts5(
+        summary, description, labels, location,
+        content='tickets_ticket', content_rowid='id',
+        tokenize='unicode61', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER tickets_ticket_fts_ai AFTER INSERT ON tickets_ticket BEGIN
+        INSERT INTO tickets_ticket_fts(rowid, summary, description, labels, location)
+        VALUES (new.id, new.summary, new.description, new.labels, new.location);
+    END
+    """,
+    """
+    CREATE TRIGGER tickets_ticket_fts_ad AFTER DELETE ON tickets_ticket BEGIN
+        INSERT INTO tickets_ticket_fts(tickets_ticket_fts, rowid, summary, description, labels, location)
+        VALUES ('delete', old.id, old.summary, old.description, old.labels, old.location);
+    END
+    """,
+    """
+    CREATE TRIGGER tickets_ticket_fts_au AFTER UPDATE ON tickets_ticket BEGIN
+        INSERT INTO tickets_ticket_fts(tickets_ticket_fts, rowid, summary, description, labels, location)
+        VALUES ('delete', old.id, old.summary, old.description, old.labels, old.location);
+        INSERT INTO tickets_ticket_fts(rowid, summary, description, labels, location)
+        VALUES (new.id, new.summary, new.description, new.labels, new.location);
+    END
+    """,
+    "INSERT INTO tickets_ticket_fts(tickets_ticket_fts) VALUES ('rebuild')",
+]
+
+DROP_FTS = [
+    "DROP TRIGGER IF EXISTS tickets_ticket_fts_au",
+    "DROP TRIGGER IF EXISTS tickets_ticket_fts_ad",
+    "DROP TRIGGER IF EXISTS tickets_ticket_fts_ai",
+    "DROP TABLE IF EXISTS tickets_ticket_fts",
+]
+
+
+def create_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for statement in CREATE_FTS:
+        schema_editor.execute(statement)
+
+
+def drop_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for statement in DROP_FTS:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0002_webhookevent_ticket_deleted'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts, drop_fts),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:52
+
+from django.db import migrations, models
+
+from tickets.tools import LOCATION_LEVELS, Location
+
+
+def parse_existing_locations(apps, schema_editor):
+    Ticket = apps.get_model('tickets', 'Ticket')
+    tickets = list(Ticket.objects.exclude(location=''))
+    for ticket in tickets:
+        parsed = Location.parse(ticket.location)
+        for level in LOCATION_LEVELS:
+            setattr(ticket, level, getattr(parsed, level) if parsed else '')
+    Ticket.objects.bulk_update(tickets, list(LOCATION_LEVELS), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0003_ticket_fts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='aisle',
+            field=models.CharField(blank=True, default='', max_length=16),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='floor',
+            field=models.CharField(blank=True, default='', max_length=16),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='hall',
+            field=models.CharField(blank=True, default='', max_length=16),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='pod',
+            field=models.CharField(blank=True, default='', max_length=16),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='rack',
+            field=models.CharField(blank=True, default='', max_length=16),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['floor', 'hall', 'pod', 'aisle', 'rack'], name='tickets_ticket_location_idx'),
+        ),
+        migrations.RunPython(parse_existing_locations, migrations.RunPython.noop),
+    ]
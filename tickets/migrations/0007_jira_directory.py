@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:15
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0006_ticketjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JiraUser',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=150, unique=True)),
+                ('display_name', models.CharField(blank=True, default='', max_length=255)),
+                ('email', models.CharField(blank=True, default='', max_length=254)),
+                ('active', models.BooleanField(default=True)),
+                ('name_folded', models.CharField(db_index=True, max_length=150)),
+                ('display_name_folded', models.CharField(blank=True, db_index=True, default='', max_length=255)),
+                ('synced', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='JiraGroupMember',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('group', models.CharField(max_length=150)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='tickets.jirauser')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('group', 'user'), name='tickets_unique_group_member')],
+            },
+        ),
+    ]
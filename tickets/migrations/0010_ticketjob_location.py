@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:34
+
+from django.db import migrations, models
+
+from tickets.tools import Location
+
+
+def parse_queued_locations(apps, schema_editor):
+    TicketJob = apps.get_model('tickets', 'TicketJob')
+    jobs = list(TicketJob.objects.filter(status__in=['pending', 'running']))
+    for job in jobs:
+        parsed = Location.parse((job.payload.get('custom_fields') or {}).get('customfield_10200'))
+        job.location = str(parsed) if parsed else ''
+    TicketJob.objects.bulk_update(jobs, ['location'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0009_ticket_feed_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticketjob',
+            name='location',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='ticketjob',
+            index=models.Index(fields=['location', 'status'], name='tickets_job_location_idx'),
+        ),
+        migrations.RunPython(parse_queued_locations, migrations.RunPython.noop),
+    ]
@@ -1,27 +1,221 @@
-from django.contrib.auth.models import AbstractUser
+import uuid
+
+from django.conf import settings
 from django.db import models
-from django.db.models import CASCADE
-
-
-# Create your models here.
-# class Users(AbstractUser):
-#     jira_username = models.CharField(
-#         max_length=150,
-#         unique=True,
-#         null=True,
-#         blank=True,
-#         help_text="Custom username set upon first login."
-#     )
-#
-#     pass
-
-# class Ticket(models.Model):
-#     id = models.IntegerField(default=0)
-    #created_by = models.ForeignKey(Users, on_delete=CASCADE, related_name="created_tickets")
-    #date_created = models.DateTimeField(auto_now_add=True)
-    #date_created = models.DateTimeField(auto_now_add=True)
-
-
-#class TicketPersons(models.Model):
-    # person = models.ForeignKey(Users, on_delete=CASCADE)
-    # ticket = models.ForeignKey(Ticket, on_delete=CASCADE)
\ No newline at end of file
+from django.utils import timezone
+
+from tickets.tools import LOCATION_LEVELS, Location, Priority
+
+# Rank used to sort by priority the way Jira does (Highest first when DESC)
+PRIORITY_RANKS = {priority.value: rank for rank, priority in enumerate(Priority, start=1)}
+
+
+class TicketQuerySet(models.QuerySet):
+    def live(self):
+        """Tickets whose Jira issue still exists."""
+        return self.filter(deleted=False)
+
+    def at_location(self, **levels):
+        """
+        Tickets under a location prefix, e.g. at_location(floor="1", hall="3", pod="B").
+
+        Levels must be given outermost first without gaps so the lookup can
+        use the (floor, hall, pod, aisle, rack) index.
+        """
+        prefix = {}
+        for level in LOCATION_LEVELS:
+            if level not in levels:
+                break
+            prefix[level] = str(levels.pop(level)).strip().upper()
+        if levels:
+            raise ValueError(f"Location levels {sorted(levels)} need every level above them")
+        return self.filter(**prefix)
+
+    def location_rollup(self, level: str):
+        """Ticket counts per value of a location level, e.g. per pod."""
+        if level not in LOCATION_LEVELS:
+            raise ValueError(f"Unknown location level {level!r}")
+        return (
+            self.exclude(**{level: ""})
+            .values(level)
+            .annotate(count=models.Count("id"))
+            .order_by(level)
+        )
+
+
+class Ticket(models.Model):
+    """
+    A local mirror of a Jira issue, kept up to date by tickets.sync and the
+    Jira webhook (tickets.webhooks).
+
+    Deleted issues are kept as tombstones (deleted=True) so that replayed or
+    out-of-order webhook events can't bring them back.
+    """
+
+    key = models.CharField(max_length=32, unique=True)
+    jira_id = models.CharField(max_length=32, unique=True)
+    project = models.CharField(max_length=32, db_index=True)
+    summary = models.CharField(max_length=255)
+    description = models.TextField(blank=True, default="")
+    priority = models.CharField(max_length=32, blank=True, default="")
+    priority_rank = models.PositiveSmallIntegerField(default=0)
+    status = models.CharField(max_length=64, blank=True, default="")
+    status_category = models.CharField(max_length=32, blank=True, default="", db_index=True)
+    assignee = models.CharField(max_length=150, null=True, blank=True, db_index=True)
+    location = models.CharField(max_length=64, blank=True, default="")
+    # Normalized parts of location, blank when it isn't FLOOR:HALL:POD:AISLE:RACK
+    floor = models.CharField(max_length=16, blank=True, default="")
+    hall = models.CharField(max_length=16, blank=True, default="")
+    pod = models.CharField(max_length=16, blank=True, default="")
+    aisle = models.CharField(max_length=16, blank=True, default="")
+    rack = models.CharField(max_length=16, blank=True, default="")
+    labels = models.JSONField(default=list, blank=True)
+    created = models.DateTimeField(db_index=True)
+    updated = models.DateTimeField(db_index=True)
+    deleted = models.BooleanField(default=False)
+    # Feed version of the last write to this row (see tickets.feed)
+    version = models.PositiveBigIntegerField(default=0, db_index=True)
+
+    objects = TicketQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["assignee", "-created"]),
+            models.Index(fields=["project", "assignee", "-priority_rank"]),
+            models.Index(fields=list(LOCATION_LEVELS), name="tickets_ticket_location_idx"),
+            # Keyset pages sorted by priority (see tickets.api)
+            models.Index(fields=["priority_rank"], name="tickets_ticket_priority_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.key}: {self.summary}"
+
+    def set_location(self, value: str) -> None:
+        """Store a raw location string along with its parsed levels."""
+        self.location = value or ""
+        parsed = Location.parse(value)
+        for level in LOCATION_LEVELS:
+            setattr(self, level, getattr(parsed, level) if parsed else "")
+
+
+class SyncState(models.Model):
+    """High-water mark of the last successful Jira sync."""
+
+    name = models.CharField(max_length=64, unique=True)
+    watermark = models.DateTimeField(null=True, blank=True)
+    last_run = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.watermark}"
+
+
+class TicketVersion(models.Model):
+    """
+    Single-row counter stamped on Ticket rows as they are written, so the
+    change feed (tickets.feed) can ask for everything after a version.
+    """
+
+    value = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"Ticket version {self.value}"
+
+
+class WebhookEvent(models.Model):
+    """A raw Jira webhook delivery waiting to be applied to the Ticket mirror."""
+
+    payload = models.JSONField()
+    received_at = models.DateTimeField(auto_now_add=True)
+    error = models.TextField(blank=True, default="")
+
+    def __str__(self):
+        return f"{self.payload.get('webhookEvent', 'unknown')} @ {self.received_at}"
+
+
+class ChatSession(models.Model):
+    """A ticket-intake conversation with Gemini, kept server-side between turns."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.CASCADE)
+    # Recent turns as serialized google.genai Content dictionaries
+    history = models.JSONField(default=list)
+    # Gemini's summary of turns dropped from history
+    summary = models.TextField(blank=True, default="")
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True, db_index=True)
+
+    def __str__(self):
+        return f"Chat {self.id} ({len(self.history)} turns)"
+
+
+class TicketJob(models.Model):
+    """A Jira issue waiting to be created by `manage.py process_ticket_jobs`."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUSES = [(PENDING, "Pending"), (RUNNING, "Running"), (DONE, "Done"), (FAILED, "Failed")]
+
+    status = models.CharField(max_length=16, choices=STATUSES, default=PENDING)
+    # Keyword arguments for JiraClient.create_issue
+    payload = models.JSONField()
+    chat_session = models.ForeignKey(
+        ChatSession, null=True, blank=True, on_delete=models.SET_NULL, related_name="ticket_jobs"
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    run_after = models.DateTimeField(default=timezone.now)
+    issue_key = models.CharField(max_length=32, blank=True, default="")
+    error = models.TextField(blank=True, default="")
+    # Normalized FLOOR:HALL:POD:AISLE:RACK of the payload's location, blank
+    # if it has none, so tickets.dedup can find queued tickets by rack
+    location = models.CharField(max_length=64, blank=True, default="")
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "run_after"]),
+            models.Index(fields=["location", "status"], name="tickets_job_location_idx"),
+        ]
+
+    def __str__(self):
+        return f"Job {self.pk} ({self.status}) {self.issue_key}"
+
+
+class JiraUser(models.Model):
+    """A Jira account in the local user directory kept by tickets.directory."""
+
+    name = models.CharField(max_length=150, unique=True)
+    display_name = models.CharField(max_length=255, blank=True, default="")
+    email = models.CharField(max_length=254, blank=True, default="")
+    active = models.BooleanField(default=True)
+    # Lowercased name and display name, indexed for prefix search
+    name_folded = models.CharField(max_length=150, db_index=True)
+    display_name_folded = models.CharField(max_length=255, blank=True, default="", db_index=True)
+    synced = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.name} ({self.display_name})"
+
+    def save(self, *args, **kwargs):
+        self.fold()
+        super().save(*args, **kwargs)
+
+    def fold(self) -> None:
+        """Refresh the lowercased search columns (bulk writes skip save())."""
+        self.name_folded = self.name.lower()
+        self.display_name_folded = self.display_name.lower()
+
+
+class JiraGroupMember(models.Model):
+    """Membership of a JiraUser in one of the Jira groups the directory tracks."""
+
+    group = models.CharField(max_length=150)
+    user = models.ForeignKey(JiraUser, on_delete=models.CASCADE, related_name="memberships")
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["group", "user"], name="tickets_unique_group_member")]
+
+    def __str__(self):
+        return f"{self.user.name} in {self.group}"
@@ -0,0 +1,160 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Statuses that mean "try again later" rather than "this request is wrong"
+RETRY_STATUSES = {429, 502, 503, 504}
+
+# Methods that are safe to send twice
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class JiraUnavailableError(Exception):
+    """Raised instead of calling Jira while the circuit breaker is open."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or an HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed Jira call is retried.
+
+    Delays use exponential backoff with full jitter, unless Jira sent a
+    Retry-After header, which is honoured as long as it fits within max_wait.
+    Only idempotent methods are retried after timeouts and 5xx responses,
+    while 429 is always safe to retry because Jira rejected the request
+    without acting on it.
+    """
+
+    def __init__(
+            self,
+            max_retries: int = 3,
+            backoff_base: float = 0.5,
+            backoff_cap: float = 8.0,
+            max_wait: float = 10.0
+    ):
+        """
+        Args:
+            max_retries: Retries after the first attempt
+            backoff_base: Backoff ceiling in seconds for the first retry
+            backoff_cap: Largest backoff ceiling in seconds
+            max_wait: Give up rather than sleep longer than this for one retry
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.max_wait = max_wait
+
+    def delay(
+            self,
+            attempt: int,
+            method: str,
+            status: Optional[int] = None,
+            retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retrying, or None to give up.
+
+        Args:
+            attempt: Number of retries already made
+            method: HTTP method of the request
+            status: Response status, or None if no response arrived
+            retry_after: Value of the response's Retry-After header
+        """
+        if attempt >= self.max_retries:
+            return None
+        if status is not None and status not in RETRY_STATUSES:
+            return None
+        if status != 429 and method.upper() not in IDEMPOTENT_METHODS:
+            return None
+
+        wait = parse_retry_after(retry_after)
+        if wait is None:
+            wait = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+        return wait if wait <= self.max_wait else None
+
+
+class TokenBucket:
+    """
+    Client-side rate limiter allowing ``rate`` calls per second with bursts
+    of up to ``capacity``.
+
+    reserve() always takes a token and returns how long the caller must wait
+    for it, so the sync client can time.sleep() and the async client can
+    asyncio.sleep() on the same bucket.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class CircuitBreaker:
+    """
+    Stops calling Jira after repeated failures.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    calls fail fast for ``reset_timeout`` seconds. Then one trial call is let
+    through; success closes the breaker, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """Whether a call may be made right now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_running or time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
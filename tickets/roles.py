@@ -0,0 +1,179 @@
+import asyncio
+import threading
+import time
+from typing import Dict, FrozenSet, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+
+from tickets.jira import get_jira_client, get_async_jira_client
+
+# Jira groups checked in order; the first one containing the user wins
+ROLE_GROUPS = (
+    ("Engineers", "engineer"),
+    ("Technicians", "data_technician"),
+)
+DEFAULT_ROLE = "data_technician"
+
+
+class RoleResolver:
+    """
+    Resolves a Jira username to a dashboard role from cached group membership.
+
+    Membership comes from the local user directory (tickets.directory) once
+    `manage.py sync_jira_users` has mirrored a group, and from Jira before that.
+
+    Each group's member names are stored as a frozenset in a Django cache, so
+    lookups are O(1) and Jira is only asked again when an entry goes stale.
+    Once an entry is older than ``refresh_ahead`` of its TTL it is still
+    served, but a background thread refetches it so requests never wait on
+    Jira for a warm cache.
+
+    Usage:
+        resolver = get_role_resolver()
+        role = resolver.resolve("zeke")
+
+        # From an async view
+        role = await resolver.aresolve("zeke")
+
+        # After changing group membership in Jira
+        resolver.invalidate("Engineers")
+    """
+
+    def __init__(self, cache_alias: str = "default", ttl: int = 3600, refresh_ahead: float = 0.8):
+        """
+        Initialize the resolver.
+
+        Args:
+            cache_alias: Name of the Django cache (from settings.CACHES) to store
+                         membership in. Point it at a shared backend to share
+                         one copy between workers.
+            ttl: Seconds a group's membership is kept before it must be refetched
+            refresh_ahead: Fraction of the TTL after which an entry is refreshed
+                           in the background
+        """
+        self.cache_alias = cache_alias
+        self.ttl = ttl
+        self.refresh_after = ttl * refresh_ahead
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    @staticmethod
+    def _key(group_name: str) -> str:
+        return f"jira:group-members:{group_name}"
+
+    @staticmethod
+    def _entry(member_names) -> Dict:
+        return {
+            "members": frozenset(member_names),
+            "fetched_at": time.time()
+        }
+
+    def _store(self, group_name: str, member_names) -> FrozenSet[str]:
+        entry = self._entry(member_names)
+        self.cache.set(self._key(group_name), entry, timeout=self.ttl)
+        return entry["members"]
+
+    @staticmethod
+    def _fetch(group_name: str):
+        # Imported here because tickets.directory builds on this module
+        from tickets.directory import group_members
+
+        members = group_members(group_name)
+        if members is None:
+            members = [member.get("name") for member in get_jira_client().get_group_members(group_name)]
+        return members
+
+    async def _afetch(self, group_name: str):
+        from tickets.directory import group_members
+
+        members = await sync_to_async(group_members)(group_name)
+        if members is None:
+            members = [member.get("name") for member in await get_async_jira_client().get_group_members(group_name)]
+        return members
+
+    def _refresh(self, group_name: str) -> None:
+        try:
+            self._store(group_name, self._fetch(group_name))
+        finally:
+            with self._lock:
+                self._refreshing.discard(group_name)
+
+    def _refresh_in_background(self, group_name: str) -> None:
+        with self._lock:
+            if group_name in self._refreshing:
+                return
+            self._refreshing.add(group_name)
+        threading.Thread(target=self._refresh, args=(group_name,), daemon=True).start()
+
+    def _from_entry(self, group_name: str, entry: Optional[Dict]) -> Optional[FrozenSet[str]]:
+        """Return cached members, scheduling a refresh if the entry is getting old."""
+        if entry is None:
+            return None
+        if time.time() - entry["fetched_at"] >= self.refresh_after:
+            self._refresh_in_background(group_name)
+        return entry["members"]
+
+    def get_members(self, group_name: str) -> FrozenSet[str]:
+        """Get the usernames in a Jira group, fetching them on a cache miss."""
+        members = self._from_entry(group_name, self.cache.get(self._key(group_name)))
+        if members is None:
+            members = self._store(group_name, self._fetch(group_name))
+        return members
+
+    async def aget_members(self, group_name: str) -> FrozenSet[str]:
+        """Async version of get_members."""
+        members = self._from_entry(group_name, await self.cache.aget(self._key(group_name)))
+        if members is None:
+            entry = self._entry(await self._afetch(group_name))
+            await self.cache.aset(self._key(group_name), entry, timeout=self.ttl)
+            members = entry["members"]
+        return members
+
+    def resolve(self, username: Optional[str]) -> str:
+        """Get the dashboard role for a Jira username."""
+        for group_name, role in ROLE_GROUPS:
+            if username in self.get_members(group_name):
+                return role
+        return DEFAULT_ROLE
+
+    async def aresolve(self, username: Optional[str]) -> str:
+        """Async version of resolve. Cold groups are fetched concurrently."""
+        memberships = await asyncio.gather(
+            *(self.aget_members(group_name) for group_name, _ in ROLE_GROUPS)
+        )
+        for members, (_, role) in zip(memberships, ROLE_GROUPS):
+            if username in members:
+                return role
+        return DEFAULT_ROLE
+
+    def invalidate(self, group_name: Optional[str] = None) -> None:
+        """
+        Drop cached membership so the next lookup refetches it from Jira.
+
+        Args:
+            group_name: Group to drop (None = every group in ROLE_GROUPS)
+        """
+        if group_name is None:
+            self.cache.delete_many([self._key(name) for name, _ in ROLE_GROUPS])
+        else:
+            self.cache.delete(self._key(group_name))
+
+
+_resolver: Optional[RoleResolver] = None
+
+
+def get_role_resolver() -> RoleResolver:
+    """Get the process-wide RoleResolver configured from settings."""
+    global _resolver
+    if _resolver is None:
+        _resolver = RoleResolver(
+            cache_alias=getattr(settings, "JIRA_ROLE_CACHE", "default"),
+            ttl=getattr(settings, "JIRA_ROLE_CACHE_TTL", 3600)
+        )
+    return _resolver
@@ -0,0 +1,146 @@
+import re
+from typing import Any, Dict, List, Optional
+
+from tickets.models import Ticket
+
+# Ticket columns that may be used as exact-match filters alongside a search
+SEARCH_FILTERS = ("project", "priority", "status", "status_category", "assignee")
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# Triggers keeping tickets_ticket_fts (created in migration 0003) in step with
+# tickets_ticket. SQLite drops them whenever a migration rebuilds the table,
+# so restore_fts_triggers puts them back after every migrate.
+FTS_TRIGGERS = {
+    "tickets_ticket_fts_ai": """
+        CREATE TRIGGER IF NOT EXISTS tickets_ticket_fts_ai AFTER INSERT ON tickets_ticket BEGIN
+            INSERT INTO tickets_ticket_fts(rowid, summary, description, labels, location)
+            VALUES (new.id, new.summary, new.description, new.labels, new.location);
+        END
+    """,
+    "tickets_ticket_fts_ad": """
+        CREATE TRIGGER IF NOT EXISTS tickets_ticket_fts_ad AFTER DELETE ON tickets_ticket BEGIN
+            INSERT INTO tickets_ticket_fts(tickets_ticket_fts, rowid, summary, description, labels, location)
+            VALUES ('delete', old.id, old.summary, old.description, old.labels, old.location);
+        END
+    """,
+    "tickets_ticket_fts_au": """
+        CREATE TRIGGER IF NOT EXISTS tickets_ticket_fts_au AFTER UPDATE ON tickets_ticket BEGIN
+            INSERT INTO tickets_ticket_fts(tickets_ticket_fts, rowid, summary, description, labels, location)
+            VALUES ('delete', old.id, old.summary, old.description, old.labels, old.location);
+            INSERT INTO tickets_ticket_fts(rowid, summary, description, labels, location)
+            VALUES (new.id, new.summary, new.description, new.labels, new.location);
+        END
+    """,
+}
+
+
+def restore_fts_triggers(connection) -> bool:
+    """
+    Recreate any missing FTS triggers and reindex if some were missing.
+
+    Returns:
+        True if triggers had to be restored
+    """
+    if connection.vendor != "sqlite":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'tickets_ticket_fts' OR "
+            f"(type = 'trigger' AND name IN ({', '.join(['%s'] * len(FTS_TRIGGERS))}))",
+            list(FTS_TRIGGERS)
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        if "tickets_ticket_fts" not in existing or existing.issuperset(FTS_TRIGGERS):
+            return False
+        for sql in FTS_TRIGGERS.values():
+            cursor.execute(sql)
+        # Rows written while the triggers were gone are missing from the index
+        cursor.execute("INSERT INTO tickets_ticket_fts(tickets_ticket_fts) VALUES ('rebuild')")
+    return True
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 MATCH expression.
+
+    Every word must match, and each one is treated as a prefix so results
+    show up while the user is still typing. Words are quoted, so FTS5
+    operators and punctuation in the input can't break the query.
+
+    Returns:
+        The MATCH expression, or None if the text contains no words
+    """
+    tokens = _TOKEN.findall(query)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def search_tickets(
+        query: str,
+        page: int = 1,
+        page_size: int = 25,
+        filters: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Full-text search over ticket summary, description, labels and location.
+
+    Results are ranked by BM25 with summary matches weighted highest.
+
+    Args:
+        query: Free text typed by the user
+        page: 1-based page number
+        page_size: Results per page
+        filters: Optional exact-match filters on columns in SEARCH_FILTERS;
+                 an assignee of None matches unassigned tickets
+
+    Returns:
+        Dictionary with the page of "results" and whether there are more
+
+    Example:
+        search_tickets("pdu rack", filters={"project": "DCM"})
+    """
+    match = build_match_query(query)
+    if match is None:
+        return {"results": [], "page": page, "has_more": False}
+
+    where = ["tickets_ticket_fts MATCH %s", "t.deleted = 0"]
+    params: List[Any] = [match]
+    for column, value in (filters or {}).items():
+        if column not in SEARCH_FILTERS:
+            raise ValueError(f"Cannot filter search results on {column!r}")
+        if value is None:
+            where.append(f"t.{column} IS NULL")
+        else:
+            where.append(f"t.{column} = %s")
+            params.append(value)
+
+    # Fetch one extra row to know whether another page exists
+    params += [page_size + 1, (page - 1) * page_size]
+    tickets = list(Ticket.objects.raw(
+        f"""
+        SELECT t.* FROM tickets_ticket_fts
+        JOIN tickets_ticket t ON t.id = tickets_ticket_fts.rowid
+        WHERE {" AND ".join(where)}
+        ORDER BY bm25(tickets_ticket_fts, 10.0, 1.0, 3.0, 3.0)
+        LIMIT %s OFFSET %s
+        """,
+        params
+    ))
+
+    return {
+        "results": [
+            {
+                "id": ticket.jira_id,
+                "key": ticket.key,
+                "title": ticket.summary,
+                "date": ticket.created.isoformat(),
+                "priority": ticket.priority,
+                "status": ticket.status,
+                "location": ticket.location,
+            } for ticket in tickets[:page_size]
+        ],
+        "page": page,
+        "has_more": len(tickets) > page_size,
+    }
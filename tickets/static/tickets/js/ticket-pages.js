@@ -0,0 +1,76 @@
+// Pages through /api/v1/tickets/ (see tickets.api) for the dashboard pages.
+import {useState, useEffect, useRef, useCallback} from 'https://esm.sh/react';
+import axios from 'https://esm.sh/axios';
+
+export const TICKETS_API = '/api/v1/tickets/';
+
+// Apply a batch from /api/v1/tickets/changes/ to a list of tickets: changed
+// rows are replaced where they are, new ones go to the top, and removed
+// keys are dropped.
+export function applyChanges(tickets, changes) {
+    const gone = new Set(changes.removed);
+    const fresh = new Map(changes.results.map(t => [t.key, t]));
+    const kept = tickets.filter(t => !gone.has(t.key)).map(t => {
+        const row = fresh.get(t.key);
+        fresh.delete(t.key);
+        return row || t;
+    });
+    return [...fresh.values(), ...kept];
+}
+
+// Tickets matching `params`, loaded one page at a time.
+// Returns {tickets, hasMore, loading, loadMore, sentinelRef}; attach
+// sentinelRef to an element after the list and the next page loads as it
+// scrolls into view. With {live: true} the list also follows the change
+// stream, so edits made in Jira show up without reloading.
+export function useTicketPages(params, {live = false} = {}) {
+    const [tickets, setTickets] = useState([]);
+    const [version, setVersion] = useState(null);
+    const [cursor, setCursor] = useState(null);
+    const [hasMore, setHasMore] = useState(true);
+    const [loading, setLoading] = useState(false);
+    const sentinelRef = useRef(null);
+    const key = JSON.stringify(params);
+
+    const load = useCallback(async (after, replace) => {
+        setLoading(true);
+        try {
+            const response = await axios.get(TICKETS_API, {params: {...params, cursor: after || undefined}});
+            setTickets(current => replace ? response.data.results : [...current, ...response.data.results]);
+            if (replace) setVersion(response.data.version);
+            setCursor(response.data.next);
+            setHasMore(Boolean(response.data.next));
+        } finally {
+            setLoading(false);
+        }
+    }, [key]);
+
+    // Start over whenever the query changes
+    useEffect(() => { load(null, true); }, [load]);
+
+    const loadMore = useCallback(() => {
+        if (!loading && hasMore) load(cursor, false);
+    }, [load, loading, hasMore, cursor]);
+
+    useEffect(() => {
+        if (!sentinelRef.current) return;
+        const observer = new IntersectionObserver(entries => {
+            if (entries[0].isIntersecting) loadMore();
+        }, {rootMargin: '400px'});
+        observer.observe(sentinelRef.current);
+        return () => observer.disconnect();
+    }, [loadMore]);
+
+    useEffect(() => {
+        if (!live || version === null) return;
+        const query = new URLSearchParams({...params, since: version});
+        const stream = new EventSource(`${TICKETS_API}changes/stream/?${query}`);
+        stream.addEventListener('changes', event => {
+            const changes = JSON.parse(event.data);
+            setTickets(current => applyChanges(current, changes));
+        });
+        return () => stream.close();
+    }, [key, live, version]);
+
+    return {tickets, hasMore, loading, loadMore, sentinelRef};
+}
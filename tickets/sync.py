@@ -0,0 +1,179 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from tickets.feed import next_version
+from tickets.jira import JiraClient, get_jira_client
+from tickets.models import PRIORITY_RANKS, SyncState, Ticket
+from tickets.tools import LOCATION_LEVELS
+
+# Custom field holding the FLOOR:HALL:POD:AISLE:RACK location string
+LOCATION_FIELD = "customfield_10200"
+
+# Everything the Ticket mirror stores, so syncs never download the full issue
+SYNC_FIELDS = [
+    "summary", "description", "priority", "status", "assignee",
+    "labels", "created", "updated", LOCATION_FIELD,
+]
+
+# Columns overwritten when an already mirrored issue changes
+_UPDATE_COLUMNS = [
+    "key", "project", "summary", "description", "priority", "priority_rank",
+    "status", "status_category", "assignee", "location", "labels", "created", "updated",
+    "deleted", "version", *LOCATION_LEVELS,
+]
+
+
+def parse_jira_datetime(value: str) -> datetime:
+    """Parse a Jira timestamp such as 2025-11-09T15:13:00.000+0000."""
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+
+def ticket_from_issue(issue: Dict[str, Any]) -> Ticket:
+    """Build an unsaved Ticket from a Jira issue dictionary."""
+    fields = issue["fields"]
+    priority = (fields.get("priority") or {}).get("name", "")
+    status = fields.get("status") or {}
+    assignee = fields.get("assignee") or {}
+
+    ticket = Ticket(
+        key=issue["key"],
+        jira_id=issue["id"],
+        project=issue["key"].rsplit("-", 1)[0],
+        summary=fields.get("summary") or "",
+        description=fields.get("description") or "",
+        priority=priority,
+        priority_rank=PRIORITY_RANKS.get(priority, 0),
+        status=status.get("name", ""),
+        status_category=(status.get("statusCategory") or {}).get("key", ""),
+        assignee=assignee.get("name"),
+        labels=fields.get("labels") or [],
+        created=parse_jira_datetime(fields["created"]),
+        updated=parse_jira_datetime(fields["updated"]),
+    )
+    ticket.set_location(fields.get(LOCATION_FIELD))
+    return ticket
+
+
+def _newer_than_stored(tickets: List[Ticket]) -> List[Ticket]:
+    """Tickets whose (deleted, updated) state is newer than the stored one."""
+    stored = {
+        jira_id: (deleted, updated)
+        for jira_id, deleted, updated in Ticket.objects.filter(jira_id__in=[t.jira_id for t in tickets])
+        .values_list("jira_id", "deleted", "updated")
+    }
+    return [
+        ticket for ticket in tickets
+        if ticket.jira_id not in stored or (ticket.deleted, ticket.updated) > stored[ticket.jira_id]
+    ]
+
+
+def upsert_tickets(tickets: List[Ticket]) -> List[Ticket]:
+    """
+    Insert or update mirrored tickets in one statement, keyed on the Jira id.
+
+    A ticket is skipped unless it is newer than the state the mirror holds,
+    comparing (deleted, updated), so a sync page or webhook read before a
+    newer change never moves a ticket backwards, re-reading an unchanged
+    issue writes nothing, and Jira issues can't be restored, so nothing
+    brings back a tombstone. The tickets written are stamped with a new feed
+    version so dashboards following tickets.feed pick the change up; when
+    nothing is written the version stays put.
+
+    Returns:
+        The tickets actually written
+    """
+    with transaction.atomic():
+        fresh = _newer_than_stored(tickets)
+        if not fresh:
+            return []
+        # Claiming the version locks the counter row, so check again: a
+        # concurrent writer may have stored newer states in the meantime
+        version = next_version()
+        fresh = _newer_than_stored(fresh)
+        for ticket in fresh:
+            ticket.version = version
+        Ticket.objects.bulk_create(
+            fresh,
+            update_conflicts=True,
+            unique_fields=["jira_id"],
+            update_fields=_UPDATE_COLUMNS,
+        )
+    return fresh
+
+
+def _since_jql(watermark: datetime) -> str:
+    """
+    Render a watermark as a JQL date.
+
+    JQL only has minute resolution and reads dates in the Jira user's time
+    zone, so the watermark is shifted back by JIRA_SYNC_OVERLAP to make sure
+    nothing edited around the boundary is missed. Re-reading those issues is
+    harmless because upsert_tickets skips states it already holds.
+    """
+    overlap = timedelta(seconds=getattr(settings, "JIRA_SYNC_OVERLAP", 120))
+    jira_tz = ZoneInfo(getattr(settings, "JIRA_TIMEZONE", "UTC"))
+    since = (watermark - overlap).astimezone(jira_tz)
+    return f'updated >= "{since:%Y/%m/%d %H:%M}"'
+
+
+def sync_issues(
+        client: Optional[JiraClient] = None,
+        project: Optional[str] = None,
+        full: bool = False,
+        batch_size: int = 200
+) -> int:
+    """
+    Pull issues changed since the last sync into the local Ticket tables.
+
+    Issues are read oldest-update first and the watermark is saved after every
+    batch, so an interrupted sync resumes where it stopped. Deleted issues are
+    not visible to an ``updated >=`` search and are left in place.
+
+    Args:
+        client: JiraClient to use (defaults to the shared client)
+        project: Optional project key to limit the sync to
+        full: Ignore the watermark and re-read every issue
+        batch_size: Issues written per database transaction
+
+    Returns:
+        Number of issues synced
+    """
+    client = client or get_jira_client()
+    state, _ = SyncState.objects.get_or_create(name=project or "all")
+
+    clauses = []
+    if project:
+        clauses.append(f"project = {project}")
+    if state.watermark and not full:
+        clauses.append(_since_jql(state.watermark))
+    jql = " AND ".join(clauses) or "project is not EMPTY"
+    jql += " ORDER BY updated ASC"
+
+    synced = 0
+    batch = []
+
+    def flush():
+        with transaction.atomic():
+            upsert_tickets(batch)
+            state.watermark = max([state.watermark or batch[0].updated] + [t.updated for t in batch])
+            state.save(update_fields=["watermark"])
+
+    for issue in client.iter_issues(jql, fields=SYNC_FIELDS, prefetch=True):
+        batch.append(ticket_from_issue(issue))
+        if len(batch) >= batch_size:
+            flush()
+            synced += len(batch)
+            batch = []
+
+    if batch:
+        flush()
+        synced += len(batch)
+
+    state.last_run = timezone.now()
+    state.save(update_fields=["last_run"])
+    return synced
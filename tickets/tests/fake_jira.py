@@ -0,0 +1,435 @@
+"""
+A local stand-in for the parts of the Jira REST API that JiraClient uses.
+
+FakeJira runs an HTTP server on 127.0.0.1 in a background thread, so tests
+and benchmarks exercise the real clients, retries and caches without a
+network. It can add latency to every request, fail requests on demand or at
+random, and generate datasets of any size.
+
+Example:
+    with FakeJira(issues=500, latency=0.05) as jira:
+        client = JiraClient(jira.url, "token")
+        client.search_issues("project = DCM", max_results=None)
+        print(jira.calls("/rest/api/2/search"))
+"""
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from tickets import jira as jira_module
+
+PRIORITIES = ["Highest", "High", "Medium", "Low", "Lowest"]
+STATUSES = [("Open", "new"), ("In Progress", "indeterminate"), ("Done", "done")]
+SUMMARIES = ["PDU down", "Fan failure", "Disk failed", "Switch port flapping", "Cable reseat", "PSU fault"]
+
+_JIRA_TIME = "%Y-%m-%dT%H:%M:%S.000+0000"
+
+_ORDER_BY = re.compile(r"\s+ORDER BY\s+(\w+)(?:\s+(ASC|DESC))?\s*$", re.IGNORECASE)
+_CLAUSES = [
+    (re.compile(r"^project\s*=\s*(\w+)$", re.I), lambda m: lambda i: i["fields"]["project"]["key"] == m[1]),
+    (re.compile(r"^project is not EMPTY$", re.I), lambda m: lambda i: True),
+    (re.compile(r"^assignee is EMPTY$", re.I), lambda m: lambda i: i["fields"]["assignee"] is None),
+    (re.compile(r"^assignee\s*=\s*([\w.@()-]+)$", re.I), lambda m: lambda i: _assignee(i) == m[1]),
+    (re.compile(r"^status\s*=\s*'([^']*)'$", re.I), lambda m: lambda i: i["fields"]["status"]["name"] == m[1]),
+    (re.compile(r'^labels\s*=\s*"([^"]*)"$', re.I), lambda m: lambda i: m[1] in i["fields"]["labels"]),
+    (
+        re.compile(r"^labels in \(([^)]*)\)$", re.I),
+        lambda m: lambda i: bool({label.strip().strip('"') for label in m[1].split(",")} & set(i["fields"]["labels"]))
+    ),
+    (
+        re.compile(r'^updated\s*>=\s*"(\d{4}/\d\d/\d\d \d\d:\d\d)"$', re.I),
+        lambda m: lambda i: i["fields"]["updated"] >= _jql_date(m[1]).strftime(_JIRA_TIME)
+    ),
+]
+_KEY_IN = re.compile(r"^key in \(([^)]*)\)$", re.I)
+
+
+def _assignee(issue: Dict[str, Any]) -> Optional[str]:
+    assignee = issue["fields"]["assignee"]
+    return assignee["name"] if assignee else None
+
+
+def _jql_date(value: str) -> datetime:
+    return datetime.strptime(value, "%Y/%m/%d %H:%M").replace(tzinfo=timezone.utc)
+
+
+class JqlError(ValueError):
+    """A query the fake doesn't understand, answered with 400 like Jira does."""
+
+
+class FakeJira:
+    """
+    In-process fake Jira server.
+
+    Args:
+        issues: Number of issues to generate in project DCM
+        latency: Seconds every request takes (can be changed while running)
+        error_rate: Fraction of requests that fail with error_status
+        error_status: Status returned by random failures
+        assignees: Usernames issues are spread across (plus unassigned ones)
+        groups: Group name -> member usernames, for /group/member
+        seed: Seed for the generated dataset and random failures
+
+    Every assignee and group member is also a user, for /user and /user/search.
+    """
+
+    def __init__(
+            self,
+            issues: int = 0,
+            latency: float = 0.0,
+            error_rate: float = 0.0,
+            error_status: int = 503,
+            assignees: Optional[List[str]] = None,
+            groups: Optional[Dict[str, List[str]]] = None,
+            seed: int = 0
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.assignees = assignees or ["zeke", "alex", "sam"]
+        self.groups = groups or {}
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[Tuple[str, str]] = []
+        self._failures: List[Tuple[int, Dict[str, str], str]] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._next_id = 10000
+        self._server: Optional[ThreadingHTTPServer] = None
+
+        for name in [*self.assignees, *(member for members in self.groups.values() for member in members)]:
+            if name not in self.users:
+                self.add_user(name)
+
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        # Every (len(assignees) + 1)th issue is unassigned
+        owners = [*self.assignees, None]
+        for n in range(issues):
+            self.add_issue(
+                summary=f"{SUMMARIES[n % len(SUMMARIES)]} #{n}",
+                priority=PRIORITIES[n % len(PRIORITIES)],
+                status=STATUSES[n % len(STATUSES)],
+                assignee=owners[n % len(owners)],
+                location=f"{n % 3 + 1}:{n % 4 + 1}:{'ABCD'[n % 4]}:{n % 10 + 1}:{n % 40 + 1}",
+                created=start + timedelta(minutes=n),
+            )
+
+    # Server lifecycle
+
+    def start(self) -> "FakeJira":
+        handler = type("Handler", (_Handler,), {"jira": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        # A short poll interval keeps stop() from waiting half a second
+        threading.Thread(target=self._server.serve_forever, args=(0.01,), daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeJira":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    # Dataset
+
+    def add_issue(
+            self,
+            summary: str,
+            priority: str = "Medium",
+            status: Tuple[str, str] = STATUSES[0],
+            assignee: Optional[str] = None,
+            location: str = "",
+            labels: Optional[List[str]] = None,
+            description: str = "",
+            project: str = "DCM",
+            created: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """Add an issue as if someone had created it in Jira."""
+        with self._lock:
+            self._next_id += 1
+            issue_id = self._next_id
+        created = created or datetime.now(timezone.utc)
+        issue = {
+            "id": str(issue_id),
+            "key": f"{project}-{issue_id - 10000}",
+            "fields": {
+                "project": {"key": project},
+                "summary": summary,
+                "description": description,
+                "priority": {"name": priority},
+                "status": {"name": status[0], "statusCategory": {"key": status[1]}},
+                "assignee": {"name": assignee} if assignee else None,
+                "labels": list(labels or []),
+                "created": created.strftime(_JIRA_TIME),
+                "updated": created.strftime(_JIRA_TIME),
+                "customfield_10200": location,
+                "issuetype": {"name": "Task"},
+            },
+        }
+        with self._lock:
+            self.issues[issue["key"]] = issue
+        return issue
+
+    def add_user(self, name: str, display_name: Optional[str] = None, active: bool = True) -> Dict[str, Any]:
+        """Add a Jira user account."""
+        user = {
+            "name": name,
+            "key": name,
+            "displayName": display_name or name.replace(".", " ").title(),
+            "emailAddress": f"{name}@hyperlynx.us",
+            "active": active,
+        }
+        self.users[name] = user
+        return user
+
+    def update_issue(self, key: str, **fields: Any) -> Dict[str, Any]:
+        """Change raw fields of an issue and bump its updated time."""
+        issue = self.issues[key]
+        issue["fields"].update(fields)
+        issue["fields"]["updated"] = datetime.now(timezone.utc).strftime(_JIRA_TIME)
+        return issue
+
+    # Error injection and request log
+
+    def fail_next(self, status: int, times: int = 1, path: str = "", headers: Optional[Dict[str, str]] = None):
+        """Fail the next `times` requests whose path starts with `path`."""
+        with self._lock:
+            self._failures.extend([(status, headers or {}, path)] * times)
+
+    def calls(self, path: str = "", method: Optional[str] = None) -> int:
+        """Number of requests received whose path starts with `path`."""
+        return sum(
+            1 for m, p in list(self.requests)
+            if p.startswith(path) and (method is None or m == method)
+        )
+
+    def reset(self) -> None:
+        """Forget logged requests and pending failures."""
+        with self._lock:
+            self.requests.clear()
+            self._failures.clear()
+
+    def _injected_failure(self, path: str) -> Optional[Tuple[int, Dict[str, str]]]:
+        with self._lock:
+            for n, (status, headers, prefix) in enumerate(self._failures):
+                if path.startswith(prefix):
+                    del self._failures[n]
+                    return status, headers
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self.error_status, {}
+        return None
+
+    # Endpoints
+
+    def search(self, params: Dict[str, str]) -> Tuple[int, Dict[str, Any]]:
+        jql = params.get("jql", "")
+        try:
+            issues = self._query(jql, strict=params.get("validateQuery", "strict") not in ("warn", "false"))
+        except JqlError as e:
+            return 400, {"errorMessages": [str(e)], "errors": {}}
+        start = int(params.get("startAt", 0))
+        max_results = min(int(params.get("maxResults", 50)), 1000)
+        page = issues[start:start + max_results]
+        return 200, {
+            "startAt": start,
+            "maxResults": max_results,
+            "total": len(issues),
+            "issues": [_project(issue, params.get("fields")) for issue in page],
+        }
+
+    def _query(self, jql: str, strict: bool) -> List[Dict[str, Any]]:
+        order = _ORDER_BY.search(jql)
+        if order:
+            jql = jql[:order.start()]
+
+        with self._lock:
+            issues = list(self.issues.values())
+        for clause in filter(None, (c.strip() for c in re.split(r"\s+AND\s+", jql, flags=re.I))):
+            key_in = _KEY_IN.match(clause)
+            if key_in:
+                keys = {key.strip().strip('"') for key in key_in[1].split(",")}
+                missing = keys - self.issues.keys()
+                if strict and missing:
+                    raise JqlError(f"An issue with key '{sorted(missing)[0]}' does not exist for field 'key'.")
+                issues = [issue for issue in issues if issue["key"] in keys]
+                continue
+            for pattern, build in _CLAUSES:
+                match = pattern.match(clause)
+                if match:
+                    predicate = build(match)
+                    issues = [issue for issue in issues if predicate(issue)]
+                    break
+            else:
+                raise JqlError(f"Error in the JQL Query: unsupported clause {clause!r}")
+
+        if order:
+            field, direction = order[1].lower(), (order[2] or "ASC").upper()
+            sort_key = {
+                "priority": lambda i: -PRIORITIES.index(i["fields"]["priority"]["name"]),
+                "key": lambda i: int(i["id"]),
+            }.get(field, lambda i: i["fields"].get(field) or "")
+            issues.sort(key=sort_key, reverse=direction == "DESC")
+        return issues
+
+    def create(self, fields: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        if not fields.get("summary"):
+            return 400, {"errorMessages": [], "errors": {"summary": "You must specify a summary of the issue."}}
+        issue = self.add_issue(
+            summary=fields["summary"],
+            priority=(fields.get("priority") or {}).get("name", "Medium"),
+            assignee=(fields.get("assignee") or {}).get("name"),
+            location=fields.get("customfield_10200", ""),
+            labels=fields.get("labels"),
+            description=fields.get("description", ""),
+            project=fields["project"]["key"],
+        )
+        return 201, {"id": issue["id"], "key": issue["key"], "self": f"{self.url}/rest/api/2/issue/{issue['id']}"}
+
+    def bulk_create(self, updates: List[Dict[str, Any]]) -> Tuple[int, Dict[str, Any]]:
+        created, errors = [], []
+        for position, update in enumerate(updates):
+            status, body = self.create(update["fields"])
+            if status == 201:
+                created.append(body)
+            else:
+                errors.append({"status": status, "elementErrors": body, "failedElementNumber": position})
+        return (201 if created else 400), {"issues": created, "errors": errors}
+
+
+def _project(issue: Dict[str, Any], fields: Optional[str]) -> Dict[str, Any]:
+    """Apply a ?fields= projection the way Jira does."""
+    if not fields or fields in ("*all", "*navigable"):
+        return issue
+    wanted = set(fields.split(","))
+    return {**issue, "fields": {k: v for k, v in issue["fields"].items() if k in wanted}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    jira: FakeJira
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: Any = None, headers: Optional[Dict[str, str]] = None):
+        data = b"" if body is None else json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if data:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self, method: str):
+        jira = self.jira
+        url = urlparse(self.path)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        with jira._lock:
+            jira.requests.append((method, self.path))
+
+        if jira.latency:
+            time.sleep(jira.latency)
+        failure = jira._injected_failure(url.path)
+        if failure:
+            return self._send(failure[0], {"errorMessages": ["Injected failure"]}, failure[1])
+
+        path = url.path.rstrip("/")
+        if method == "GET" and path == "/rest/api/2/search":
+            return self._send(*jira.search(params))
+        if method == "GET" and path == "/rest/api/2/myself":
+            return self._send(200, {"name": jira.assignees[0], "displayName": jira.assignees[0]})
+        if method == "GET" and path == "/rest/api/2/user":
+            user = jira.users.get(params.get("username"))
+            if user is None:
+                return self._send(404, {"errorMessages": ["The user does not exist."]})
+            return self._send(200, user)
+        if method == "GET" and path == "/rest/api/2/user/search":
+            # "." matches everyone, as on Jira Server; otherwise a name prefix
+            query = params.get("username", "").lower()
+            users = [
+                user for name, user in sorted(jira.users.items())
+                if query == "." or name.lower().startswith(query) or user["displayName"].lower().startswith(query)
+            ]
+            if params.get("includeInactive") != "true":
+                users = [user for user in users if user["active"]]
+            start, size = int(params.get("startAt", 0)), int(params.get("maxResults", 50))
+            return self._send(200, users[start:start + size])
+        if method == "GET" and path == "/rest/api/2/group/member":
+            members = jira.groups.get(params.get("groupname"))
+            if members is None:
+                return self._send(404, {"errorMessages": ["The group does not exist."]})
+            start, size = int(params.get("startAt", 0)), int(params.get("maxResults", 50))
+            return self._send(200, {
+                "startAt": start,
+                "maxResults": size,
+                "total": len(members),
+                "isLast": start + size >= len(members),
+                "values": [{"name": name} for name in members[start:start + size]],
+            })
+        if method == "GET" and path.startswith("/rest/api/2/project/"):
+            key = path.rsplit("/", 1)[1]
+            return self._send(200, {"key": key, "name": key})
+        if method == "POST" and path == "/rest/api/2/issue/bulk":
+            return self._send(*jira.bulk_create(body["issueUpdates"]))
+        if method == "POST" and path == "/rest/api/2/issue":
+            return self._send(*jira.create(body["fields"]))
+
+        match = re.match(r"^/rest/api/2/issue/([A-Z][A-Z0-9_]*-\d+)$", path)
+        if match and match[1] not in jira.issues:
+            return self._send(404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]})
+        if match and method == "GET":
+            issue = _project(jira.issues[match[1]], params.get("fields"))
+            etag = '"%s"' % hashlib.md5(json.dumps(issue, sort_keys=True).encode()).hexdigest()
+            if self.headers.get("If-None-Match") == etag:
+                return self._send(304, headers={"ETag": etag})
+            return self._send(200, issue, {"ETag": etag})
+        if match and method == "PUT":
+            jira.update_issue(match[1], **body.get("fields", {}))
+            return self._send(204)
+
+        self._send(404, {"errorMessages": [f"No fake for {method} {url.path}"]})
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+
+@contextmanager
+def use_fake_jira(jira: FakeJira) -> Iterator[FakeJira]:
+    """Point get_jira_client() and get_async_jira_client() at a running FakeJira."""
+    env = {"JIRA_URL": jira.url, "JIRA_TOKEN": "fake", "JIRA_USERNAME": jira.assignees[0], "JIRA_RATE_LIMIT": "0"}
+    with mock.patch.dict(os.environ, env), \
+            mock.patch.object(jira_module, "_client", None), \
+            mock.patch.object(jira_module, "_async_clients", weakref.WeakKeyDictionary()), \
+            mock.patch.object(jira_module, "_async_state", {}):
+        yield jira
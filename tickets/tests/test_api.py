@@ -0,0 +1,76 @@
+import base64
+import gzip
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from tickets.jira import JiraClient
+from tickets.models import Ticket
+from tickets.sync import sync_issues
+from tickets.tests.fake_jira import FakeJira
+
+
+class TicketApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with FakeJira(issues=120) as jira:
+            sync_issues(JiraClient(jira.url, "token", rate_limit=None))
+        cls.user = get_user_model().objects.create(username="zeke", jira_username="zeke")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def pages(self, **params):
+        keys, cursor = [], None
+        while True:
+            response = self.client.get("/api/v1/tickets/", {**params, **({"cursor": cursor} if cursor else {})})
+            self.assertEqual(response.status_code, 200)
+            keys += [row["key"] for row in response.json()["results"]]
+            cursor = response.json()["next"]
+            if cursor is None:
+                return keys
+
+    def test_cursor_pages_cover_every_ticket_once(self):
+        for sort in ("-created", "created", "-priority", "updated"):
+            with self.subTest(sort=sort):
+                keys = self.pages(sort=sort, limit=25)
+                self.assertEqual(len(keys), 120)
+                self.assertEqual(len(set(keys)), 120)
+
+    def test_priority_sort_is_highest_first(self):
+        keys = self.pages(sort="-priority", limit=50)
+        ranks = dict(Ticket.objects.values_list("key", "priority_rank"))
+
+        self.assertEqual([ranks[key] for key in keys], sorted(ranks.values(), reverse=True))
+
+    def test_fields_and_filters(self):
+        response = self.client.get("/api/v1/tickets/", {"assignee": "me", "fields": "key,assignee", "limit": 200})
+        results = response.json()["results"]
+
+        self.assertEqual(set(results[0]), {"key", "assignee"})
+        self.assertEqual({row["assignee"] for row in results}, {"zeke"})
+        self.assertEqual(len(results), Ticket.objects.filter(assignee="zeke").count())
+
+    def test_bad_requests(self):
+        first = self.client.get("/api/v1/tickets/", {"sort": "-created", "limit": 5}).json()
+
+        for params in ({"sort": "title"}, {"fields": "password"}, {"limit": "lots"},
+                       {"cursor": "garbage"}, {"sort": "updated", "cursor": first["next"]},
+                       {"cursor": base64.urlsafe_b64encode(b'["-created",123,5]').decode()}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get("/api/v1/tickets/", params).status_code, 400)
+
+    def test_responses_are_gzipped(self):
+        response = self.client.get("/api/v1/tickets/", {"limit": 100}, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(len(json.loads(gzip.decompress(response.content))["results"]), 100)
+
+    def test_detail(self):
+        ticket = Ticket.objects.first()
+
+        response = self.client.get(f"/api/v1/tickets/{ticket.key}/", {"fields": "key,location"})
+
+        self.assertEqual(response.json(), {"key": ticket.key, "location": ticket.location})
+        self.assertEqual(self.client.get("/api/v1/tickets/DCM-99999/").status_code, 404)
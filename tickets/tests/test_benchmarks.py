@@ -0,0 +1,100 @@
+"""
+Page latency benchmarks against FakeJira.
+
+Skipped unless HYPERLYNX_BENCHMARK is set, since they take a while:
+
+    HYPERLYNX_BENCHMARK=1 python manage.py test tickets.tests.test_benchmarks
+
+Tune with BENCHMARK_ISSUES (comma-separated dataset sizes), BENCHMARK_LATENCY
+(comma-separated Jira latencies in seconds) and BENCHMARK_REQUESTS (requests
+per page). Database queries per page are reported alongside Jira calls. Set BENCHMARK_OUTPUT to a path to also write the results as JSON.
+"""
+import json
+import os
+import statistics
+import time
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tickets.models import SyncState, Ticket
+from tickets.sync import sync_issues
+from tickets.tests.fake_jira import FakeJira, use_fake_jira
+
+PAGES = {"dashboard": "/dashboard/", "all_tickets": "/all-tickets/"}
+
+
+def _setting(name, default, parse):
+    return [parse(value) for value in os.getenv(name, default).split(",") if value.strip()]
+
+
+def percentiles(samples):
+    """p50, p95 and p99 of a list of timings."""
+    if len(samples) == 1:
+        return samples * 3
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return cuts[49], cuts[94], cuts[98]
+
+
+@skipUnless(os.getenv("HYPERLYNX_BENCHMARK"), "set HYPERLYNX_BENCHMARK=1 to run benchmarks")
+class PageBenchmarks(TestCase):
+    issue_counts = _setting("BENCHMARK_ISSUES", "100,1000,10000", int)
+    latencies = _setting("BENCHMARK_LATENCY", "0,0.05,0.2", float)
+    requests = _setting("BENCHMARK_REQUESTS", "30", int)[0]
+
+    def setUp(self):
+        user = get_user_model().objects.create(username="zeke", jira_username="zeke")
+        self.client.force_login(user)
+
+    def measure(self, jira, url):
+        """Time one cold request (empty caches) and then warm ones."""
+        cache.clear()
+        jira.reset()
+        started = time.perf_counter()
+        self.assertEqual(self.client.get(url).status_code, 200)
+        cold = time.perf_counter() - started
+        cold_calls = jira.calls()
+
+        jira.reset()
+        timings = []
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(self.requests):
+                started = time.perf_counter()
+                self.client.get(url)
+                timings.append(time.perf_counter() - started)
+        return cold, cold_calls, timings, jira.calls() / self.requests, len(queries) / self.requests
+
+    def test_page_latency(self):
+        results = []
+        for issues in self.issue_counts:
+            Ticket.objects.all().delete()
+            SyncState.objects.all().delete()
+            with FakeJira(issues=issues, groups={"Engineers": ["zeke"], "Technicians": []}) as jira, \
+                    use_fake_jira(jira):
+                sync_issues()
+                for latency in self.latencies:
+                    jira.latency = latency
+                    for page, url in PAGES.items():
+                        cold, cold_calls, timings, calls, queries = self.measure(jira, url)
+                        p50, p95, p99 = percentiles(timings)
+                        results.append({
+                            "page": page, "issues": issues, "jira_latency_ms": latency * 1000,
+                            "p50_ms": p50 * 1000, "p95_ms": p95 * 1000, "p99_ms": p99 * 1000,
+                            "cold_ms": cold * 1000, "cold_jira_calls": cold_calls, "jira_calls_per_page": calls,
+                            "db_queries_per_page": queries,
+                        })
+
+        print(f"\n{'page':<12}{'issues':>8}{'jira ms':>9}{'p50':>9}{'p95':>9}{'p99':>9}"
+              f"{'cold':>9}{'cold calls':>12}{'calls/page':>12}{'queries/page':>14}")
+        for row in results:
+            print(f"{row['page']:<12}{row['issues']:>8}{row['jira_latency_ms']:>9.0f}{row['p50_ms']:>9.1f}"
+                  f"{row['p95_ms']:>9.1f}{row['p99_ms']:>9.1f}{row['cold_ms']:>9.1f}"
+                  f"{row['cold_jira_calls']:>12}{row['jira_calls_per_page']:>12.2f}{row['db_queries_per_page']:>14.2f}")
+
+        if os.getenv("BENCHMARK_OUTPUT"):
+            with open(os.environ["BENCHMARK_OUTPUT"], "w") as output:
+                json.dump(results, output, indent=2)
@@ -0,0 +1,155 @@
+import json
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from tickets.chat import compact_history, get_session
+from tickets.jira import JiraClient
+from tickets.jobs import current_chat_session, enqueue_ticket, process_jobs
+from tickets.models import ChatSession, TicketJob
+from tickets.resilience import RetryPolicy
+from tickets.tests.fake_jira import FakeJira
+
+
+def turn(role, text):
+    return {"role": role, "parts": [{"text": text}]}
+
+
+class ChatSessionTests(TestCase):
+    def test_sessions_belong_to_their_user(self):
+        owner = get_user_model().objects.create(username="zeke")
+        other = get_user_model().objects.create(username="alex")
+        session = get_session(None, owner)
+
+        self.assertEqual(get_session(str(session.id), owner).pk, session.pk)
+        self.assertNotEqual(get_session(str(session.id), other).pk, session.pk)
+        self.assertNotEqual(get_session("not-a-uuid", owner).pk, session.pk)
+
+    @override_settings(CHAT_MAX_HISTORY=6)
+    def test_old_turns_are_folded_into_a_summary(self):
+        session = ChatSession(history=[turn("user" if n % 2 == 0 else "model", f"message {n}") for n in range(8)])
+        summarized = []
+
+        def summarize(turns, previous):
+            summarized.extend(turns)
+            return "the user reported a PDU failure"
+
+        compact_history(session, summarize)
+
+        # Half the limit is kept, starting at a message the user typed
+        self.assertEqual([t["parts"][0]["text"] for t in session.history], ["message 6", "message 7"])
+        self.assertEqual(len(summarized), 6)
+        self.assertEqual(session.summary, "the user reported a PDU failure")
+
+    @override_settings(CHAT_MAX_HISTORY=6)
+    def test_turns_are_dropped_if_summarizing_fails(self):
+        session = ChatSession(history=[turn("user" if n % 2 == 0 else "model", f"message {n}") for n in range(8)])
+
+        def summarize(turns, previous):
+            raise RuntimeError("Gemini is down")
+
+        with self.assertLogs("tickets.chat", "WARNING") as logs:
+            compact_history(session, summarize)
+
+        self.assertEqual(len(session.history), 2)
+        self.assertEqual(session.summary, "")
+        self.assertIn("Gemini is down", logs.output[0])
+
+
+class ChatApiTests(TestCase):
+    def post(self, message):
+        return self.client.post("/api/chat/", json.dumps({"message": message}), content_type="application/json")
+
+    def test_the_chat_session_is_only_current_during_the_reply(self):
+        seen = []
+        chat = mock.Mock(get_history=mock.Mock(return_value=[]))
+        chat.send_message.side_effect = lambda message: seen.append(current_chat_session.get()) or mock.Mock(text="On it")
+
+        with mock.patch("tickets.views.get_gemini_client") as gemini:
+            gemini.return_value.chats.create.return_value = chat
+            response = self.post("PDU down in 1:1:A:1:1")
+
+        self.assertEqual(response.json()["reply"], "On it")
+        self.assertEqual(str(seen[0].id), response.json()["session_id"])
+        self.assertIsNone(current_chat_session.get())
+
+    def test_gemini_errors_are_logged(self):
+        with mock.patch("tickets.views.get_gemini_client", side_effect=RuntimeError("Gemini is down")), \
+                self.assertLogs("tickets.views", "ERROR") as logs:
+            response = self.post("PDU down")
+
+        self.assertEqual(response.status_code, 500)
+        self.assertIn("Gemini is down", logs.output[0])
+        self.assertIsNone(current_chat_session.get())
+
+
+@override_settings(TICKET_JOB_BACKOFF=0)
+class TicketJobTests(TestCase):
+    def setUp(self):
+        self.jira = FakeJira().start()
+        self.addCleanup(self.jira.stop)
+        self.client = JiraClient(self.jira.url, "token", retry_policy=RetryPolicy(max_retries=0), rate_limit=None)
+        self.addCleanup(self.client.close)
+
+    def test_jobs_create_issues_and_link_to_the_chat(self):
+        session = ChatSession.objects.create()
+        token = current_chat_session.set(session)
+        self.addCleanup(current_chat_session.reset, token)
+
+        job = enqueue_ticket(project_key="DCM", summary="PDU down", custom_fields={"customfield_10200": "1:1:A:1:1"})
+        process_jobs(client=self.client)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, TicketJob.DONE)
+        self.assertEqual(job.chat_session, session)
+        self.assertEqual(self.jira.issues[job.issue_key]["fields"]["labels"], [f"hyperlynx-job-{job.pk}"])
+
+    def test_transient_failures_are_retried_without_duplicates(self):
+        job = enqueue_ticket(project_key="DCM", summary="PDU down")
+        self.jira.fail_next(503, path="/rest/api/2/issue")
+
+        process_jobs(client=self.client)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (TicketJob.DONE, 2))
+        self.assertEqual(len(self.jira.issues), 1)
+
+    def test_rejected_issues_fail_without_retrying(self):
+        job = enqueue_ticket(project_key="DCM", summary="")
+
+        process_jobs(client=self.client)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (TicketJob.FAILED, 1))
+
+    def test_rejected_requests_fail_without_retrying(self):
+        job = enqueue_ticket(project_key="DCM", summary="PDU down")
+        self.jira.fail_next(401, path="/rest/api/2/issue/bulk")
+
+        process_jobs(client=self.client)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (TicketJob.FAILED, 1))
+        self.assertTrue(job.error.startswith("HTTP 401"))
+
+    def test_jobs_share_one_bulk_request(self):
+        jobs = [enqueue_ticket(project_key="DCM", summary=summary) for summary in ["PDU down", "", "Fan failure"]]
+
+        process_jobs(client=self.client)
+
+        statuses = [TicketJob.objects.get(pk=job.pk).status for job in jobs]
+        self.assertEqual(statuses, [TicketJob.DONE, TicketJob.FAILED, TicketJob.DONE])
+        self.assertEqual(self.jira.calls("/rest/api/2/issue/bulk"), 1)
+        self.assertEqual(self.jira.calls(method="POST"), 1)
+
+    @override_settings(TICKET_JOB_MAX_ATTEMPTS=3)
+    def test_unexpected_errors_are_recorded_on_the_job(self):
+        # No summary: building the request raises KeyError
+        job = enqueue_ticket(project_key="DCM")
+
+        process_jobs(client=self.client)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (TicketJob.FAILED, 3))
+        self.assertTrue(job.error.startswith("KeyError"))
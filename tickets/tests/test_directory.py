@@ -0,0 +1,103 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from tickets.directory import find_user, search_users, sync_directory
+from tickets.jira import JiraClient
+from tickets.models import JiraGroupMember, JiraUser
+from tickets.tests.fake_jira import FakeJira, use_fake_jira
+from users.forms import JIRAUsernameForm
+
+
+class DirectoryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.jira = FakeJira(groups={"Engineers": ["zeke"], "Technicians": ["alex", "sam"]}).start()
+        self.addCleanup(self.jira.stop)
+        self.jira.add_user("pat.lee", display_name="Patricia Lee")
+        self.client = JiraClient(self.jira.url, "token", rate_limit=None)
+        self.addCleanup(self.client.close)
+
+    def test_sync_mirrors_users_and_groups(self):
+        counts = sync_directory(self.client)
+
+        self.assertEqual(counts["created"], 4)
+        self.assertEqual(counts["memberships"], 3)
+        self.assertEqual(
+            set(JiraGroupMember.objects.values_list("group", "user__name")),
+            {("Engineers", "zeke"), ("Technicians", "alex"), ("Technicians", "sam")}
+        )
+
+    def test_resync_only_writes_changes(self):
+        sync_directory(self.client)
+        self.jira.users["alex"]["displayName"] = "Alex Kim"
+        del self.jira.users["sam"]
+        self.jira.groups["Technicians"].remove("sam")
+
+        counts = sync_directory(self.client)
+
+        self.assertEqual(counts, {"created": 0, "updated": 1, "deactivated": 1, "memberships": 1})
+        self.assertEqual(JiraUser.objects.get(name="alex").display_name, "Alex Kim")
+        self.assertFalse(JiraUser.objects.get(name="sam").active)
+
+    def test_find_user_prefers_the_directory(self):
+        sync_directory(self.client)
+        self.jira.reset()
+
+        self.assertEqual(find_user("ZEKE", self.client).name, "zeke")
+        self.assertEqual(self.jira.calls(), 0)
+
+    def test_unknown_users_are_checked_with_jira_once(self):
+        self.assertIsNone(find_user("zeek", self.client))
+        self.assertIsNone(find_user("zeek", self.client))
+        self.assertEqual(self.jira.calls("/rest/api/2/user"), 1)
+
+        self.jira.add_user("new.hire")
+        self.assertEqual(find_user("new.hire", self.client).name, "new.hire")
+
+    def test_search_matches_name_and_display_name_prefixes(self):
+        sync_directory(self.client)
+
+        self.assertEqual([user.name for user in search_users("pa")], ["pat.lee"])
+        self.assertEqual([user.name for user in search_users("patricia l")], ["pat.lee"])
+        self.assertEqual(search_users(""), [])
+
+
+class DirectoryLoginTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.jira = FakeJira(issues=20, groups={"Engineers": ["zeke"], "Technicians": []}).start()
+        self.addCleanup(self.jira.stop)
+        self.enterContext(use_fake_jira(self.jira))
+        sync_directory()
+        self.jira.reset()
+        self.user = get_user_model().objects.create(username="auth0|123")
+
+    def test_profile_form_rejects_unknown_usernames(self):
+        form = JIRAUsernameForm({"jira_username": "zeek"}, instance=self.user)
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("Did you mean zeke?", form.errors["jira_username"][0])
+
+    def test_profile_form_stores_jiras_spelling(self):
+        form = JIRAUsernameForm({"jira_username": "Zeke"}, instance=self.user)
+
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data["jira_username"], "zeke")
+
+    def test_autocomplete(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get("/auth/jira-users/", {"q": "ze"})
+
+        self.assertEqual(response.json()["results"][0]["name"], "zeke")
+
+    def test_dashboard_roles_come_from_the_directory(self):
+        self.user.jira_username = "zeke"
+        self.user.save()
+        self.client.force_login(self.user)
+
+        response = self.client.get("/dashboard/")
+
+        self.assertEqual(response.context["user_role"], "engineer")
+        self.assertEqual(self.jira.calls(), 0)
@@ -0,0 +1,113 @@
+import asyncio
+import json
+import time
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from tickets.feed import VersionWatcher, current_version, ticket_changes
+from tickets.jira import JiraClient
+from tickets.models import Ticket, WebhookEvent
+from tickets.sync import sync_issues
+from tickets.tests.fake_jira import FakeJira
+from tickets.webhooks import apply_events
+
+
+class TicketFeedTests(TestCase):
+    def setUp(self):
+        self.jira = FakeJira(issues=60).start()
+        self.addCleanup(self.jira.stop)
+        sync_issues(JiraClient(self.jira.url, "token", rate_limit=None))
+        self.user = get_user_model().objects.create(username="zeke", jira_username="zeke")
+        self.client.force_login(self.user)
+
+    def webhook(self, key, kind="jira:issue_updated"):
+        payload = {"webhookEvent": kind, "issue": self.jira.issues[key], "timestamp": int(time.time() * 1000)}
+        apply_events([WebhookEvent.objects.create(payload=payload)])
+
+    def changes(self, since, **params):
+        response = self.client.get("/api/v1/tickets/changes/", {"since": since, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_changes_since_the_first_page(self):
+        mine = list(Ticket.objects.filter(assignee="zeke").order_by("key").values_list("key", flat=True))
+        version = self.client.get("/api/v1/tickets/", {"assignee": "me"}).json()["version"]
+
+        self.jira.update_issue(mine[0], summary="Rack 7 smoking")
+        self.webhook(mine[0])
+        self.jira.update_issue(mine[1], assignee={"name": "alex"})
+        self.webhook(mine[1])
+        self.webhook(mine[2], "jira:issue_deleted")
+        new = self.jira.add_issue("PDU down", assignee="zeke")
+        self.webhook(new["key"], "jira:issue_created")
+
+        changes = self.changes(version, assignee="me", fields="key,summary")
+
+        self.assertEqual(
+            {row["key"]: row["summary"] for row in changes["results"]},
+            {mine[0]: "Rack 7 smoking", new["key"]: "PDU down"}
+        )
+        self.assertEqual(sorted(changes["removed"]), sorted(mine[1:3]))
+        self.assertFalse(changes["more"])
+        # Nothing new since then
+        later = self.changes(changes["version"], assignee="me")
+        self.assertEqual((later["results"], later["removed"], later["version"]), ([], [], changes["version"]))
+
+    def test_syncing_unchanged_issues_leaves_the_feed_alone(self):
+        client = JiraClient(self.jira.url, "token", rate_limit=None)
+        self.addCleanup(client.close)
+        self.jira.update_issue("DCM-3", summary="Rack 7 smoking")
+        sync_issues(client)
+        version = current_version()
+        since = ticket_changes(Ticket.objects.live())["version"]
+
+        # The JIRA_SYNC_OVERLAP window re-reads DCM-3 (and other recent edits)
+        sync_issues(client)
+
+        self.assertEqual(current_version(), version)
+        changes = ticket_changes(Ticket.objects.live(), since=since)
+        self.assertEqual((changes["results"], changes["removed"], changes["version"]), ([], [], since))
+
+    def test_large_batches_are_split_without_losing_rows(self):
+        keys, since = [], None
+        while True:
+            changes = ticket_changes(Ticket.objects.live(), since=since, fields=["key"], limit=25)
+            keys += [row["key"] for row in changes["results"]]
+            since = changes["version"]
+            if not changes["more"]:
+                break
+
+        self.assertEqual(sorted(keys), sorted(Ticket.objects.values_list("key", flat=True)))
+
+    def test_bad_tokens(self):
+        self.assertEqual(self.client.get("/api/v1/tickets/changes/", {"since": "yesterday"}).status_code, 400)
+
+    @override_settings(TICKET_FEED_POLL_INTERVAL=0.01, TICKET_FEED_HEARTBEAT=0.05, TICKET_FEED_STREAM_TTL=0.2)
+    async def test_stream_sends_changes_without_calling_jira(self):
+        await self.async_client.aforce_login(self.user)
+        self.jira.reset()
+
+        response = await self.async_client.get("/api/v1/tickets/changes/stream/", {"since": "0", "fields": "key"})
+        body = b"".join([chunk async for chunk in response.streaming_content]).decode()
+
+        event = body.split("event: changes\ndata: ", 1)[1].split("\n", 1)[0]
+        self.assertEqual(len(json.loads(event)["results"]), await Ticket.objects.live().acount())
+        self.assertIn(": keep-alive", body)
+        self.assertEqual(self.jira.calls(), 0)
+
+
+class VersionWatcherTests(TestCase):
+    def test_streams_share_one_poll(self):
+        versions = iter([5, 5, 6, 6, 6, 6])
+        with mock.patch("tickets.feed.current_version", side_effect=lambda: next(versions)) as read:
+            watcher = VersionWatcher(interval=0.02)
+
+            async def open_dashboards():
+                return await asyncio.gather(*[watcher.wait(after=5, timeout=1) for _ in range(100)])
+
+            results = asyncio.run(open_dashboards())
+
+        self.assertEqual(set(results), {6})
+        self.assertLessEqual(read.call_count, 4)
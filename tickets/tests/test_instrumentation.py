@@ -0,0 +1,70 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from tickets.instrumentation import collect_jira_calls, endpoint_label, metrics
+from tickets.jira import JiraClient
+from tickets.resilience import RetryPolicy
+from tickets.tests.fake_jira import FakeJira, use_fake_jira
+
+
+class JiraCallTests(SimpleTestCase):
+    def setUp(self):
+        self.jira = FakeJira(issues=10).start()
+        self.addCleanup(self.jira.stop)
+        self.client = JiraClient(self.jira.url, "token", retry_policy=RetryPolicy(max_retries=0), rate_limit=None)
+        self.addCleanup(self.client.close)
+
+    def test_endpoints_are_labelled_without_ids(self):
+        self.assertEqual(endpoint_label("/rest/api/2/issue/DCM-42"), "/rest/api/2/issue/{id}")
+        self.assertEqual(endpoint_label("/rest/api/2/project/DCM"), "/rest/api/2/project/{key}")
+        self.assertEqual(endpoint_label("/rest/api/2/search?jql=x"), "/rest/api/2/search")
+
+    def test_calls_are_collected_with_cache_results(self):
+        with collect_jira_calls() as calls:
+            self.client.get_issue("DCM-1")
+            self.client.get_issue("DCM-1")
+            self.jira.fail_next(503)
+            self.client.get_issue("DCM-1")
+
+        self.assertEqual([call.status for call in calls], [200, 304, 503])
+        self.assertEqual([call.cache for call in calls], ["miss", "revalidated", "stale"])
+        self.assertGreater(calls[0].bytes, 0)
+        self.assertEqual(calls[0].endpoint, "/rest/api/2/issue/{id}")
+
+    def test_calls_outside_a_request_are_only_counted(self):
+        self.client.get_project("DCM")
+
+        self.assertIn('jira_requests_total{cache="miss",endpoint="/rest/api/2/project/{key}"', metrics.render())
+
+
+class JiraTimingMiddlewareTests(TestCase):
+    def setUp(self):
+        self.jira = FakeJira(issues=10, groups={"Engineers": ["zeke"], "Technicians": []}).start()
+        self.addCleanup(self.jira.stop)
+        self.enterContext(use_fake_jira(self.jira))
+        cache.clear()
+        self.user = get_user_model().objects.create(username="zeke", jira_username="zeke")
+        self.client.force_login(self.user)
+
+    def test_server_timing_counts_the_jira_calls(self):
+        with self.assertLogs("tickets.middleware", "INFO") as logs:
+            response = self.client.get("/dashboard/")
+
+        # Looking up the user's role reads both role groups
+        self.assertIn('desc="2 calls, 0 cached"', response["Server-Timing"])
+        line = json.loads(logs.records[-1].getMessage())
+        self.assertEqual((line["view"], line["jira_calls"]), ("dashboard", 2))
+        self.assertEqual(line["calls"][0]["endpoint"], "/rest/api/2/group/member")
+
+    def test_metrics_are_staff_only(self):
+        self.assertEqual(self.client.get("/metrics/").status_code, 302)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get("/metrics/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("# TYPE view_duration_seconds histogram", response.content.decode())
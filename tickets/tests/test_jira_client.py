@@ -0,0 +1,260 @@
+import asyncio
+import gc
+import threading
+from unittest import mock
+
+import httpx
+import requests
+from django.test import SimpleTestCase
+
+from tickets import jira as jira_module
+from tickets.jira import AsyncJiraClient, JiraClient, get_async_jira_client
+from tickets.resilience import CircuitBreaker, JiraUnavailableError, RetryPolicy
+from tickets.tests.fake_jira import FakeJira, use_fake_jira
+
+# Retry quickly so failure tests stay fast
+FAST_RETRIES = RetryPolicy(max_retries=2, backoff_base=0.01, backoff_cap=0.01)
+
+
+class JiraClientTests(SimpleTestCase):
+    def setUp(self):
+        self.jira = FakeJira(issues=250).start()
+        self.addCleanup(self.jira.stop)
+        self.client = JiraClient(self.jira.url, "token", retry_policy=FAST_RETRIES, rate_limit=None)
+        self.addCleanup(self.client.close)
+
+    def test_iter_issues_pages_through_results(self):
+        issues = list(self.client.iter_issues("project = DCM ORDER BY created ASC", page_size=100))
+
+        self.assertEqual(len(issues), 250)
+        self.assertEqual(issues[0]["key"], "DCM-1")
+        self.assertEqual(self.jira.calls("/rest/api/2/search"), 3)
+
+    def test_prefetch_returns_the_same_issues(self):
+        jql = "project = DCM ORDER BY created ASC"
+        plain = [issue["key"] for issue in self.client.iter_issues(jql, page_size=50)]
+        prefetched = [issue["key"] for issue in self.client.iter_issues(jql, page_size=50, prefetch=True)]
+
+        self.assertEqual(plain, prefetched)
+
+    def test_limit_stops_paging_early(self):
+        issues = self.client.search_issues("project = DCM", max_results=120)
+
+        self.assertEqual(len(issues), 120)
+        self.assertEqual(self.jira.calls("/rest/api/2/search"), 2)
+
+    def test_default_fields_are_projected(self):
+        issue = self.client.get_all_issues(project="DCM", max_results=1)[0]
+
+        self.assertEqual(set(issue["fields"]), {"summary", "created", "priority", "status"})
+
+    def test_get_issues_batches_keys_and_skips_missing_ones(self):
+        issues = self.client.get_issues(["DCM-3", "DCM-1", "DCM-3", "DCM-9999"])
+
+        self.assertEqual(list(issues), ["DCM-3", "DCM-1"])
+        self.assertEqual(self.jira.calls("/rest/api/2/search"), 1)
+
+    def test_get_issues_rejects_malformed_keys(self):
+        with self.assertRaises(ValueError):
+            self.client.get_issues(["DCM-1) OR (project = SECRET"])
+
+    def test_concurrent_get_issues_share_one_request(self):
+        self.jira.latency = 0.2
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.client.get_issues(["DCM-1", "DCM-2"])))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(list(result) == ["DCM-1", "DCM-2"] for result in results))
+        self.assertEqual(self.jira.calls("/rest/api/2/search"), 1)
+
+    def test_get_issue_revalidates_with_etag(self):
+        first = self.client.get_issue("DCM-1")
+        second = self.client.get_issue("DCM-1")
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.client.response_cache.stats()["hits"], 1)
+
+        self.jira.update_issue("DCM-1", summary="Changed")
+        self.assertEqual(self.client.get_issue("DCM-1")["fields"]["summary"], "Changed")
+
+    def test_callers_cannot_change_the_cached_issue(self):
+        self.client.get_issue("DCM-1")["fields"]["summary"] = "Edited locally"
+        revalidated = self.client.get_issue("DCM-1")
+        revalidated["fields"].clear()
+
+        self.assertEqual(self.client.response_cache.stats()["hits"], 1)
+        summary = self.jira.issues["DCM-1"]["fields"]["summary"]
+        self.assertEqual(self.client.get_issue("DCM-1")["fields"]["summary"], summary)
+
+    def test_transient_errors_are_retried(self):
+        self.jira.fail_next(503, times=2)
+
+        issues = self.client.search_issues("project = DCM", max_results=10)
+
+        self.assertEqual(len(issues), 10)
+        self.assertEqual(self.jira.calls("/rest/api/2/search"), 3)
+
+    def test_client_errors_are_not_retried(self):
+        self.jira.fail_next(400)
+
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.client.search_issues("project = DCM", max_results=10)
+        self.assertEqual(self.jira.calls(), 1)
+
+    def test_stale_response_is_served_while_jira_is_down(self):
+        fresh = self.client.get_all_issues(project="DCM", max_results=5)
+        self.jira.fail_next(503, times=3)
+
+        self.assertEqual(self.client.get_all_issues(project="DCM", max_results=5), fresh)
+
+    def test_circuit_breaker_stops_calls_after_repeated_failures(self):
+        client = JiraClient(
+            self.jira.url, "token",
+            retry_policy=RetryPolicy(max_retries=0),
+            circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+            rate_limit=None,
+            stale_cache_size=0
+        )
+        self.addCleanup(client.close)
+        self.jira.error_rate = 1.0
+
+        for _ in range(2):
+            with self.assertRaises(requests.exceptions.HTTPError):
+                client.get_project("DCM")
+        with self.assertRaises(JiraUnavailableError):
+            client.get_project("DCM")
+        self.assertEqual(self.jira.calls(), 2)
+
+    def test_unexpected_errors_end_the_breakers_trial_call(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        client = JiraClient(self.jira.url, "token", circuit_breaker=breaker, rate_limit=None)
+        self.addCleanup(client.close)
+        breaker.record_failure()
+
+        with mock.patch.object(client.session, "request", side_effect=requests.exceptions.ChunkedEncodingError):
+            with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+                client.get_project("DCM")
+
+        # The failed trial reopened the breaker instead of leaving it stuck
+        self.assertTrue(breaker.allow())
+
+    def test_bulk_create_reports_rejected_rows(self):
+        result = self.client.create_issues([
+            {"project_key": "DCM", "summary": "PDU down"},
+            {"project_key": "DCM", "summary": ""},
+            {"project_key": "DCM", "summary": "Fan failure"},
+        ])
+
+        self.assertEqual([issue["index"] for issue in result["created"]], [0, 2])
+        self.assertEqual([issue["index"] for issue in result["failed"]], [1])
+        self.assertEqual(self.jira.calls("/rest/api/2/issue/bulk"), 1)
+
+    def test_bulk_create_reports_the_status_of_failed_requests(self):
+        self.jira.fail_next(401, path="/rest/api/2/issue/bulk")
+
+        result = self.client.create_issues([{"project_key": "DCM", "summary": "PDU down"}])
+
+        self.assertEqual([(issue["index"], issue["status"]) for issue in result["failed"]], [(0, 401)])
+
+
+class AsyncJiraClientTests(SimpleTestCase):
+    def setUp(self):
+        self.jira = FakeJira(issues=120).start()
+        self.addCleanup(self.jira.stop)
+
+    def run_with_client(self, coroutine_function):
+        async def main():
+            client = AsyncJiraClient(self.jira.url, "token", retry_policy=FAST_RETRIES, rate_limit=None)
+            try:
+                return await coroutine_function(client)
+            finally:
+                await client.close()
+        return asyncio.run(main())
+
+    def test_search_issues(self):
+        issues = self.run_with_client(lambda client: client.search_issues("project = DCM", max_results=None))
+
+        self.assertEqual(len(issues), 120)
+
+    def test_create_issue_errors_are_logged(self):
+        self.jira.fail_next(400, path="/rest/api/2/issue")
+
+        with self.assertLogs("tickets.jira", "WARNING") as logs, self.assertRaises(httpx.HTTPStatusError):
+            self.run_with_client(lambda client: client.create_issue("DCM", "PDU down"))
+
+        self.assertIn("Could not create issue in DCM", logs.output[0])
+
+    def test_get_issue_handles_not_modified(self):
+        async def fetch_twice(client):
+            return await client.get_issue("DCM-5"), await client.get_issue("DCM-5")
+
+        first, second = self.run_with_client(fetch_twice)
+
+        self.assertEqual(first, second)
+
+    def test_concurrent_get_issues_share_one_request(self):
+        self.jira.latency = 0.1
+
+        async def fetch(client):
+            return await asyncio.gather(*[client.get_issues(["DCM-1", "DCM-2"]) for _ in range(5)])
+
+        results = self.run_with_client(fetch)
+
+        self.assertTrue(all(list(result) == ["DCM-1", "DCM-2"] for result in results))
+        self.assertEqual(self.jira.calls("/rest/api/2/search"), 1)
+
+    def test_iter_users_matches_the_sync_client(self):
+        async def names(client):
+            return [user["name"] async for user in client.iter_users(page_size=2)]
+
+        sync_client = JiraClient(self.jira.url, "token", rate_limit=None)
+        self.addCleanup(sync_client.close)
+
+        self.assertEqual(self.run_with_client(names), [user["name"] for user in sync_client.iter_users(page_size=2)])
+
+    def test_loop_clients_are_closed_with_their_loop(self):
+        async def shared_client():
+            return get_async_jira_client()
+
+        with use_fake_jira(self.jira):
+            first = asyncio.run(shared_client())
+            second = asyncio.run(shared_client())
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.session.is_closed)
+        # Each loop gets its own connections but one breaker, rate limiter and set of caches
+        self.assertIs(first.circuit_breaker, second.circuit_breaker)
+        self.assertIs(first.response_cache, second.response_cache)
+
+    def test_closed_loops_are_forgotten(self):
+        async def shared_client():
+            get_async_jira_client()
+
+        with use_fake_jira(self.jira):
+            for _ in range(20):
+                asyncio.run(shared_client())
+            gc.collect()
+
+            self.assertEqual(len(jira_module._async_clients), 0)
+            self.assertEqual(len(jira_module._async_closers), 0)
+
+    def test_unexpected_errors_end_the_breakers_trial_call(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        async def fetch(client):
+            client.circuit_breaker = breaker
+            with mock.patch.object(client.session, "request", side_effect=httpx.DecodingError("bad gzip")):
+                with self.assertRaises(httpx.DecodingError):
+                    await client.get_project("DCM")
+
+        self.run_with_client(fetch)
+
+        self.assertTrue(breaker.allow())
@@ -0,0 +1,96 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from tickets.models import Ticket
+from tickets.search import FTS_TRIGGERS, restore_fts_triggers, search_tickets
+from tickets.tools import LOCATION_LEVELS
+
+LOCATIONS = ["1:1:A:1:1", "1:1:A:1:2", "1:1:A:2:1", "1:1:B:1:1", "1:2:A:1:1", "2:1:A:1:1", "pod b somewhere"]
+
+
+def make_ticket(n, location, **fields):
+    ticket = Ticket(
+        key=f"DCM-{n}", jira_id=str(n), project="DCM", summary=f"Ticket {n}",
+        created=timezone.now(), updated=timezone.now(), **fields
+    )
+    ticket.set_location(location)
+    ticket.save()
+    return ticket
+
+
+class LocationQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for n, location in enumerate(LOCATIONS, start=1):
+            make_ticket(n, location)
+        make_ticket(100, "1:1:A:1:1", status_category="done")
+        cls.user = get_user_model().objects.create(username="zeke", jira_username="zeke")
+
+    def keys(self, queryset):
+        return sorted(queryset.values_list("key", flat=True))
+
+    def test_prefix_at_every_level(self):
+        expected = {
+            "floor": (("1",), 6),
+            "hall": (("1", "1"), 5),
+            "pod": (("1", "1", "a"), 4),
+            "aisle": (("1", "1", "A", "1"), 3),
+            "rack": (("1", "1", "A", "1", "1"), 2),
+        }
+        for level, (values, count) in expected.items():
+            with self.subTest(level=level):
+                levels = dict(zip(LOCATION_LEVELS, values))
+                self.assertEqual(Ticket.objects.at_location(**levels).count(), count)
+
+    def test_unparsed_locations_have_no_levels(self):
+        ticket = Ticket.objects.get(key="DCM-7")
+
+        self.assertEqual((ticket.location, ticket.floor, ticket.rack), ("pod b somewhere", "", ""))
+
+    def test_gapped_levels_are_rejected(self):
+        with self.assertRaises(ValueError):
+            Ticket.objects.at_location(floor="1", pod="A")
+
+    def test_rollup_counts(self):
+        rollup = Ticket.objects.at_location(floor="1", hall="1").location_rollup("pod")
+
+        self.assertEqual([(row["pod"], row["count"]) for row in rollup], [("A", 4), ("B", 1)])
+
+    def test_rollup_view(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get("/api/tickets/locations/", {"floor": "1", "open": 1})
+
+        self.assertEqual(response.json(), {
+            "prefix": {"floor": "1"},
+            "level": "hall",
+            "counts": [{"value": "1", "count": 4}, {"value": "2", "count": 1}],
+            "total": 5,
+        })
+        self.assertEqual(self.client.get("/api/tickets/locations/", {"floor": "1", "pod": "A"}).status_code, 400)
+
+
+class SearchTriggerTests(TestCase):
+    def triggers(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+            return {row[0] for row in cursor.fetchall()}
+
+    def test_triggers_survive_migrations(self):
+        # The test database was built by running every migration
+        self.assertTrue(set(FTS_TRIGGERS) <= self.triggers())
+
+        make_ticket(1, "1:1:A:1:1")
+        self.assertEqual([row["key"] for row in search_tickets("ticket")["results"]], ["DCM-1"])
+
+    def test_missing_triggers_are_restored_and_the_index_rebuilt(self):
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER tickets_ticket_fts_ai")
+        make_ticket(1, "1:1:A:1:1")
+
+        self.assertTrue(restore_fts_triggers(connection))
+        self.assertFalse(restore_fts_triggers(connection))
+        self.assertTrue(set(FTS_TRIGGERS) <= self.triggers())
+        self.assertEqual([row["key"] for row in search_tickets("ticket")["results"]], ["DCM-1"])
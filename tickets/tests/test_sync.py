@@ -0,0 +1,171 @@
+import time
+from urllib.parse import quote
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from tickets.dedup import find_duplicates
+from tickets.jira import JiraClient
+from tickets.models import SyncState, Ticket, WebhookEvent
+from tickets.search import search_tickets
+from tickets.jobs import enqueue_ticket
+from tickets.sync import LOCATION_FIELD, sync_issues
+from tickets.tests.fake_jira import FakeJira, use_fake_jira
+from tickets.webhooks import apply_events
+
+
+class SyncTests(TestCase):
+    def setUp(self):
+        self.jira = FakeJira(issues=300).start()
+        self.addCleanup(self.jira.stop)
+        self.client = JiraClient(self.jira.url, "token", rate_limit=None)
+        self.addCleanup(self.client.close)
+
+    def test_full_sync_mirrors_every_issue(self):
+        self.assertEqual(sync_issues(self.client, project="DCM", batch_size=100), 300)
+
+        self.assertEqual(Ticket.objects.count(), 300)
+        ticket = Ticket.objects.get(key="DCM-2")
+        self.assertEqual(ticket.summary, "Fan failure #1")
+        self.assertEqual((ticket.floor, ticket.hall, ticket.pod), ("2", "2", "B"))
+        self.assertIsNotNone(SyncState.objects.get(name="DCM").watermark)
+
+    def test_incremental_sync_only_reads_recent_changes(self):
+        sync_issues(self.client, project="DCM")
+        self.jira.update_issue("DCM-7", summary="Rack 7 smoking")
+        self.jira.reset()
+
+        synced = sync_issues(self.client, project="DCM")
+
+        # Issues edited inside the JIRA_SYNC_OVERLAP window are read again too
+        self.assertLess(synced, 10)
+        self.assertEqual(Ticket.objects.get(key="DCM-7").summary, "Rack 7 smoking")
+        self.assertEqual(self.jira.calls("/rest/api/2/search"), 1)
+
+    def test_sync_is_idempotent(self):
+        sync_issues(self.client, project="DCM")
+        sync_issues(self.client, project="DCM", full=True)
+
+        self.assertEqual(Ticket.objects.count(), 300)
+
+    def test_sync_never_moves_tickets_backwards(self):
+        sync_issues(self.client, project="DCM")
+        newer = {**self.jira.issues["DCM-3"]}
+        newer["fields"] = {**newer["fields"], "summary": "PDU replaced", "updated": "2099-01-01T00:00:00.000+0000"}
+        deleted = self.jira.issues["DCM-4"]
+        apply_events([
+            WebhookEvent.objects.create(payload={"webhookEvent": "jira:issue_updated", "issue": newer}),
+            WebhookEvent.objects.create(payload={
+                "webhookEvent": "jira:issue_deleted", "issue": deleted, "timestamp": int(time.time() * 1000)
+            }),
+        ])
+
+        # Jira (here: a stale search page) still returns the older states
+        sync_issues(self.client, project="DCM", full=True)
+
+        self.assertEqual(Ticket.objects.get(key="DCM-3").summary, "PDU replaced")
+        self.assertTrue(Ticket.objects.get(key="DCM-4").deleted)
+
+
+class WebhookTests(TestCase):
+    def event(self, issue, kind="jira:issue_updated", **extra):
+        return WebhookEvent.objects.create(payload={"webhookEvent": kind, "issue": issue, **extra})
+
+    def test_replayed_older_event_does_not_win(self):
+        jira = FakeJira()
+        issue = jira.add_issue("PDU down", location="1:1:A:1:1")
+        old = {**issue, "fields": {**issue["fields"], "updated": "2020-01-01T00:00:00.000+0000"}}
+        jira.update_issue(issue["key"], summary="PDU replaced")
+
+        apply_events([self.event(issue)])
+        apply_events([self.event(old)])
+
+        self.assertEqual(Ticket.objects.get(key=issue["key"]).summary, "PDU replaced")
+        self.assertFalse(WebhookEvent.objects.exists())
+
+    @override_settings(JIRA_WEBHOOK_SECRET="s3cret")
+    def test_webhook_rejects_wrong_secrets(self):
+        for secret in ("wrong", "s\u00e9cret"):
+            with self.subTest(secret=secret):
+                response = self.client.post(f"/api/jira/webhook/?secret={quote(secret)}", {}, "application/json")
+                self.assertEqual(response.status_code, 403)
+
+    def test_deletion_leaves_a_tombstone(self):
+        issue = FakeJira().add_issue("PDU down")
+
+        apply_events([self.event(issue, "jira:issue_deleted", timestamp=int(time.time() * 1000))])
+        apply_events([self.event(issue)])
+
+        self.assertTrue(Ticket.objects.get(key=issue["key"]).deleted)
+        self.assertFalse(Ticket.objects.live().exists())
+
+
+class MirrorQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with FakeJira(issues=200) as jira:
+            sync_issues(JiraClient(jira.url, "token", rate_limit=None))
+
+    def test_search_ranks_summary_matches(self):
+        results = search_tickets("pdu", page_size=5)["results"]
+
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all("PDU" in result["title"] for result in results))
+
+    def test_find_duplicates_at_the_same_rack(self):
+        ticket = Ticket.objects.live().exclude(status_category="done").filter(summary__startswith="PDU").first()
+
+        duplicates = find_duplicates(ticket.location, "pdu is down")
+
+        self.assertIn(ticket.key, [duplicate.get("key") for duplicate in duplicates])
+        self.assertEqual(find_duplicates(ticket.location, "replace fan tray"), [])
+
+    def test_find_duplicates_in_the_job_queue(self):
+        job = enqueue_ticket(project_key="DCM", summary="Fan tray loud", custom_fields={LOCATION_FIELD: "9:9:z:9:9"})
+        enqueue_ticket(project_key="DCM", summary="Fan tray loud", custom_fields={LOCATION_FIELD: "9:9:Z:9:8"})
+
+        # One indexed lookup for tickets and one for queued jobs at the rack
+        with self.assertNumQueries(2):
+            duplicates = find_duplicates("9:9:Z:9:9", "fan tray is loud")
+
+        self.assertEqual([duplicate.get("job_id") for duplicate in duplicates], [job.pk])
+
+
+class PageTests(TestCase):
+    def setUp(self):
+        self.jira = FakeJira(issues=100, groups={"Engineers": ["zeke"], "Technicians": ["alex"]}).start()
+        self.addCleanup(self.jira.stop)
+        self.enterContext(use_fake_jira(self.jira))
+        cache.clear()
+        sync_issues()
+        self.jira.reset()
+
+        user = get_user_model().objects.create(username="zeke", jira_username="zeke")
+        self.client.force_login(user)
+
+    def test_dashboard_reads_the_mirror(self):
+        response = self.client.get("/dashboard/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["user_role"], "engineer")
+        # Only group membership comes from Jira, and only until it is cached
+        self.assertEqual(self.jira.calls("/rest/api/2/search"), 0)
+        calls = self.jira.calls()
+        self.client.get("/dashboard/")
+        self.assertEqual(self.jira.calls(), calls)
+
+    def test_all_tickets(self):
+        response = self.client.get("/all-tickets/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.jira.calls("/rest/api/2/search"), 0)
+
+    def test_pages_redirect_anonymous_users_to_login(self):
+        self.client.logout()
+
+        for path in ("/dashboard/", "/all-tickets/"):
+            with self.subTest(path=path):
+                response = self.client.get(path)
+                self.assertEqual(response.status_code, 302)
+                self.assertTrue(response["Location"].endswith("?next=" + path))
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, astuple
 from enum import Enum
+from typing import Optional
 
 class Priority(Enum):
     LOWEST = "Lowest"
@@ -19,3 +20,26 @@ class Ticket:
     project_key: str = "DCM"
     issue_type: str = "Task"
 
+
+
+# Levels of a FLOOR:HALL:POD:AISLE:RACK location, outermost first
+LOCATION_LEVELS = ("floor", "hall", "pod", "aisle", "rack")
+
+@dataclass(frozen=True)
+class Location:
+    floor: str
+    hall: str
+    pod: str
+    aisle: str
+    rack: str
+
+    @classmethod
+    def parse(cls, value: Optional[str]) -> Optional["Location"]:
+        """Parse a FLOOR:HALL:POD:AISLE:RACK string, or return None if it isn't one."""
+        parts = [part.strip().upper() for part in (value or "").split(":")]
+        if len(parts) != len(LOCATION_LEVELS) or not all(parts):
+            return None
+        return cls(*parts)
+
+    def __str__(self):
+        return ":".join(astuple(self))
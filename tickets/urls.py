@@ -6,7 +6,17 @@ urlpatterns = [
     path('', views.dashboard, name="index"),
     # path('test', views.test_page, name="testpage"),
     path('api/chat/', views.chat_api, name='gemini-chat'),
+    path('api/chat/stream/', views.chat_stream, name='gemini-chat-stream'),
+    path('api/chat/jobs/', views.chat_jobs, name='gemini-chat-jobs'),
+    path('api/jira/webhook/', views.jira_webhook, name='jira-webhook'),
+    path('metrics/', views.metrics, name='metrics'),
 
     path('all-tickets/', views.all_tickets, name="all_tickets"),
+    path('api/tickets/search/', views.ticket_search, name="ticket_search"),
+    path('api/v1/tickets/', views.ticket_list_api, name="ticket_list_api"),
+    path('api/v1/tickets/changes/', views.ticket_changes_api, name="ticket_changes_api"),
+    path('api/v1/tickets/changes/stream/', views.ticket_changes_stream, name="ticket_changes_stream"),
+    path('api/v1/tickets/<str:key>/', views.ticket_detail_api, name="ticket_detail_api"),
+    path('api/tickets/locations/', views.location_rollup, name="location_rollup"),
     path('dashboard/', views.dashboard, name="dashboard")
 ]
\ No newline at end of file
@@ -1,18 +1,35 @@
+import asyncio
+import hmac
+import logging
 import time
 
+from asgiref.sync import sync_to_async
+
 from django.contrib.auth import logout as django_logout
 from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
+from django.contrib.auth.views import redirect_to_login
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
+from django.views.decorators.gzip import gzip_page
 import os
-from json import dumps as json_dump
-
-from django.utils.safestring import mark_safe
-from dotenv import load_dotenv
 
-from tickets.jira import JiraClient
+from tickets.chat import SUMMARY_PROMPT, compact_history, get_session, serialize_history, system_instruction
+from tickets.dedup import find_duplicates
+from tickets.feed import current_version, decode_version, encode_version, get_version_watcher, ticket_changes
+from tickets import instrumentation
+from tickets.api import API_FIELDS, DEFAULT_SORT, parse_fields, ticket_detail, ticket_page
+from tickets.gemini import GEMINI_MODEL, content_config, get_gemini_client
+from tickets.jobs import current_chat_session, enqueue_ticket, job_status
+from tickets.models import ChatSession, Ticket, TicketJob
+from tickets.roles import get_role_resolver
+from tickets.search import SEARCH_FILTERS, search_tickets
+from tickets.tools import LOCATION_LEVELS
+from tickets.webhooks import ISSUE_EVENTS, enqueue_event
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
 
 # Create your views here.
@@ -20,99 +37,215 @@ def index(request):
     return render(request, "index.html")
 
 
-def all_tickets(request):
-    j = JiraClient(base_url=os.getenv("JIRA_URL"), token=os.getenv("JIRA_TOKEN"))
-
-    engineers = j.get_group_members("Engineers")
-    technicians = j.get_group_members("Technicians")
-
-    # Match Jira user by email
-    user = request.user.jira_username
-
-    # Determine role based on membership
-    if any(member.get("name") == user for member in engineers):
-        user_role = "engineer"
-    elif any(member.get("name") == user for member in technicians):
-        user_role = "data_technician"
-    else:
-        # Default fallback
-        user_role = "data_technician"
-    issues = [
-        {
-            'id': issue['id'],
-            'key': issue['key'],
-            'title': issue['fields']['summary'],
-            'date': issue['fields']['created'],
-            'priority': issue['fields']['priority']['name']
-        } for issue in j.get_all_issues()
-    ]
+def _load_user(request):
+    # request.user is lazy; touching it loads the user on this thread
+    request.user.is_authenticated
+    return request.user
 
-    return render(
-        request,
-        "all_tickets.html",
-        context={"issues": mark_safe(issues), "user_role": user_role}
-    )
 
+async def _get_user(request):
+    # Resolve request.user on a sync thread since it may hit the database
+    return await sync_to_async(_load_user)(request)
+
+
+async def all_tickets(request):
+    user = await _get_user(request)
+    if not user.is_authenticated:
+        return redirect_to_login(request.get_full_path())
+
+    user_role = await get_role_resolver().aresolve(user.jira_username)
+
+    # The page fetches tickets itself, a page at a time, from ticket_list_api
+    return render(request, "all_tickets.html", context={"user_role": user_role})
 
-# def dashboard(request):
-#     return render(request, "dashboard.html") #testing dashboard
 
 @login_required
-def dashboard(request):
-    # Get Jira group members
-    j = JiraClient(base_url=os.getenv("JIRA_URL"), token=os.getenv("JIRA_TOKEN"))
-    engineers = j.get_group_members("Engineers")
-    technicians = j.get_group_members("Technicians")
-
-    # Match Jira user by email
-    user = request.user.jira_username
-
-    # Determine role based on membership
-    if any(member.get("name") == user for member in engineers):
-        user_role = "engineer"
-    elif any(member.get("name") == user for member in technicians):
-        user_role = "data_technician"
-    else:
-        # Default fallback
-        user_role = "data_technician"
-
-
-
-
-    user_issues = [
-        {
-            'id': issue['id'],
-            'help': "we",
-            'key': issue['key'],
-            'title': issue['fields']['summary'],
-            'date': issue['fields']['created'],
-            'priority': issue['fields']['priority']['name']
-        } for issue in j.get_user_issues(username=request.user.jira_username)
-    ]
-    sug_issues = [
-        {
-            'id': issue['id'],
-            'help': "we",
-            'key': issue['key'],
-            'title': issue['fields']['summary'],
-            'date': issue['fields']['created'],
-            'priority': issue['fields']['priority']['name']
-        } for issue in j.get_unassigned_issues(project="DCM")
-    ]
+def ticket_search(request):
+    try:
+        page = max(1, int(request.GET.get('page', 1)))
+        page_size = min(100, max(1, int(request.GET.get('page_size', 25))))
+    except ValueError:
+        return JsonResponse({'error': 'page and page_size must be integers'}, status=400)
+
+    filters = {
+        column: request.GET[column] for column in SEARCH_FILTERS if request.GET.get(column)
+    }
+    if request.GET.get('unassigned'):
+        filters['assignee'] = None
+
+    results = search_tickets(request.GET.get('q', ''), page=page, page_size=page_size, filters=filters)
+    return JsonResponse(results)
+
+
+# Compact separators; the JSON API responses are also gzipped
+COMPACT_JSON = {'separators': (',', ':')}
+
+
+def _api_error(message, status=400):
+    return JsonResponse({'error': message}, status=status)
+
+
+def _filter_tickets(params, user):
+    # The live tickets selected by the list API's query string filters
+    tickets = Ticket.objects.live()
+    assignee = params.get('assignee')
+    if assignee == 'me':
+        assignee = user.jira_username
+    if assignee:
+        tickets = tickets.filter(assignee=assignee)
+    if params.get('unassigned'):
+        tickets = tickets.filter(assignee__isnull=True)
+    for column in ('project', 'priority', 'status_category'):
+        if params.get(column):
+            tickets = tickets.filter(**{column: params[column]})
+    if params.get('open'):
+        tickets = tickets.exclude(status_category='done')
+    return tickets
+
+
+@login_required
+@gzip_page
+def ticket_list_api(request):
+    # Version 1 of the ticket list API: /api/v1/tickets/?sort=-priority&fields=key,summary&cursor=...
+    try:
+        limit = int(request.GET.get('limit', 50))
+    except ValueError:
+        return _api_error('limit must be an integer')
+
+    # Read before the page so the feed can't miss a change made meanwhile
+    version = None if request.GET.get('cursor') else current_version()
+    try:
+        page = ticket_page(
+            _filter_tickets(request.GET, request.user),
+            sort=request.GET.get('sort', DEFAULT_SORT),
+            cursor=request.GET.get('cursor'),
+            limit=limit,
+            fields=parse_fields(request.GET.get('fields'))
+        )
+    except ValueError as e:
+        return _api_error(str(e))
+    if version is not None:
+        # Starting point for ticket_changes_api / ticket_changes_stream
+        page['version'] = encode_version(version)
+    return JsonResponse(page, json_dumps_params=COMPACT_JSON)
 
-    return render(request, "dashboard.html", {
-        "sug_iss": mark_safe(json_dump(sug_issues)),
-        "user_role": user_role,
-        "issues": mark_safe(json_dump(user_issues))
+
+@login_required
+@gzip_page
+def ticket_changes_api(request):
+    # Tickets changed since ?since=<version>, with the same filters and
+    # fields as ticket_list_api, so a list can be refreshed without reloading
+    try:
+        changes = ticket_changes(
+            _filter_tickets(request.GET, request.user),
+            since=request.GET.get('since'),
+            fields=parse_fields(request.GET.get('fields'))
+        )
+    except ValueError as e:
+        return _api_error(str(e))
+    return JsonResponse(changes, json_dumps_params=COMPACT_JSON)
+
+
+@login_required
+async def ticket_changes_stream(request):
+    # ticket_changes_api as server-sent events: a "changes" event whenever
+    # the mirror moves past the client's version, and a comment every
+    # TICKET_FEED_HEARTBEAT seconds to keep proxies from closing the stream.
+    # The stream ends after TICKET_FEED_STREAM_TTL seconds; EventSource then
+    # reconnects and resumes from Last-Event-ID. Serve the ASGI app
+    # (hyperlynx.asgi) so open streams don't each hold a worker thread.
+    user = await _get_user(request)
+    # On reconnect EventSource sends the last event's id, which is newer than ?since=
+    since = request.headers.get('Last-Event-ID') or request.GET.get('since')
+    try:
+        fields = parse_fields(request.GET.get('fields'))
+        version, _ = decode_version(since)
+    except ValueError as e:
+        return _api_error(str(e))
+    tickets = _filter_tickets(request.GET, user)
+    watcher = get_version_watcher()
+    heartbeat = getattr(settings, 'TICKET_FEED_HEARTBEAT', 15)
+
+    async def events():
+        nonlocal since, version
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + getattr(settings, 'TICKET_FEED_STREAM_TTL', 300)
+        while loop.time() < deadline:
+            latest = await watcher.wait(after=version, timeout=min(heartbeat, deadline - loop.time()))
+            if latest <= version:
+                yield ': keep-alive\n\n'
+                continue
+            more = True
+            while more:
+                changes = await sync_to_async(ticket_changes)(tickets, since=since, fields=fields)
+                since, more = changes['version'], changes['more']
+                yield _sse(changes, event='changes', id=since)
+            version, _ = decode_version(since)
+
+    response = StreamingHttpResponse(events(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@login_required
+@gzip_page
+def ticket_detail_api(request, key):
+    try:
+        fields = parse_fields(request.GET.get('fields') or ','.join(API_FIELDS))
+        ticket = Ticket.objects.live().get(key=key)
+    except ValueError as e:
+        return _api_error(str(e))
+    except Ticket.DoesNotExist:
+        return _api_error(f'No ticket {key}', status=404)
+    return JsonResponse(ticket_detail(ticket, fields), json_dumps_params=COMPACT_JSON)
+
+
+@login_required
+def location_rollup(request):
+    # Prefix from the query string, outermost level first (e.g. ?floor=1&hall=3)
+    prefix = {level: request.GET[level] for level in LOCATION_LEVELS[:-1] if request.GET.get(level)}
+    level = LOCATION_LEVELS[len(prefix)]
+
+    tickets = Ticket.objects.live()
+    if request.GET.get('open'):
+        tickets = tickets.exclude(status_category='done')
+    try:
+        tickets = tickets.at_location(**prefix)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    counts = [
+        {'value': row[level], 'count': row['count']} for row in tickets.location_rollup(level)
+    ]
+    return JsonResponse({
+        'prefix': prefix,
+        'level': level,
+        'counts': counts,
+        'total': sum(row['count'] for row in counts)
     })
 
 
+# def dashboard(request):
+#     return render(request, "dashboard.html") #testing dashboard
+
+async def dashboard(request):
+    # login_required's async path calls request.auser(), which needs
+    # aget_user() on every backend, and social_core's Auth0 backend lacks it
+    user = await _get_user(request)
+    if not user.is_authenticated:
+        return redirect_to_login(request.get_full_path())
+
+    user_role = await get_role_resolver().aresolve(user.jira_username)
+
+    # The user's and suggested tickets are fetched by the page from ticket_list_api
+    return render(request, "dashboard.html", {"user_role": user_role})
+
+
 # * GEMINI!!!!!!!=====================================================================
 # Imports*****
 import base64
 
-from google import genai
-from google.genai import types
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 
@@ -159,12 +292,22 @@ def isJSON(string_to_validate):
         }
 
 
+def _duplicate_links(duplicates):
+    # Give Gemini a link it can offer the user for each existing ticket
+    base_url = os.getenv("JIRA_URL", "https://jira.hyperlynx.us").rstrip("/")
+    for duplicate in duplicates:
+        if "key" in duplicate:
+            duplicate["url"] = f"{base_url}/browse/{duplicate['key']}"
+    return duplicates
+
+
 def pass_new_ticket(
         summary: str,
         description: str,
         priority: str,
         labels: List[str],
-        location: str
+        location: str,
+        create_anyway: bool = False
 ) -> dict[str, Any]:
     """ Tool that accepts parsed ticket data from the user's prompt,
         creates a structured JIRATicket object, and processes it.
@@ -175,20 +318,64 @@ def pass_new_ticket(
             priority: The urgency level (e.g., 'High', 'Medium').
             labels: A list of tags to categorize the ticket.
             location: A string formatted FLOOR:HALL:POD:AISLE:RACK
+            create_anyway: True once the user has confirmed the ticket isn't a duplicate.
 
         Returns:
-            The result of creating a new ticket
+            The queued ticket's job id; the ticket is created in the background.
+            If open tickets at the location look like the same failure, nothing is
+            created and the likely duplicates are returned instead.
         """
-    api_client = JiraClient(base_url=os.getenv("JIRA_URL"), token=os.getenv("JIRA_TOKEN"))
+    if not create_anyway:
+        duplicates = find_duplicates(location, summary)
+        if duplicates:
+            return {"status": "possible_duplicate", "duplicates": _duplicate_links(duplicates)}
 
-    response = api_client.create_issue("DCM", summary, description=description, priority=priority, custom_fields={
-        "customfield_10200": location,
-    })
+    # Created by `manage.py process_ticket_jobs` so a slow Jira can't stall the chat
+    job = enqueue_ticket(project_key="DCM", summary=summary, description=description, priority=priority,
+                         custom_fields={"customfield_10200": location})
 
-    return response
+    return {"job_id": job.pk, "status": job.status}
+
+
+def pass_new_tickets(
+        summary: str,
+        description: str,
+        priority: str,
+        labels: List[str],
+        locations: List[str],
+        create_anyway: bool = False
+) -> dict[str, Any]:
+    """ Tool for one failure reported at several racks: creates a ticket
+        per location in the background.
+
+        Args:
+            summary: The concise title shared by every ticket.
+            description: The detailed body shared by every ticket.
+            priority: The urgency level (e.g., 'High', 'Medium').
+            labels: A list of tags to categorize the tickets.
+            locations: Strings formatted FLOOR:HALL:POD:AISLE:RACK, one per ticket
+            create_anyway: True once the user has confirmed the tickets aren't duplicates.
+
+        Returns:
+            The queued tickets' job ids. Locations that already have an open ticket
+            for the same failure are skipped and listed with their likely duplicates.
+        """
+    duplicates = {}
+    if not create_anyway:
+        for location in locations:
+            found = find_duplicates(location, summary)
+            if found:
+                duplicates[location] = _duplicate_links(found)
+
+    jobs = [
+        enqueue_ticket(project_key="DCM", summary=summary, description=description, priority=priority,
+                       custom_fields={"customfield_10200": location})
+        for location in locations if location not in duplicates
+    ]
+
+    return {"job_ids": [job.pk for job in jobs], "status": TicketJob.PENDING, "duplicates": duplicates}
 
 
-client = genai.Client(api_key=os.getenv('GEMINI_API_KEY'))
 TICKET_MASTER_PROMPT = """
 You are the ticket master. Engineers come to you to make tickets about failures happening within the datacenter. You are looking for the following fields:
 LOCATION (Must give a: floor, hall, pod, aisle, and rack, must have all 5 with no other locations)
@@ -205,47 +392,167 @@ using LOCATION, SUMMARY, DESCRIPTION generate one or two worded descriptions of
 reformat LOCATION to match the "FLOOR:HALL:POD:AISLE:RACK" format
 
 Pass it into the tool given to you.
+Tickets are created in the background, so tell the user their ticket has been queued rather than giving a ticket key.
+If the same failure affects several racks, collect every LOCATION and pass them all to pass_new_tickets once instead of calling pass_new_ticket for each.
+If a tool reports possible duplicates, show the user the existing tickets (with their links) and ask whether one of them is the same failure.
+If it is, do not create a new ticket; point them to the existing one. If they say it is a different failure, call the tool again with create_anyway set to true.
 Thank the user, do not prompt the user for any more things.
 """
 
 
+def _summarize_chat(turns, previous_summary):
+    # Condenses turns dropped from a chat session (see tickets.chat)
+    transcript = "\n".join(
+        f"{turn['role']}: {part['text']}"
+        for turn in turns for part in turn.get("parts", []) if "text" in part
+    )
+    if previous_summary:
+        transcript = f"Earlier summary: {previous_summary}\n{transcript}"
+    response = get_gemini_client().models.generate_content(
+        model=GEMINI_MODEL,
+        contents=transcript,
+        config=content_config(system_instruction=SUMMARY_PROMPT)
+    )
+    return response.text or previous_summary
+
+
 @csrf_exempt
 def chat_api(request):
     if request.method == 'POST':
         try:
             data = json.loads(request.body)
             user_message = data.get('message', '')
-            history = data.get('history', '')
-            chat = client.chats.create(model="gemini-2.5-flash",
-                                       history=history,
-                                       config=types.GenerateContentConfig(
-                                           system_instruction=TICKET_MASTER_PROMPT,
-                                           tools=[pass_new_ticket]
-                                       )
-                                       )
-
             if not user_message:
                 return JsonResponse({'error': 'Message cannot be empty'}, status=400)
 
-            response = chat.send_message(user_message)
-            if response.function_calls:
-                print("It beckons")
-                return JsonResponse({'done': True, 'reply': response.text})
+            # The conversation lives server-side; clients only send the new message
+            session = get_session(data.get('session_id'), request.user)
+            # Reset afterwards so the session doesn't stick to this worker thread
+            token = current_chat_session.set(session)
+            try:
+                chat = get_gemini_client().chats.create(model=GEMINI_MODEL,
+                                           history=session.history,
+                                           config=content_config(
+                                               system_instruction=system_instruction(TICKET_MASTER_PROMPT, session),
+                                               tools=[pass_new_ticket, pass_new_tickets]
+                                           )
+                                           )
+
+                response = chat.send_message(user_message)
+            finally:
+                current_chat_session.reset(token)
+
+            session.history = serialize_history(chat.get_history())
+            compact_history(session, _summarize_chat)
+            session.save()
+
+            return JsonResponse({'done': True, 'reply': response.text, 'session_id': str(session.id)})
+
+        except Exception:
+            logger.exception("Gemini chat request failed")
+            return JsonResponse({'error': 'An error occurred while contacting the AI.'}, status=500)
+
+    return JsonResponse({'detail': 'Method not allowed'}, status=405)
+
 
-            history.append({
-                "role": "user",
-                "parts": [{"text": user_message}]
-            })
-            history.append({
-                "role": "user",
-                "parts": [{"text": user_message}]
-            })
+def _sse(data, event=None, id=None):
+    # One server-sent event; JSON keeps newlines in model text off the wire
+    prefix = f"id: {id}\n" if id else ""
+    prefix += f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
 
-            # 3. Return AI response
-            return JsonResponse({'done': True, 'reply': response.text})
+
+@csrf_exempt
+async def chat_stream(request):
+    # Same as chat_api, but streams Gemini's reply as server-sent events.
+    # Serve the ASGI app (hyperlynx.asgi) so the open stream holds a
+    # coroutine rather than a worker thread.
+    if request.method != 'POST':
+        return JsonResponse({'detail': 'Method not allowed'}, status=405)
+
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    user_message = data.get('message', '')
+    if not user_message:
+        return JsonResponse({'error': 'Message cannot be empty'}, status=400)
+
+    user = await _get_user(request)
+    session = await sync_to_async(get_session)(data.get('session_id'), user)
+
+    async def events():
+        current_chat_session.set(session)
+        yield _sse({'session_id': str(session.id)}, event='session')
+        try:
+            chat = get_gemini_client().aio.chats.create(model=GEMINI_MODEL,
+                                           history=session.history,
+                                           config=content_config(
+                                               system_instruction=system_instruction(TICKET_MASTER_PROMPT, session),
+                                               tools=[pass_new_ticket, pass_new_tickets]
+                                           )
+                                           )
+            reply = []
+            async for chunk in await chat.send_message_stream(user_message):
+                if chunk.text:
+                    reply.append(chunk.text)
+                    yield _sse({'text': chunk.text})
+
+            session.history = serialize_history(chat.get_history())
+            await sync_to_async(compact_history)(session, _summarize_chat)
+            await session.asave()
+            yield _sse({'done': True, 'reply': "".join(reply)}, event='done')
 
         except Exception as e:
-            print(f"Gemini API Error: {e}")
-            return JsonResponse({'error': 'An error occurred while contacting the AI.'}, status=500)
+            logger.warning("Gemini stream for chat %s failed: %s", session.id, e)
+            yield _sse({'error': 'An error occurred while contacting the AI.'}, event='error')
 
-    return JsonResponse({'detail': 'Method not allowed'}, status=405)
+    response = StreamingHttpResponse(events(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+def chat_jobs(request):
+    # Ticket jobs queued during a chat session, polled by the chat UI
+    owner = request.user if request.user.is_authenticated else None
+    try:
+        session = ChatSession.objects.get(pk=request.GET.get('session_id'), user=owner)
+    except (ChatSession.DoesNotExist, ValidationError):
+        return JsonResponse({'error': 'Unknown chat session'}, status=404)
+
+    return JsonResponse({'jobs': [job_status(job) for job in session.ticket_jobs.order_by('pk')]})
+
+
+@csrf_exempt
+def jira_webhook(request):
+    if request.method != 'POST':
+        return JsonResponse({'detail': 'Method not allowed'}, status=405)
+
+    # Jira can't send custom headers, so the secret may also come in the URL
+    secret = request.headers.get('X-Hyperlynx-Webhook-Secret') or request.GET.get('secret', '')
+    # compare_digest only accepts ASCII str, so compare the UTF-8 bytes
+    if not settings.JIRA_WEBHOOK_SECRET or not hmac.compare_digest(
+            secret.encode(), settings.JIRA_WEBHOOK_SECRET.encode()):
+        return JsonResponse({'detail': 'Forbidden'}, status=403)
+
+    try:
+        payload = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+
+    if payload.get('webhookEvent') not in ISSUE_EVENTS:
+        return JsonResponse({'queued': False})
+
+    # Applied in batches by `manage.py process_webhooks`
+    enqueue_event(payload)
+    return JsonResponse({'queued': True}, status=202)
+
+
+@staff_member_required
+def metrics(request):
+    # Jira call and per-view counters for Prometheus, from this worker only
+    return HttpResponse(
+        instrumentation.metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
@@ -0,0 +1,75 @@
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, List
+
+from django.db import transaction
+
+from tickets.models import Ticket, WebhookEvent
+from tickets.sync import ticket_from_issue, upsert_tickets
+
+ISSUE_EVENTS = ("jira:issue_created", "jira:issue_updated", "jira:issue_deleted")
+
+
+def enqueue_event(payload: Dict[str, Any]) -> WebhookEvent:
+    """Store a webhook delivery for process_events to apply later."""
+    return WebhookEvent.objects.create(payload=payload)
+
+
+def _ticket_from_event(payload: Dict[str, Any]) -> Ticket:
+    """Build the Ticket state an event describes."""
+    ticket = ticket_from_issue(payload["issue"])
+    if payload["webhookEvent"] == "jira:issue_deleted":
+        ticket.deleted = True
+        # Date the tombstone at the deletion so older replays lose to it
+        if "timestamp" in payload:
+            deleted_at = datetime.fromtimestamp(payload["timestamp"] / 1000, tz=dt_timezone.utc)
+            ticket.updated = max(ticket.updated, deleted_at)
+    return ticket
+
+
+def apply_events(events: List[WebhookEvent]) -> int:
+    """
+    Apply a batch of webhook events to the Ticket mirror.
+
+    Only the newest state per issue is written, and upsert_tickets skips a
+    state unless it is newer than the one in the mirror, so replaying or
+    reordering deliveries never moves a ticket backwards. Jira issues can't
+    be restored, so a deletion beats any other state.
+
+    Returns:
+        Number of tickets written
+    """
+    latest: Dict[str, Ticket] = {}
+    for event in events:
+        try:
+            ticket = _ticket_from_event(event.payload)
+        except (KeyError, TypeError, ValueError) as e:
+            event.error = f"{type(e).__name__}: {e}"
+            continue
+        current = latest.get(ticket.jira_id)
+        if current is None or (ticket.deleted, ticket.updated) >= (current.deleted, current.updated):
+            latest[ticket.jira_id] = ticket
+
+    with transaction.atomic():
+        # upsert_tickets skips states no newer than the mirror's
+        changed = upsert_tickets(list(latest.values())) if latest else []
+        failed = [event for event in events if event.error]
+        WebhookEvent.objects.bulk_update(failed, ["error"])
+        WebhookEvent.objects.filter(pk__in=[event.pk for event in events if not event.error]).delete()
+
+    return len(changed)
+
+
+def process_events(batch_size: int = 500) -> int:
+    """
+    Drain queued webhook events in batches.
+
+    Returns:
+        Number of events consumed (including ones that failed to parse)
+    """
+    consumed = 0
+    while True:
+        events = list(WebhookEvent.objects.filter(error="").order_by("pk")[:batch_size])
+        if not events:
+            return consumed
+        apply_events(events)
+        consumed += len(events)
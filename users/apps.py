@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.contrib.auth.signals import user_logged_out
+from django.db.models.signals import post_delete, post_save
 
 
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        from users import checks  # noqa: F401 (registers the system checks)
+        from users.auth import _user_changed, _user_logged_out
+
+        # Keep cached users (see users.auth) in step with the database
+        user_model = self.get_model('Users')
+        post_save.connect(_user_changed, sender=user_model)
+        post_delete.connect(_user_changed, sender=user_model)
+        user_logged_out.connect(_user_logged_out)
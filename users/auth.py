@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.core.cache import caches
+from django.utils.crypto import constant_time_compare
+
+
+def _user_cache():
+    return caches[settings.USER_CACHE] if settings.USER_CACHE else None
+
+
+def _cache_key(user_id) -> str:
+    return f"users:user:{user_id}"
+
+
+def get_cached_user(request):
+    """
+    Resolve the session's user from the cache, loading it on a miss.
+
+    Works like ``django.contrib.auth.get_user`` (same backend and session
+    hash checks) but keeps the user in settings.USER_CACHE for
+    USER_CACHE_TTL seconds, so a warm request needs no database query. The
+    entry is dropped whenever the user is saved or deleted, or logs out
+    (see ``invalidate_user``). With USER_CACHE set to None this is plain
+    ``get_user``.
+
+    Example:
+        request.user = SimpleLazyObject(lambda: get_cached_user(request))
+    """
+    cache = _user_cache()
+    try:
+        user_id = request.session[SESSION_KEY]
+        backend_path = request.session[BACKEND_SESSION_KEY]
+    except KeyError:
+        return auth.get_user(request)
+    if cache is None or backend_path not in settings.AUTHENTICATION_BACKENDS:
+        return auth.get_user(request)
+
+    user = cache.get(_cache_key(user_id))
+    session_hash = request.session.get(HASH_SESSION_KEY)
+    if user is not None and session_hash and constant_time_compare(session_hash, user.get_session_auth_hash()):
+        return user
+
+    # Miss, or a hash that needs Django's fallback-secret and flush handling
+    user = auth.get_user(request)
+    if user.is_authenticated:
+        cache.set(_cache_key(user.pk), user, timeout=settings.USER_CACHE_TTL)
+    return user
+
+
+def invalidate_user(user_id) -> None:
+    """Drop a user's cached copy so the next request reloads it."""
+    cache = _user_cache()
+    if cache is not None:
+        cache.delete(_cache_key(user_id))
+
+
+def _user_changed(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+
+
+def _user_logged_out(sender, request, user, **kwargs):
+    if user is not None:
+        invalidate_user(user.pk)
@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Tags, Warning, register
+
+CACHED_SESSION_ENGINES = (
+    'django.contrib.sessions.backends.cache',
+    'django.contrib.sessions.backends.cached_db',
+)
+
+
+def _is_local(alias) -> bool:
+    return isinstance(caches[alias], LocMemCache)
+
+
+@register(Tags.caches)
+def check_shared_caches(app_configs, **kwargs):
+    """
+    Warn when sessions or users are cached in a per-process LocMemCache.
+
+    Logout and user changes only clear the cache of the worker that handled
+    them, so every other worker would keep serving the old session or user.
+    """
+    warnings = []
+    if settings.SESSION_ENGINE in CACHED_SESSION_ENGINES and _is_local(settings.SESSION_CACHE_ALIAS):
+        warnings.append(Warning(
+            "Sessions are cached in a per-process LocMemCache.",
+            hint="Use a shared cache backend (e.g. Redis) for SESSION_CACHE_ALIAS, "
+                 "or SESSION_ENGINE = 'django.contrib.sessions.backends.db'.",
+            id='users.W001',
+        ))
+    if settings.USER_CACHE and _is_local(settings.USER_CACHE):
+        warnings.append(Warning(
+            "Logged-in users are cached in a per-process LocMemCache.",
+            hint="Use a shared cache backend (e.g. Redis) for USER_CACHE, or set it to None.",
+            id='users.W002',
+        ))
+    return warnings
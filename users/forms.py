@@ -1,4 +1,8 @@
+import requests
 from django import forms
+
+from tickets.directory import find_user, search_users
+from tickets.resilience import JiraUnavailableError
 from users.models import Users
 
 class JIRAUsernameForm(forms.ModelForm):
@@ -9,13 +13,31 @@ class JIRAUsernameForm(forms.ModelForm):
         widgets= {
             'jira_username': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Enter your JIRA username'
+                'placeholder': 'Enter your JIRA username',
+                'autocomplete': 'off',
+                'list': 'jira-users',
             })
         }
 
     def clean_jira_username(self):
-        jira_username = self.cleaned_data.get('jira_username')
-        # Add custom validation here (e.g., checks for uniqueness, valid characters)
+        jira_username = (self.cleaned_data.get('jira_username') or '').strip()
+        if not jira_username:
+            raise forms.ValidationError("Enter your JIRA username.")
+
+        # Checked against the synced Jira user directory (tickets.directory)
+        try:
+            jira_user = find_user(jira_username)
+        except (JiraUnavailableError, requests.exceptions.RequestException):
+            raise forms.ValidationError("JIRA can't be reached to check this username. Please try again shortly.")
+        if jira_user is None or not jira_user.active:
+            suggestions = [user.name for user in search_users(jira_username[:2], limit=3)]
+            message = f'There is no active JIRA user named "{jira_username}".'
+            if suggestions:
+                message += f" Did you mean {', '.join(suggestions)}?"
+            raise forms.ValidationError(message)
+        # Store Jira's spelling so ticket lookups match exactly
+        jira_username = jira_user.name
+
         if Users.objects.filter(jira_username=jira_username).exclude(pk=self.instance.pk).exists():
             raise forms.ValidationError("This username is already taken.")
-        return jira_username
\ No newline at end of file
+        return jira_username
@@ -1,4 +1,43 @@
+import re
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import SESSION_KEY
+from django.contrib.auth.middleware import AuthenticationMiddleware
 from django.shortcuts import redirect
+from django.utils.functional import SimpleLazyObject
+
+from users.auth import get_cached_user
+
+# Session key holding the id of the user whose profile is known to be
+# complete, so later requests skip the user lookup entirely
+PROFILE_COMPLETE_SESSION_KEY = '_profile_complete'
+
+
+async def _aget_cached_user(request):
+    if not hasattr(request, '_acached_user'):
+        request._acached_user = await sync_to_async(get_cached_user)(request)
+    return request._acached_user
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """
+    AuthenticationMiddleware that resolves request.user through the user
+    cache (see users.auth) instead of querying the database every request.
+    """
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: self._get_user(request))
+        # Also covers social_core's Auth0 backend, which has no aget_user()
+        request.auser = partial(_aget_cached_user, request)
+
+    @staticmethod
+    def _get_user(request):
+        if not hasattr(request, '_cached_user'):
+            request._cached_user = get_cached_user(request)
+        return request._cached_user
+
 
 class CompleteProfileMiddleware:
     def __init__(self, get_response):
@@ -13,16 +52,29 @@ class CompleteProfileMiddleware:
             '/static/',
             '/media/',
         ]
+        # One anchored alternation instead of a startswith() per prefix
+        self.exempt = re.compile('|'.join(re.escape(url) for url in self.exempt_urls))
 
     def __call__(self, request):
-        # Only check authenticated users
-        if request.user.is_authenticated:
-            # Check if current URL is exempt
-            is_exempt = any(request.path.startswith(url) for url in self.exempt_urls)
+        if self._needs_profile(request):
+            return redirect('first_login_prompt')
+
+        return self.get_response(request)
 
-            if not is_exempt:
-                # Check if user needs to complete profile
-                if request.user.jira_username is None:  # Change to your field name
-                        return redirect('first_login_prompt')
+    def _needs_profile(self, request):
+        user_id = request.session.get(SESSION_KEY)
+        # Anonymous, or already checked for this user: no database access
+        if user_id is None or request.session.get(PROFILE_COMPLETE_SESSION_KEY) == user_id:
+            return False
+
+        if self.exempt.match(request.path):
+            return False
+
+        # Only check authenticated users
+        if not request.user.is_authenticated:
+            return False
+        if request.user.jira_username is None:  # Change to your field name
+            return True
 
-        return self.get_response(request)
\ No newline at end of file
+        request.session[PROFILE_COMPLETE_SESSION_KEY] = user_id
+        return False
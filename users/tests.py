@@ -1,3 +1,96 @@
-from django.test import TestCase
+from django.contrib.auth import SESSION_KEY
+from django.contrib.sessions.backends.cache import SessionStore
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
 
-# Create your tests here.
+from users.auth import get_cached_user
+from users.checks import check_shared_caches
+from users.middleware import PROFILE_COMPLETE_SESSION_KEY, CompleteProfileMiddleware
+from users.models import Users
+
+
+class CompleteProfileMiddlewareTests(TestCase):
+    def setUp(self):
+        self.middleware = CompleteProfileMiddleware(lambda request: HttpResponse("ok"))
+
+    def request(self, path, user=None):
+        request = RequestFactory().get(path)
+        request.session = SessionStore()
+        if user is not None:
+            request.session[SESSION_KEY] = str(user.pk)
+            request.user = user
+        return request
+
+    def test_incomplete_profiles_are_redirected(self):
+        user = Users.objects.create(username="zeke")
+
+        self.assertEqual(self.middleware(self.request("/dashboard/", user)).status_code, 302)
+        self.assertEqual(self.middleware(self.request("/auth/first-login-prompt/", user)).status_code, 200)
+        self.assertEqual(self.middleware(self.request("/static/app.js", user)).status_code, 200)
+
+    def test_complete_profiles_are_remembered_in_the_session(self):
+        user = Users.objects.create(username="zeke", jira_username="zeke")
+        request = self.request("/dashboard/", user)
+        self.middleware(request)
+        self.assertEqual(request.session[PROFILE_COMPLETE_SESSION_KEY], str(user.pk))
+
+        # Later requests in the session never touch request.user
+        later = self.request("/dashboard/")
+        later.session = request.session
+        self.assertEqual(self.middleware(later).status_code, 200)
+
+    def test_anonymous_requests_skip_the_user_lookup(self):
+        # No request.user at all: reading it would raise AttributeError
+        self.assertEqual(self.middleware(self.request("/dashboard/")).status_code, 200)
+
+
+# One test process shares its LocMemCache, so caching can be exercised here
+@override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cached_db", USER_CACHE="default")
+class CachedAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = Users.objects.create(username="zeke", jira_username="zeke", is_staff=True)
+        self.client.force_login(self.user)
+
+    def test_warm_requests_skip_the_database(self):
+        self.client.get("/metrics/")
+
+        # Session and user both come from the cache
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/metrics/").status_code, 200)
+
+    def test_saving_the_user_drops_the_cached_copy(self):
+        self.client.get("/metrics/")
+        self.user.jira_username = "zeke.h"
+        self.user.save()
+
+        request = RequestFactory().get("/")
+        request.session = self.client.session
+        with self.assertNumQueries(1):
+            self.assertEqual(get_cached_user(request).jira_username, "zeke.h")
+
+    def test_logout_ends_the_cached_session(self):
+        self.client.get("/metrics/")
+        self.client.get("/logout/")
+
+        self.assertEqual(self.client.get("/metrics/").status_code, 302)
+
+
+class SharedCacheTests(TestCase):
+    def test_local_caches_fall_back_to_the_database(self):
+        # The default CACHES is a per-process LocMemCache
+        self.assertEqual(settings.SESSION_ENGINE, "django.contrib.sessions.backends.db")
+        self.assertIsNone(settings.USER_CACHE)
+        self.assertEqual(check_shared_caches(None), [])
+
+        user = Users.objects.create(username="zeke", jira_username="zeke", is_staff=True)
+        self.client.force_login(user)
+        self.client.get("/metrics/")
+        with self.assertNumQueries(2):
+            self.assertEqual(self.client.get("/metrics/").status_code, 200)
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cached_db", USER_CACHE="default")
+    def test_caching_in_local_memory_is_warned_about(self):
+        self.assertEqual([w.id for w in check_shared_caches(None)], ["users.W001", "users.W002"])
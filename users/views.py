@@ -25,6 +25,8 @@ def first_login_prompt_view(request):
 
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from tickets.directory import search_users
 from .models import Users
 from .forms import JIRAUsernameForm
 
@@ -47,6 +49,15 @@ def first_login(request):
     # If jira username is set, show regular profile page
     return redirect('index')
 
+@login_required
+def jira_user_autocomplete(request):
+    # Prefix matches from the local Jira user directory for the profile form
+    users = search_users(request.GET.get('q', ''), limit=10)
+    return JsonResponse({
+        'results': [{'name': user.name, 'display_name': user.display_name} for user in users]
+    })
+
+
 def logout_view(request):
     logout(request)
 